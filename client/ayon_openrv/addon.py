@@ -11,6 +11,14 @@ class OpenRVAddon(AYONAddon, IHostAddon, IPluginPaths):
     host_name = "openrv"
     version = __version__
 
+    def initialize(self, settings):
+        # Reuse settings fetched with the addons, see `settings_cache`
+        addon_settings = settings.get(self.name)
+        if addon_settings:
+            from .settings_cache import get_settings_cache
+
+            get_settings_cache().prime(addon_settings)
+
     def get_plugin_paths(self):
         return {}
 
@@ -37,3 +37,34 @@ def group_member_of_type(group_node, member_type):
     for node in rv.commands.nodesInGroup(group_node):
         if rv.commands.nodeType(node) == member_type:
             return node
+
+
+_reload_batch_depth = 0
+_reload_requested = False
+
+
+def reload_sources():
+    """Reload the session's sources, or once a batch ends.
+
+    Inside `batched_reload` the reload is deferred to the end of the
+    outermost batch, so loading many sources rebuilds the graph once.
+    """
+    global _reload_requested
+    if _reload_batch_depth:
+        _reload_requested = True
+        return
+    rv.commands.reload()
+
+
+@contextlib.contextmanager
+def batched_reload():
+    """Defer `reload_sources` calls to the end of the context"""
+    global _reload_batch_depth, _reload_requested
+    _reload_batch_depth += 1
+    try:
+        yield
+    finally:
+        _reload_batch_depth -= 1
+        if not _reload_batch_depth and _reload_requested:
+            _reload_requested = False
+            rv.commands.reload()
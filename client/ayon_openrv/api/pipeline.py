@@ -1,21 +1,26 @@
 # -*- coding: utf-8 -*-
 import os
 import json
+import base64
+import zlib
 
 import pyblish
 import rv
 
 from ..constants import OPENRV_ROOT_DIR
+from ..loader_registry import register_loader_plugin_path
 
+from ayon_core.lib import Logger
 from ayon_core.host import HostBase, ILoadHost, IWorkfileHost, IPublishHost
 from ayon_core.pipeline import (
-    register_loader_plugin_path,
     register_inventory_action_path,
     register_creator_plugin_path,
     AYON_CONTAINER_ID,
     get_current_project_name,
 )
 
+log = Logger.get_logger(__name__)
+
 PLUGINS_DIR = os.path.join(OPENRV_ROOT_DIR, "plugins")
 PUBLISH_PATH = os.path.join(PLUGINS_DIR, "publish")
 LOAD_PATH = os.path.join(PLUGINS_DIR, "load")
@@ -23,7 +28,39 @@ CREATE_PATH = os.path.join(PLUGINS_DIR, "create")
 INVENTORY_PATH = os.path.join(PLUGINS_DIR, "inventory")
 
 AYON_ATTR_PREFIX = "ayon."
+LEGACY_ATTR_PREFIX = "openpype."
 JSON_PREFIX = "JSON:::"
+# Keys every container has imprinted, see `imprint_container`
+CONTAINER_KEYS = (
+    "id",
+    "schema",
+    "name",
+    "namespace",
+    "loader",
+    "representation",
+    "project_name",
+)
+
+# Packed storage of all keys of a prefix in a single string property,
+# see `imprint`. Its value is "<header><version>:<encoding>:<payload>".
+PACKED_KEY = "_packed"
+PACKED_HEADER = "AYON_PACKED"
+PACKED_VERSION = 1
+# Packed JSON longer than this is stored zlib compressed and base64 encoded
+PACKED_COMPRESS_THRESHOLD = 4096
+
+# Session marker set once legacy properties were migrated to `ayon.`
+SESSION_SCHEMA_PROP = "root.ayon_session.schema_version"
+SESSION_SCHEMA_VERSION = 1
+
+# Type names of `rv.commands.propertyInfo` type numbers
+PROPERTY_TYPE_NAMES = {
+    1: "Float",
+    2: "Int",
+    5: "Half",
+    6: "Byte",
+    8: "String",
+}
 
 
 class OpenRVHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
@@ -76,29 +113,128 @@ class OpenRVHost(HostBase, IWorkfileHost, ILoadHost, IPublishHost):
 
     def get_context_data(self):
         context_data = read("root", prefix=AYON_ATTR_PREFIX)
-        if not context_data:
+        if not context_data and not is_session_migrated():
             # backward compatibility
-            context_data = read("root", prefix="openpype.")
+            context_data = read("root", prefix=LEGACY_ATTR_PREFIX)
 
         return context_data
 
 
-def imprint(node, data, prefix=None):
+def use_packed_properties():
+    """Return whether `imprint` stores data packed by default.
+
+    Enabled with `AYON_RV_PACKED_PROPERTIES=1`.
+    """
+    return os.environ.get("AYON_RV_PACKED_PROPERTIES") == "1"
+
+
+def encode_packed(data):
+    """Encode data for the packed property.
+
+    Args:
+        data (dict): JSON serializable key value pairs.
+
+    Returns:
+        str: Versioned packed value.
+
+    """
+    payload = json.dumps(data, separators=(",", ":"), sort_keys=True)
+    encoding = "json"
+    if len(payload) > PACKED_COMPRESS_THRESHOLD:
+        encoding = "zlib"
+        payload = base64.b64encode(
+            zlib.compress(payload.encode("utf-8"))
+        ).decode("ascii")
+    return f"{PACKED_HEADER}{PACKED_VERSION}:{encoding}:{payload}"
+
+
+def decode_packed(value):
+    """Decode the value of a packed property.
+
+    Args:
+        value (str): Value written by `encode_packed`.
+
+    Returns:
+        dict: The key value pairs, empty if the value is not readable.
+
+    """
+    if not value or not value.startswith(PACKED_HEADER):
+        return {}
+    try:
+        version, encoding, payload = (
+            value[len(PACKED_HEADER):].split(":", 2)
+        )
+        if int(version) > PACKED_VERSION:
+            log.warning(f"Unsupported packed property version: {version}")
+            return {}
+        if encoding == "zlib":
+            payload = zlib.decompress(base64.b64decode(payload)).decode(
+                "utf-8"
+            )
+        elif encoding != "json":
+            raise ValueError(f"Unknown encoding: {encoding}")
+        data = json.loads(payload)
+    except (ValueError, zlib.error) as err:
+        log.warning(f"Invalid packed property: {err}")
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _imprint_packed(node, data, prefix):
+    prop = f"{node}.{prefix}{PACKED_KEY}"
+    current = None
+    if rv.commands.propertyExists(prop):
+        current = rv.commands.getStringProperty(prop)
+        current = current[0] if current else ""
+
+    packed = decode_packed(current)
+    packed.update(
+        (attr, list(value) if isinstance(value, tuple) else value)
+        for attr, value in data.items()
+    )
+    value = encode_packed(packed)
+    if value == current:
+        return
+
+    if current is None:
+        rv.commands.newProperty(prop, rv.commands.StringType, 1)
+    rv.commands.setStringProperty(prop, [value], True)
+
+
+def imprint(node, data, prefix=None, packed=None):
     """Store attributes with value on a node.
 
+    Packed storage keeps all keys of the prefix as JSON in a single
+    string property, written only if its content changed. `read` reads
+    both layouts.
+
     Args:
         node (object): The node to imprint data on.
         data (dict): Key value pairs of attributes to create.
         prefix (str): A prefix to add to all keys in the data.
+        packed (bool, optional): Store the data packed, requires
+            `prefix`. Defaults to `use_packed_properties`.
 
     Returns:
         None
 
     """
+    if packed is None:
+        packed = use_packed_properties()
+    if packed and prefix:
+        for attr, value in data.items():
+            if not isinstance(
+                value, (dict, list, tuple, bool, int, float, str)
+            ):
+                raise TypeError("Unsupport data type to imprint: "
+                                "{} (type: {})".format(value, type(value)))
+        _imprint_packed(node, data, prefix)
+        return
+
     node_prefix = f"{node}.{prefix}" if prefix else f"{node}."
     for attr, value in data.items():
         # Create and set the attribute
-        prop = f"{node_prefix}.{attr}"
+        prop = f"{node_prefix}{attr}"
 
         if isinstance(value, (dict, list, tuple)):
             value = f"{JSON_PREFIX}{json.dumps(value)}"
@@ -116,10 +252,52 @@ def imprint(node, data, prefix=None):
         if not rv.commands.propertyExists(prop):
             type_ = getattr(rv.commands, f"{type_name}Type")
             rv.commands.newProperty(prop, type_, 1)
+            _property_types[prop] = type_
         set_property = getattr(rv.commands, f"set{type_name}Property")
         set_property(prop, [value], True)
 
 
+# Type numbers of properties by property name, see `read`
+_property_types = {}
+
+
+def invalidate_property_types(name=None):
+    """Forget cached property types.
+
+    Args:
+        name (str, optional): Property to forget, or node to forget all
+            properties of. All are forgotten if not set.
+
+    """
+    if name is None:
+        _property_types.clear()
+    elif name.count(".") >= 2:
+        _property_types.pop(name, None)
+    else:
+        node_prefix = f"{name.split('.', 1)[0]}."
+        for prop in list(_property_types):
+            if prop.startswith(node_prefix):
+                del _property_types[prop]
+
+
+def _get_property(prop, type_getters):
+    """Return type number and values of a property.
+
+    The type is introspected once and cached, it is looked up again if
+    the property was recreated with another type meanwhile.
+    """
+    type_num = _property_types.get(prop)
+    if type_num is not None:
+        try:
+            return type_num, type_getters[type_num](prop)
+        except Exception:
+            pass
+
+    type_num = rv.commands.propertyInfo(prop)["type"]
+    _property_types[prop] = type_num
+    return type_num, type_getters[type_num](prop)
+
+
 def read(node, prefix=None):
     """Read properties from the given node with the values
 
@@ -148,13 +326,18 @@ def read(node, prefix=None):
     }
 
     data = {}
+    packed_prop = f"{node_prefix}{PACKED_KEY}"
+    packed = None
     for prop in properties:
         if prefix is not None and not prop.startswith(node_prefix):
             continue
 
-        info = rv.commands.propertyInfo(prop)
-        type_num = info["type"]
-        value = type_getters[type_num](prop)
+        if prefix and prop == packed_prop:
+            packed = rv.commands.getStringProperty(prop)
+            continue
+
+        key = prop[len(node_prefix):]
+        type_num, value = _get_property(prop, type_getters)
         if value:
             value = value[0]
         else:
@@ -164,9 +347,12 @@ def read(node, prefix=None):
             # String
             value = json.loads(value.strip()[len(JSON_PREFIX):])
 
-        key = prop[len(node_prefix):]
         data[key] = value
 
+    if packed:
+        # Packed data is written after per-key data, it is more recent
+        data.update(decode_packed(packed[0]))
+
     return data
 
 
@@ -196,37 +382,51 @@ def imprint_container(node, name, namespace, context, loader):
     }
 
     imprint(node, data, prefix=AYON_ATTR_PREFIX)
+    _container_index.invalidate(node)
 
 
 def parse_container(node):
     """Returns imprinted container data of a tool
 
-    This reads the imprinted data from `imprint_container`.
+    This reads the imprinted data from `imprint_container` with a single
+    listing of the node's properties, per key or packed. Nothing is
+    written to the node, containers imprinted without project name get
+    the current one.
+
+    Returns:
+        dict: Container data, None if the node is not a container.
 
     """
-    # If not all required data return None
-    required = ['id', 'schema', 'name',
-                'namespace', 'loader', 'representation',
-                'project_name']
+    properties = set(rv.commands.properties(node))
+    ayon_prefix = f"{node}.{AYON_ATTR_PREFIX}"
+    # backward compatibility
+    legacy_prefix = None
+    if not is_session_migrated():
+        legacy_prefix = f"{node}.{LEGACY_ATTR_PREFIX}"
+    get_string_property = rv.commands.getStringProperty
+
+    packed = {}
+    packed_prop = ayon_prefix + PACKED_KEY
+    if packed_prop in properties:
+        value = get_string_property(packed_prop)
+        if value:
+            packed = decode_packed(value[0])
 
     data = {}
-    for key in required:
-        prop = f"{node}.{AYON_ATTR_PREFIX}{key}"
-        if not rv.commands.propertyExists(prop):
-            # backward compatibility
-            prop = f"{node}.openpype.{key}"
-            if not rv.commands.propertyExists(prop):
-                if key != "project_name":
-                    return
-                else:
-                    imprint(
-                        node,
-                        {"project_name": get_current_project_name()},
-                        prefix=AYON_ATTR_PREFIX
-                    )
-
-        value = rv.commands.getStringProperty(prop)[0]
-        data[key] = value
+    for key in CONTAINER_KEYS:
+        if key in packed:
+            data[key] = packed[key]
+            continue
+        prop = ayon_prefix + key
+        if prop not in properties and legacy_prefix is not None:
+            prop = legacy_prefix + key
+        if prop not in properties:
+            if key != "project_name":
+                return None
+            data[key] = get_current_project_name()
+            continue
+
+        data[key] = get_string_property(prop)[0]
 
     # Store the node's name
     data["objectName"] = str(node)
@@ -237,25 +437,241 @@ def parse_container(node):
     return data
 
 
-def get_container_nodes():
-    """Return a list of node names that are marked as loaded container."""
+def _scan_container_nodes():
+    """Return names of all nodes marked as loaded container.
+
+    Walks every node of the session, use `get_container_nodes` instead.
+    """
+    # backward compatibility
+    check_legacy = not is_session_migrated()
     container_nodes = []
     for node in rv.commands.nodes():
         prop = f"{node}.{AYON_ATTR_PREFIX}schema"
+        packed_prop = f"{node}.{AYON_ATTR_PREFIX}{PACKED_KEY}"
         if rv.commands.propertyExists(prop):
             container_nodes.append(node)
-        else:
-            # backward compatibility
-            prop = f"{node}.openpype.schema"
+        elif rv.commands.propertyExists(packed_prop):
+            # Not all packed nodes are containers, parsing tells
+            container_nodes.append(node)
+        elif check_legacy:
+            prop = f"{node}.{LEGACY_ATTR_PREFIX}schema"
             if rv.commands.propertyExists(prop):
                 container_nodes.append(node)
 
     return container_nodes
 
 
+class ContainerIndex:
+    """Containers of the session by node and by representation id.
+
+    Built from all nodes of the session on first use and then kept
+    current: `imprint_container` adds new containers, nodes whose
+    container properties changed are marked with `invalidate` and
+    parsed again on next access, deleted nodes are dropped on access.
+    Reading containers then only costs the number of containers instead
+    of the number of nodes in the session.
+    """
+
+    def __init__(self):
+        # Container data by node, None until built
+        self._containers = None
+        # Container nodes by representation id
+        self._nodes_by_representation = {}
+        # Nodes to parse again on next access
+        self._dirty = set()
+
+    def invalidate(self, node=None):
+        """Mark a node to be parsed again, or drop the whole index.
+
+        Args:
+            node (str, optional): Node whose container data changed. The
+                index is rebuilt from scratch on next access if not set.
+        """
+        if node is None:
+            self._containers = None
+            self._nodes_by_representation = {}
+            self._dirty.clear()
+        elif self._containers is not None:
+            self._dirty.add(node)
+
+    def get_nodes(self):
+        """Return names of the container nodes."""
+        self._update()
+        return list(self._containers)
+
+    def get_containers(self):
+        """Return data of all containers.
+
+        Returns:
+            list[dict]: Copies of the container data, changing them
+                does not affect the index.
+        """
+        self._update()
+        return [dict(container) for container in self._containers.values()]
+
+    def get_containers_by_representation(self, representation_id):
+        """Return data of containers loaded from a representation.
+
+        Args:
+            representation_id (str): Id of the representation.
+
+        Returns:
+            list[dict]: Copies of the container data.
+        """
+        self._update()
+        return [
+            dict(self._containers[node])
+            for node in self._nodes_by_representation.get(
+                representation_id, ()
+            )
+        ]
+
+    def _update(self):
+        if self._containers is None:
+            self._containers = {}
+            self._nodes_by_representation = {}
+            self._dirty.clear()
+            for node in _scan_container_nodes():
+                self._add(node)
+            return
+
+        # Drop nodes deleted from the session meanwhile
+        for node in list(self._containers):
+            if not rv.commands.nodeExists(node):
+                self._discard(node)
+
+        while self._dirty:
+            node = self._dirty.pop()
+            self._discard(node)
+            if rv.commands.nodeExists(node):
+                self._add(node)
+
+    def _add(self, node):
+        container = parse_container(node)
+        if not container:
+            return
+        self._containers[node] = container
+        self._nodes_by_representation.setdefault(
+            container["representation"], set()
+        ).add(node)
+
+    def _discard(self, node):
+        container = self._containers.pop(node, None)
+        if container is None:
+            return
+        nodes = self._nodes_by_representation.get(container["representation"])
+        if nodes is not None:
+            nodes.discard(node)
+            if not nodes:
+                del self._nodes_by_representation[container["representation"]]
+
+
+_container_index = ContainerIndex()
+
+
+def get_container_index():
+    """Return the container index of the session."""
+    return _container_index
+
+
+def get_container_nodes():
+    """Return a list of node names that are marked as loaded container."""
+    return _container_index.get_nodes()
+
+
 def get_containers():
     """Yield container data for each container found in current workfile."""
-    for node in get_container_nodes():
-        container = parse_container(node)
-        if container:
-            yield container
+    for container in _container_index.get_containers():
+        yield container
+
+
+_session_schema_version = None
+
+
+def is_session_migrated():
+    """Return whether legacy properties of the session were migrated.
+
+    Lookups of legacy `openpype.` properties are skipped once it is,
+    see `migrate_legacy_properties`.
+    """
+    global _session_schema_version
+    if _session_schema_version is None:
+        _session_schema_version = 0
+        if rv.commands.propertyExists(SESSION_SCHEMA_PROP):
+            values = rv.commands.getIntProperty(SESSION_SCHEMA_PROP)
+            if values:
+                _session_schema_version = values[0]
+    return _session_schema_version >= SESSION_SCHEMA_VERSION
+
+
+def reset_session_schema_version():
+    """Read the migration marker of the session again on next use."""
+    global _session_schema_version
+    _session_schema_version = None
+
+
+def migrate_legacy_properties(force=False):
+    """Rewrite legacy `openpype.` properties of the session to `ayon.`
+
+    Copies the `openpype.` properties of containers and of the session's
+    context data in one pass over the session's nodes, removes them and
+    marks the session as migrated. Properties already present with the
+    `ayon.` prefix are kept.
+
+    Args:
+        force (bool): Migrate even if the session is marked migrated,
+            e.g. after reading a session file which may bring legacy
+            nodes along.
+
+    Returns:
+        int: Number of migrated properties.
+
+    """
+    global _session_schema_version
+    if not force and is_session_migrated():
+        return 0
+
+    migrated = 0
+    for node in rv.commands.nodes():
+        legacy_prefix = f"{node}.{LEGACY_ATTR_PREFIX}"
+        properties = rv.commands.properties(node)
+        legacy_properties = [
+            prop for prop in properties if prop.startswith(legacy_prefix)
+        ]
+        if not legacy_properties:
+            continue
+
+        existing = set(properties)
+        for prop in legacy_properties:
+            key = prop[len(legacy_prefix):]
+            new_prop = f"{node}.{AYON_ATTR_PREFIX}{key}"
+            if new_prop not in existing:
+                type_name = PROPERTY_TYPE_NAMES.get(
+                    rv.commands.propertyInfo(prop)["type"]
+                )
+                if type_name is None:
+                    log.warning(f"Unable to migrate property: {prop}")
+                    continue
+                values = getattr(rv.commands, f"get{type_name}Property")(
+                    prop
+                )
+                type_ = getattr(rv.commands, f"{type_name}Type")
+                rv.commands.newProperty(new_prop, type_, 1)
+                _property_types[new_prop] = type_
+                getattr(rv.commands, f"set{type_name}Property")(
+                    new_prop, values, True
+                )
+            rv.commands.deleteProperty(prop)
+            _property_types.pop(prop, None)
+            migrated += 1
+
+    if not rv.commands.propertyExists(SESSION_SCHEMA_PROP):
+        rv.commands.newProperty(SESSION_SCHEMA_PROP, rv.commands.IntType, 1)
+    rv.commands.setIntProperty(
+        SESSION_SCHEMA_PROP, [SESSION_SCHEMA_VERSION], True
+    )
+    _session_schema_version = SESSION_SCHEMA_VERSION
+    if migrated:
+        log.info(f"Migrated {migrated} legacy properties to ayon.")
+        _container_index.invalidate()
+    return migrated
@@ -0,0 +1,582 @@
+"""Asyncio client for RV's network protocol.
+
+Speaks the same wire protocol as `ayon_openrv.networking.RVConnector`
+but without blocking, so a single thread can drive many RV sessions.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import concurrent.futures
+import threading
+from time import monotonic, perf_counter
+from typing import TYPE_CHECKING
+
+from ayon_core.lib import Logger
+
+from ayon_openrv.metrics import ConnectorMetrics, emit_metrics
+from ayon_openrv.networking import RVConnector, get_close_timeout
+from ayon_openrv.protocol import FrameReader, encode_frame
+from ayon_openrv.transport import Transport, get_transports
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine, Iterable
+    from concurrent.futures import Future
+    from typing import Any
+
+log = Logger.get_logger(__name__)
+
+# Timeout for a single connection attempt in seconds
+CONNECT_ATTEMPT_TIMEOUT = 5.0
+
+
+class AsyncRVConnector:
+    """Asyncio connection to RV's network control interface.
+
+    A background task reads incoming frames, answers PINGs and resolves
+    pending RETURNEVENTs, so several `send_event` calls may be awaited
+    concurrently on one connection. RV answers RETURNEVENTs in the
+    order they were sent.
+
+    Attributes:
+        host: The hostname to connect to.
+        name: The connection name for identification.
+        port: The port to connect to.
+        metrics: Runtime metrics of this connection.
+        on_message: Optional callback receiving MESSAGE data sent by RV.
+        transport: Transport used for connecting, None picks one on
+            each connection attempt, see `get_transports`.
+        active_transport: Transport of the current connection.
+    """
+
+    def __init__(
+        self,
+        host: str | None = None,
+        name: str | None = None,
+        port: int | None = None,
+        on_message: Callable[[str], None] | None = None,
+        transport: Transport | None = None,
+    ) -> None:
+        """Initialize the connector, it does not connect yet.
+
+        Args:
+            host: Hostname to connect to. Defaults to "localhost".
+            name: Connection name. Defaults to value from addon settings.
+            port: Port number. Defaults to value from addon settings.
+            on_message: Callback receiving MESSAGE data sent by RV.
+            transport: Transport to connect with. By default the
+                Unix domain socket relay of a local RV session is used
+                if available, TCP otherwise.
+        """
+        self.host = host or "localhost"
+        self.name = name
+        self.port = port
+        self.on_message = on_message
+        self.transport = transport
+        self.active_transport: Transport | None = None
+        self.metrics = ConnectorMetrics()
+
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._read_task: asyncio.Task | None = None
+        self._pending_returns: collections.deque[asyncio.Future] = (
+            collections.deque()
+        )
+        self._pending_pongs: collections.deque[asyncio.Future] = (
+            collections.deque()
+        )
+        self._attempts = 0
+
+    @property
+    def is_connected(self) -> bool:
+        return self._writer is not None and not self._writer.is_closing()
+
+    async def __aenter__(self) -> AsyncRVConnector:
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def connect(self, timeout: float | None = None) -> None:
+        """Connect to RV, retrying with exponential backoff.
+
+        Args:
+            timeout: Seconds to keep retrying. Defaults to the timeout
+                from addon settings.
+
+        Raises:
+            ConnectionError: If connection times out.
+        """
+        if self.is_connected:
+            return
+
+        if self.name is None or self.port is None or timeout is None:
+            settings = await asyncio.to_thread(RVConnector.get_settings)
+            self.name = self.name or settings["network"]["conn_name"]
+            self.port = self.port or settings["network"]["conn_port"]
+            if timeout is None:
+                timeout = float(settings["network"]["timeout"])
+
+        start = monotonic()
+        self._attempts = 0
+        while True:
+            if self._attempts:
+                self.metrics.connect_retries += 1
+            self._attempts += 1
+            try:
+                await self._open()
+                break
+            except (OSError, asyncio.TimeoutError) as err:
+                log.debug(f"Connection failed: {err}")
+
+            elapsed = monotonic() - start
+            # Exponential backoff: 0.1s, 0.2s, 0.4s, ... max 2s
+            delay = min(0.1 * (2**self._attempts), 2.0)
+            if elapsed + delay > timeout:
+                self.metrics.connect_timeouts += 1
+                raise ConnectionError(
+                    f"Timeout after {elapsed:.1f}s connecting to RV. "
+                    f"host={self.host}, port={self.port}, name={self.name}"
+                )
+            log.debug(f"Retry attempt {self._attempts}, waiting {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+        self.metrics.connect_wait.observe(monotonic() - start)
+        log.info(
+            f"Connected with: host={self.host}, "
+            f"port={self.port}, name={self.name} "
+            f"in {monotonic() - start:.1f}sec. "
+            f"after {self._attempts} attempts. "
+            f"transport={self.active_transport}"
+        )
+
+    async def send_message(self, message: str) -> None:
+        """Send a message to RV.
+
+        Args:
+            message: The message string to send.
+
+        Raises:
+            ConnectionError: If not connected or the send failed.
+        """
+        log.debug(f"send_message: {message}")
+        await self._send(encode_frame("MESSAGE", message), "MESSAGE")
+
+    async def send_event(
+        self,
+        event_name: str,
+        event_contents: str,
+        shall_return: bool = True,
+        timeout: float | None = None,
+    ) -> str:
+        """Send a remote event and optionally wait for return value.
+
+        Cancelling the awaiting task is safe, the RETURN is then
+        discarded once RV sends it.
+
+        Args:
+            event_name: Event name from RV Reference Manual.
+            event_contents: Event payload data.
+            shall_return: Whether to wait for a return value.
+            timeout: Maximum time in seconds to wait for the return.
+
+        Returns:
+            The return value string, or empty string if not waiting.
+
+        Raises:
+            ConnectionError: If the connection is lost.
+            asyncio.TimeoutError: If the return did not arrive in time.
+        """
+        message = f"RETURNEVENT {event_name} * {event_contents}"
+        future = asyncio.get_running_loop().create_future()
+        # Register before sending so a fast RETURN always finds it
+        self._pending_returns.append(future)
+        start = perf_counter()
+        try:
+            await self.send_message(message)
+        except BaseException:
+            if future in self._pending_returns:
+                self._pending_returns.remove(future)
+            raise
+
+        if not shall_return:
+            # The RETURN still arrives, the cancelled future swallows it
+            future.cancel()
+            return ""
+
+        result = await asyncio.wait_for(future, timeout)
+        self.metrics.round_trip.observe(perf_counter() - start)
+        return result
+
+    async def ping(self, timeout: float = 1.0) -> bool:
+        """Check the connection is alive with a PING/PONG exchange.
+
+        Args:
+            timeout: Maximum time in seconds to wait for the PONG.
+
+        Returns:
+            True if RV answered in time, False otherwise.
+        """
+        if not self.is_connected:
+            return False
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending_pongs.append(future)
+        try:
+            await self._send(b"PING 1 p", "PING")
+            await asyncio.wait_for(future, timeout)
+        except (ConnectionError, asyncio.TimeoutError):
+            return False
+        return True
+
+    async def close(self) -> None:
+        """Send DISCONNECT and close the connection.
+
+        Waits until RV closes its side of the connection, at most
+        `AYON_RV_SOCKET_CLOSE_TIMEOUT` milliseconds.
+        """
+        if self._writer is None:
+            return
+
+        writer = self._writer
+        if not writer.is_closing():
+            timeout = get_close_timeout()
+            start = perf_counter()
+            try:
+                frame = encode_frame("MESSAGE", "DISCONNECT")
+                writer.write(frame)
+                self.metrics.observe_sent("MESSAGE", len(frame))
+                if writer.can_write_eof():
+                    writer.write_eof()
+                await writer.drain()
+                # Read loop finishes once RV closed the connection
+                if self._read_task is not None:
+                    await asyncio.wait({self._read_task}, timeout=timeout)
+            except OSError:
+                pass  # Best effort disconnect message
+            self.metrics.observe_close(perf_counter() - start, timeout)
+            emit_metrics(
+                self.metrics, host=self.host, port=self.port, name=self.name
+            )
+        self._teardown()
+        try:
+            await asyncio.wait_for(writer.wait_closed(), 1.0)
+        except (OSError, asyncio.TimeoutError):
+            pass
+
+    async def _open(self) -> None:
+        self._teardown()
+        start = perf_counter()
+        try:
+            reader, writer = await self._open_stream()
+        except (OSError, asyncio.TimeoutError):
+            self.metrics.observe_connect_failure()
+            raise
+
+        greeting = encode_frame("NEWGREETING", f"{self.name} rvController")
+        pingpong_control = b"PINGPONGCONTROL 1 0"
+        writer.write(greeting + pingpong_control)
+        try:
+            await writer.drain()
+        except OSError:
+            self.metrics.observe_connect_failure()
+            writer.close()
+            raise
+        self.metrics.observe_connect(perf_counter() - start)
+        self.metrics.observe_sent("NEWGREETING", len(greeting))
+        self.metrics.observe_sent("PINGPONGCONTROL", len(pingpong_control))
+
+        self._reader = reader
+        self._writer = writer
+        self._read_task = asyncio.create_task(self._read_loop(reader))
+
+    async def _open_stream(
+        self,
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """Connect with the first transport which succeeds.
+
+        Raises:
+            OSError: If none of the transports could connect.
+            asyncio.TimeoutError: If the last transport timed out.
+        """
+        transports = (
+            [self.transport]
+            if self.transport is not None
+            else get_transports(self.host, self.port)
+        )
+        error: BaseException | None = None
+        for transport in transports:
+            try:
+                streams = await asyncio.wait_for(
+                    transport.open_connection(), CONNECT_ATTEMPT_TIMEOUT
+                )
+            except (OSError, asyncio.TimeoutError) as err:
+                log.debug(f"Connection with {transport} failed: {err}")
+                error = err
+                continue
+            self.active_transport = transport
+            return streams
+        raise error or ConnectionError("No transport to connect with")
+
+    async def _send(self, data: bytes, msg_type: str) -> None:
+        if not self.is_connected:
+            raise ConnectionError("Not connected to RV")
+        self._writer.write(data)
+        self.metrics.observe_sent(msg_type, len(data))
+        try:
+            await self._writer.drain()
+        except OSError as err:
+            self._teardown()
+            raise ConnectionError(f"Sending to RV failed: {err}") from err
+
+    async def _read_loop(self, reader: asyncio.StreamReader) -> None:
+        frames = FrameReader()
+        try:
+            while True:
+                data = await reader.read(65536)
+                if not data:
+                    log.debug("Connection closed by RV")
+                    break
+                self.metrics.bytes_received += len(data)
+                frames.feed(data)
+                frame = frames.next_frame()
+                while frame is not None:
+                    if not self._dispatch(*frame):
+                        return
+                    frame = frames.next_frame()
+        except (OSError, ValueError) as err:
+            log.error(f"Error receiving message: {err}", exc_info=True)
+        finally:
+            if self._reader is reader:
+                self._read_task = None
+                self._teardown()
+
+    def _dispatch(self, msg_type: str, msg_data: str) -> bool:
+        """Handle a single received frame.
+
+        Returns:
+            False if RV asked to disconnect.
+        """
+        log.debug(f"Received message: {msg_type}: {msg_data}")
+        self.metrics.messages_received[msg_type] += 1
+        if msg_type == "MESSAGE":
+            if msg_data == "DISCONNECT":
+                self._teardown()
+                return False
+            if self.on_message is not None:
+                self.on_message(msg_data)
+
+        elif msg_type == "PING":
+            pong = b"PONG 1 p"
+            self._writer.write(pong)
+            self.metrics.observe_sent("PONG", len(pong))
+            self.metrics.pings_answered += 1
+
+        elif msg_type == "PONG":
+            if self._pending_pongs:
+                future = self._pending_pongs.popleft()
+                if not future.done():
+                    future.set_result(msg_data)
+
+        elif msg_type == "RETURN":
+            if not self._pending_returns:
+                log.warning(f"Unexpected RETURN from RV: {msg_data}")
+                return True
+            future = self._pending_returns.popleft()
+            if not future.done():
+                future.set_result(msg_data)
+        return True
+
+    def _teardown(self) -> None:
+        """Drop the connection and fail all pending RETURNEVENTs."""
+        if self._read_task is not None:
+            if self._read_task is not asyncio.current_task():
+                self._read_task.cancel()
+            self._read_task = None
+        if self._writer is not None:
+            self._writer.close()
+        self._reader = None
+        self._writer = None
+
+        for pending in (self._pending_returns, self._pending_pongs):
+            while pending:
+                future = pending.popleft()
+                if not future.done():
+                    future.set_exception(
+                        ConnectionError("Connection to RV lost")
+                    )
+
+
+class _EventLoopThread:
+    """Asyncio event loop running in a daemon thread.
+
+    Lets blocking code run coroutines of `AsyncRVConnector`.
+    """
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self.loop.run_forever,
+            name="ayon-openrv-asyncio",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def run(
+        self,
+        coro: Coroutine[Any, Any, Any],
+        timeout: float | None = None,
+    ) -> Any:
+        """Run a coroutine on the loop and wait for its result."""
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        return future.result(timeout)
+
+
+_loop_thread: _EventLoopThread | None = None
+_loop_thread_lock = threading.Lock()
+
+
+def get_event_loop_thread() -> _EventLoopThread:
+    """Return the shared event loop thread, starting it if needed."""
+    global _loop_thread
+    with _loop_thread_lock:
+        if _loop_thread is None:
+            _loop_thread = _EventLoopThread()
+        return _loop_thread
+
+
+class AsyncBackedRVConnector(RVConnector):
+    """Blocking `RVConnector` driven by an `AsyncRVConnector`.
+
+    The connection lives on the shared event loop thread, which keeps
+    answering PINGs and reading RETURNs while the caller is busy. The
+    public interface and semantics match `RVConnector`.
+    """
+
+    def __init__(
+        self,
+        host: str | None = None,
+        name: str | None = None,
+        port: int | None = None,
+        transport: Transport | None = None,
+    ) -> None:
+        settings = self.get_settings()
+        self._async = AsyncRVConnector(
+            host=host,
+            name=name or settings["network"]["conn_name"],
+            port=port or settings["network"]["conn_port"],
+            on_message=self.process_message,
+            transport=transport,
+        )
+        self._loop_thread = get_event_loop_thread()
+        super().__init__(
+            host=host, name=name, port=port, transport=transport
+        )
+        self.metrics = self._async.metrics
+
+    @property
+    def is_connected(self) -> bool:
+        return self._async.is_connected
+
+    @is_connected.setter
+    def is_connected(self, value: bool) -> None:
+        # Connection state is owned by the asyncio connector
+        pass
+
+    @property
+    def message_available(self) -> bool:
+        # Incoming messages are dispatched by the event loop thread
+        return False
+
+    def send_message(self, message: str) -> None:
+        log.debug(f"send_message: {message}")
+        try:
+            self._loop_thread.run(self._async.send_message(message))
+        except ConnectionError:
+            self.close()
+
+    def queue_message(
+        self, message: str, timeout: float | None = None
+    ) -> Future:
+        log.debug(f"send_message: {message}")
+        return asyncio.run_coroutine_threadsafe(
+            self._async.send_message(message), self._loop_thread.loop
+        )
+
+    def start_writer(self, *args, **kwargs) -> None:
+        # The asyncio connector writes without blocking the caller already
+        pass
+
+    def send_event(
+        self,
+        event_name: str,
+        event_contents: str,
+        shall_return: bool = True,
+    ) -> str:
+        try:
+            return self._loop_thread.run(
+                self._async.send_event(
+                    event_name, event_contents, shall_return=shall_return
+                )
+            )
+        except ConnectionError:
+            self.close()
+            return ""
+
+    def submit_events(
+        self, events: Iterable[tuple[str, str]]
+    ) -> list[Future]:
+        # RETURNs are matched in order by the asyncio connector already
+        return [
+            asyncio.run_coroutine_threadsafe(
+                self._async.send_event(event_name, event_contents),
+                self._loop_thread.loop,
+            )
+            for event_name, event_contents in events
+        ]
+
+    def wait_for_events(
+        self,
+        futures: Iterable[Future],
+        timeout: float | None = None,
+    ) -> list[str]:
+        futures = list(futures)
+        concurrent.futures.wait(futures, timeout)
+        return [future.result(timeout=0) for future in futures]
+
+    def ping(self, timeout: float = 1.0) -> bool:
+        return self._loop_thread.run(self._async.ping(timeout))
+
+    def start_io_thread(
+        self,
+        keepalive_interval: float = 0.0,
+        ping_timeout: float = 1.0,
+    ) -> None:
+        # The event loop thread services the connection already
+        pass
+
+    def _close(self) -> None:
+        self._loop_thread.run(self._async.close())
+
+    def _process_events(
+        self,
+        process_return_only: bool = False,
+        timeout: float | None = None,
+    ) -> str:
+        # Incoming events are processed by the event loop thread
+        return ""
+
+    def _connect_socket(self) -> None:
+        try:
+            self._loop_thread.run(self._async._open())
+        except (OSError, asyncio.TimeoutError) as err:
+            log.debug(f"Connection failed: {err}")
+        else:
+            self.active_transport = self._async.active_transport
+            log.info(
+                f"Connected with: host={self.host}, "
+                f"port={self.port}, name={self.name} "
+                f"in {self._elapsed:.1f}sec. after {self._attempts} attempts."
+            )
@@ -0,0 +1,204 @@
+"""Send an event to several RV sessions at once.
+
+Every endpoint gets its own `AsyncRVConnector` on the shared event loop
+thread, so connecting and waiting for RETURNs overlap and the total time
+is that of the slowest session instead of the sum of all. Each endpoint
+has its own deadline, a session which is slow or unreachable only fails
+its own result.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from ayon_core.lib import Logger
+
+from ayon_openrv.async_networking import (
+    AsyncRVConnector,
+    get_event_loop_thread,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+log = Logger.get_logger(__name__)
+
+# Seconds each endpoint has to connect and answer by default
+DEFAULT_BROADCAST_TIMEOUT = 10.0
+
+
+class BroadcastResult:
+    """Outcome of a broadcast for a single endpoint.
+
+    Attributes:
+        host: Hostname of the RV session.
+        port: Port of the RV session.
+        result: Return value of the event, empty if not waited for.
+        error: Exception if sending failed or timed out, None otherwise.
+        elapsed: Seconds from starting to connect until done.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        result: str | None = None,
+        error: BaseException | None = None,
+        elapsed: float = 0.0,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.result = result
+        self.error = error
+        self.elapsed = elapsed
+
+    def __repr__(self) -> str:
+        state = "ok" if self.ok else f"error={self.error!r}"
+        return (
+            f"BroadcastResult({self.host}:{self.port}, {state}, "
+            f"elapsed={self.elapsed:.3f}s)"
+        )
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+async def _send_to(
+    host: str,
+    port: int,
+    name: str | None,
+    event_name: str,
+    event_contents: str,
+    shall_return: bool,
+    timeout: float,
+) -> str:
+    connector = AsyncRVConnector(host=host, name=name, port=port)
+    try:
+        await connector.connect(timeout)
+        return await connector.send_event(
+            event_name, event_contents, shall_return=shall_return
+        )
+    finally:
+        await connector.close()
+
+
+async def _broadcast_to(
+    host: str,
+    port: int,
+    name: str | None,
+    event_name: str,
+    event_contents: str,
+    shall_return: bool,
+    timeout: float,
+) -> BroadcastResult:
+    start = perf_counter()
+    try:
+        result = await asyncio.wait_for(
+            _send_to(
+                host,
+                port,
+                name,
+                event_name,
+                event_contents,
+                shall_return,
+                timeout,
+            ),
+            timeout,
+        )
+    except asyncio.TimeoutError:
+        error = TimeoutError(
+            f"RV at {host}:{port} did not answer within {timeout}s"
+        )
+        return BroadcastResult(
+            host, port, error=error, elapsed=perf_counter() - start
+        )
+    except Exception as err:
+        return BroadcastResult(
+            host, port, error=err, elapsed=perf_counter() - start
+        )
+    return BroadcastResult(
+        host, port, result=result, elapsed=perf_counter() - start
+    )
+
+
+async def broadcast_event_async(
+    endpoints: Iterable[tuple[str, int]],
+    event_name: str,
+    event_contents: str,
+    shall_return: bool = True,
+    timeout: float = DEFAULT_BROADCAST_TIMEOUT,
+    name: str | None = None,
+) -> list[BroadcastResult]:
+    """Send an event to several RV sessions concurrently.
+
+    Args:
+        endpoints: (host, port) of each RV session.
+        event_name: Event name from RV Reference Manual.
+        event_contents: Event payload data.
+        shall_return: Whether to wait for the return values.
+        timeout: Seconds each endpoint has to connect and answer.
+        name: Connection name. Defaults to value from addon settings.
+
+    Returns:
+        Result of each endpoint, in order of `endpoints`.
+    """
+    results = await asyncio.gather(
+        *(
+            _broadcast_to(
+                host,
+                port,
+                name,
+                event_name,
+                event_contents,
+                shall_return,
+                timeout,
+            )
+            for host, port in endpoints
+        )
+    )
+    for result in results:
+        if not result.ok:
+            log.warning(
+                f"Broadcast of '{event_name}' to {result.host}:{result.port}"
+                f" failed: {result.error}"
+            )
+    return results
+
+
+def broadcast_event(
+    endpoints: Iterable[tuple[str, int]],
+    event_name: str,
+    event_contents: str,
+    shall_return: bool = True,
+    timeout: float = DEFAULT_BROADCAST_TIMEOUT,
+    name: str | None = None,
+) -> list[BroadcastResult]:
+    """Blocking variant of `broadcast_event_async`.
+
+    Runs on the shared event loop thread, so it must not be called from
+    a coroutine running on it.
+
+    Args:
+        endpoints: (host, port) of each RV session.
+        event_name: Event name from RV Reference Manual.
+        event_contents: Event payload data.
+        shall_return: Whether to wait for the return values.
+        timeout: Seconds each endpoint has to connect and answer.
+        name: Connection name. Defaults to value from addon settings.
+
+    Returns:
+        Result of each endpoint, in order of `endpoints`.
+    """
+    return get_event_loop_thread().run(
+        broadcast_event_async(
+            list(endpoints),
+            event_name,
+            event_contents,
+            shall_return=shall_return,
+            timeout=timeout,
+            name=name,
+        )
+    )
@@ -0,0 +1,224 @@
+"""Chunked transfer of large item lists as a sequence of RV events.
+
+Instead of one event carrying a huge JSON array, the items are split
+into chunks which are each a complete JSON array on their own. The
+receiver handles every chunk as soon as it arrives, so neither side has
+to hold the whole encoded payload and handling starts before the last
+chunk was sent.
+
+Each chunk is sent as event contents in the form
+``TRANSFER_ID SEQ LAST ENCODING BODY`` where ``SEQ`` counts from 0,
+``LAST`` is 1 on the final chunk and ``ENCODING`` is either ``json``
+or ``zlib`` for base64 encoded zlib compressed JSON.
+"""
+
+from __future__ import annotations
+
+import base64
+import itertools
+import json
+import uuid
+import zlib
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from ayon_openrv.protocol import ProtocolError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from typing import Any
+
+# Maximum size of the JSON of a single chunk in characters
+DEFAULT_CHUNK_SIZE = 64 * 1024
+# Items of the first chunk, later chunks adapt to the size of the items
+INITIAL_CHUNK_ITEMS = 64
+# Seconds after which an incomplete transfer is dropped
+TRANSFER_TIMEOUT = 60.0
+
+ENCODING_JSON = "json"
+ENCODING_ZLIB = "zlib"
+
+
+def new_transfer_id() -> str:
+    return uuid.uuid4().hex
+
+
+def encode_chunk(
+    transfer_id: str,
+    seq: int,
+    last: bool,
+    body: str,
+    compress: bool = False,
+) -> str:
+    """Encode a single chunk.
+
+    Args:
+        transfer_id: Id shared by all chunks of a transfer.
+        seq: Index of the chunk within the transfer.
+        last: Whether this is the final chunk.
+        body: JSON array with the items of the chunk.
+        compress: Compress the body with zlib.
+
+    Returns:
+        Contents of the chunk event.
+    """
+    encoding = ENCODING_JSON
+    if compress:
+        encoding = ENCODING_ZLIB
+        body = base64.b64encode(zlib.compress(body.encode("utf-8"))).decode(
+            "ascii"
+        )
+    return f"{transfer_id} {seq} {int(last)} {encoding} {body}"
+
+
+def decode_chunk(data: str) -> tuple[str, int, bool, list[Any]]:
+    """Decode a single chunk.
+
+    Args:
+        data: Contents of the chunk event.
+
+    Returns:
+        Tuple of (transfer_id, seq, last, items).
+
+    Raises:
+        ProtocolError: If the chunk is malformed.
+    """
+    parts = data.split(" ", 4)
+    if len(parts) != 5:
+        raise ProtocolError(f"Invalid chunk: {data[:64]!r}")
+    transfer_id, seq, last, encoding, body = parts
+    try:
+        if encoding == ENCODING_ZLIB:
+            body = zlib.decompress(base64.b64decode(body)).decode("utf-8")
+        elif encoding != ENCODING_JSON:
+            raise ProtocolError(f"Unknown chunk encoding: {encoding}")
+        items = json.loads(body)
+        return (transfer_id, int(seq), last == "1", items)
+    except (ValueError, zlib.error) as err:
+        raise ProtocolError(f"Invalid chunk: {err}") from err
+
+
+def iter_chunks(
+    items: Iterable[Any],
+    max_size: int = DEFAULT_CHUNK_SIZE,
+    compress: bool = False,
+    transfer_id: str | None = None,
+) -> Iterator[str]:
+    """Encode items into chunks, one at a time.
+
+    Only the items of the chunk being encoded are held as JSON, so the
+    whole payload is never encoded at once. The number of items per
+    chunk adapts to the size of the items, a single item larger than
+    `max_size` makes a chunk on its own.
+
+    Args:
+        items: JSON serializable items.
+        max_size: Maximum size of the JSON of a chunk in characters.
+        compress: Compress the chunks with zlib.
+        transfer_id: Id of the transfer, a new one by default.
+
+    Yields:
+        Contents of the chunk events, in order.
+    """
+    if transfer_id is None:
+        transfer_id = new_transfer_id()
+
+    iterator = iter(items)
+    seq = 0
+    count = INITIAL_CHUNK_ITEMS
+    # Items taken from the iterator which did not fit the last chunk
+    carry: list[Any] = []
+    # The last chunk is only known once the items are exhausted, so
+    # each chunk is held back until the next one is encoded
+    ready: str | None = None
+    while True:
+        batch = carry + list(itertools.islice(iterator, count - len(carry)))
+        if not batch:
+            break
+        carry = []
+        body = json.dumps(batch)
+        while len(body) > max_size and len(batch) > 1:
+            half = len(batch) // 2
+            carry = batch[half:] + carry
+            batch = batch[:half]
+            body = json.dumps(batch)
+
+        # Aim slightly below the limit so the next batch rarely splits
+        count = max(1, int(len(batch) * max_size * 0.9 / len(body)))
+        count = max(count, len(carry))
+        if ready is not None:
+            yield encode_chunk(transfer_id, seq, False, ready, compress)
+            seq += 1
+        ready = body
+
+    yield encode_chunk(transfer_id, seq, True, ready or "[]", compress)
+
+
+class _Transfer:
+    def __init__(self) -> None:
+        self.next_seq = 0
+        self.last_seq: int | None = None
+        # Chunks which arrived ahead of their turn by seq
+        self.pending: dict[int, list[Any]] = {}
+        self.updated = monotonic()
+
+
+class ChunkReassembler:
+    """Reassembles chunked transfers incrementally on the receiving side.
+
+    Items of a chunk are handed over as soon as all chunks before it
+    arrived. Transfers which did not finish within `timeout` seconds are
+    dropped.
+
+    Args:
+        timeout: Seconds an incomplete transfer is kept.
+    """
+
+    def __init__(self, timeout: float = TRANSFER_TIMEOUT) -> None:
+        self.timeout = timeout
+        self._transfers: dict[str, _Transfer] = {}
+
+    def feed(self, data: str) -> tuple[list[Any], bool]:
+        """Add a received chunk.
+
+        Args:
+            data: Contents of the chunk event.
+
+        Returns:
+            Tuple of (items, finished). Items ready to be handled in
+            order of the transfer, finished is True once all items of
+            the transfer were returned.
+
+        Raises:
+            ProtocolError: If the chunk is malformed.
+        """
+        transfer_id, seq, last, items = decode_chunk(data)
+        self._drop_expired()
+
+        transfer = self._transfers.setdefault(transfer_id, _Transfer())
+        transfer.updated = monotonic()
+        if last:
+            transfer.last_seq = seq
+        if seq < transfer.next_seq:
+            # Duplicate of a chunk handled already
+            return ([], False)
+        transfer.pending[seq] = items
+
+        ready = []
+        while transfer.next_seq in transfer.pending:
+            ready.extend(transfer.pending.pop(transfer.next_seq))
+            transfer.next_seq += 1
+
+        finished = (
+            transfer.last_seq is not None
+            and transfer.next_seq > transfer.last_seq
+        )
+        if finished:
+            del self._transfers[transfer_id]
+        return (ready, finished)
+
+    def _drop_expired(self) -> None:
+        expired_at = monotonic() - self.timeout
+        for transfer_id, transfer in list(self._transfers.items()):
+            if transfer.updated < expired_at:
+                del self._transfers[transfer_id]
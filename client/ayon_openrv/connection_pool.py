@@ -0,0 +1,188 @@
+"""Per-process pool of connections to running RV sessions.
+
+Keeps `RVConnector` instances alive between uses so repeated commands
+sent to the same RV session skip the connect, greeting and DISCONNECT
+handshake.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import threading
+from typing import TYPE_CHECKING
+
+from ayon_core.lib import Logger
+
+from ayon_openrv.networking import DEFAULT_KEEPALIVE_INTERVAL, RVConnector
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+log = Logger.get_logger(__name__)
+
+PoolKey = tuple[str, int, str]
+
+
+class RVConnectionPool:
+    """Pool of idle RV connections keyed by (host, port, conn_name).
+
+    A borrowed connection is exclusive to the borrower. Idle connections
+    are kept alive by the connector's I/O thread, which answers RV. Idle
+    connections the thread loses are closed and dropped, the next
+    borrower connects anew. They are still health-checked with PING when
+    borrowed again and silently replaced if RV went away in the
+    meantime.
+
+    Args:
+        connector_cls: Connector class used for new connections.
+        ping_timeout: Seconds to wait for the health-check PONG.
+        keepalive_interval: Seconds without traffic until an idle
+            connection is pinged, None does not service idle
+            connections in background.
+    """
+
+    def __init__(
+        self,
+        connector_cls: type[RVConnector] = RVConnector,
+        ping_timeout: float = 1.0,
+        keepalive_interval: float | None = DEFAULT_KEEPALIVE_INTERVAL,
+    ) -> None:
+        self.connector_cls = connector_cls
+        self.ping_timeout = ping_timeout
+        self.keepalive_interval = keepalive_interval
+
+        self._lock = threading.Lock()
+        self._idle: dict[PoolKey, RVConnector] = {}
+
+    def get_key(
+        self,
+        host: str | None = None,
+        name: str | None = None,
+        port: int | None = None,
+    ) -> PoolKey:
+        """Resolve the pool key filling defaults from addon settings."""
+        settings = self.connector_cls.get_settings()
+        return (
+            host or "localhost",
+            port or settings["network"]["conn_port"],
+            name or settings["network"]["conn_name"],
+        )
+
+    def acquire(
+        self,
+        host: str | None = None,
+        name: str | None = None,
+        port: int | None = None,
+    ) -> RVConnector:
+        """Borrow a connection to RV.
+
+        The returned connector is not connected if RV is not reachable,
+        the caller may then launch RV and `wait_for_connection`.
+
+        Args:
+            host: Hostname to connect to. Defaults to "localhost".
+            name: Connection name. Defaults to value from addon settings.
+            port: Port number. Defaults to value from addon settings.
+
+        Returns:
+            Connector to return with `release` once done.
+        """
+        key = self.get_key(host, name, port)
+        with self._lock:
+            connector = self._idle.pop(key, None)
+
+        if connector is not None:
+            if connector.ping(self.ping_timeout):
+                log.debug(f"Reusing pooled connection to RV: {key}")
+                return connector
+            log.debug(f"Dropping stale pooled connection to RV: {key}")
+            connector.close()
+
+        host, port, name = key
+        return self.connector_cls(host=host, name=name, port=port)
+
+    def release(self, connector: RVConnector) -> None:
+        """Return a borrowed connection to the pool.
+
+        Connections which are not connected are closed and dropped.
+        Only one idle connection is kept per key, extra ones are
+        closed.
+
+        Args:
+            connector: Connector returned by `acquire`.
+        """
+        if not connector.is_connected:
+            connector.close()
+            return
+
+        key = (connector.host, connector.port, connector.name)
+        with self._lock:
+            existing = self._idle.setdefault(key, connector)
+        if existing is not connector:
+            connector.close()
+        elif self.keepalive_interval is not None:
+            connector.add_disconnect_callback(self._discard)
+            connector.start_io_thread(
+                self.keepalive_interval, self.ping_timeout
+            )
+
+    @contextlib.contextmanager
+    def connection(
+        self,
+        host: str | None = None,
+        name: str | None = None,
+        port: int | None = None,
+    ) -> Iterator[RVConnector]:
+        """Borrow a connection for the duration of the context.
+
+        Args:
+            host: Hostname to connect to. Defaults to "localhost".
+            name: Connection name. Defaults to value from addon settings.
+            port: Port number. Defaults to value from addon settings.
+
+        Yields:
+            Connector which might not be connected yet, see `acquire`.
+        """
+        connector = self.acquire(host, name, port)
+        try:
+            yield connector
+        except BaseException:
+            # State of the connection is unknown, do not reuse it
+            connector.close()
+            raise
+        else:
+            self.release(connector)
+
+    def _discard(self, connector: RVConnector) -> None:
+        """Drop an idle connection its I/O thread lost."""
+        key = (connector.host, connector.port, connector.name)
+        with self._lock:
+            if self._idle.get(key) is not connector:
+                # Borrowed, `release` drops it
+                return
+            del self._idle[key]
+        log.debug(f"Dropping lost pooled connection to RV: {key}")
+        connector.close()
+
+    def clear(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            connectors = list(self._idle.values())
+            self._idle.clear()
+        for connector in connectors:
+            connector.close()
+
+
+_pool: RVConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_connection_pool() -> RVConnectionPool:
+    """Return the pool shared by loaders and tools of this process."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = RVConnectionPool()
+            atexit.register(_pool.clear)
+        return _pool
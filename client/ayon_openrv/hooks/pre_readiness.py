@@ -0,0 +1,13 @@
+from ayon_applications import PreLaunchHook
+
+from ayon_openrv.readiness import READY_ADDRESS_ENV, READY_ADDRESS_KEY
+
+
+class PreReadinessNotification(PreLaunchHook):
+    """Pass the address RV notifies once it is ready for connections."""
+    app_groups = ["openrv"]
+
+    def execute(self):
+        address = self.data.get(READY_ADDRESS_KEY)
+        if address:
+            self.launch_context.env[READY_ADDRESS_ENV] = address
@@ -0,0 +1,146 @@
+"""Cached lookup of the loader plugins used to load into RV.
+
+Discovering loader plugins imports every plugin file and applies project
+settings to them, so the result is cached per project together with an
+index from file extension to loader. Loading a representation then
+costs a single dictionary lookup. The cache is dropped when loader
+plugin paths are registered or deregistered with the functions of this
+module, or explicitly with `invalidate_loader_registry`.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+from ayon_core.lib import Logger
+from ayon_core.lib.transcoding import IMAGE_EXTENSIONS, VIDEO_EXTENSIONS
+from ayon_core.pipeline import (
+    deregister_loader_plugin_path as _deregister_loader_plugin_path,
+)
+from ayon_core.pipeline import discover_loader_plugins
+from ayon_core.pipeline import (
+    register_loader_plugin_path as _register_loader_plugin_path,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import Any
+
+log = Logger.get_logger(__name__)
+
+FRAMES_LOADER = "FramesLoader"
+MOV_LOADER = "MovLoader"
+
+# Loader of each extension (without dot), image extensions take
+# precedence over video extensions
+LOADER_EXTENSIONS: tuple[tuple[str, frozenset[str]], ...] = (
+    (
+        FRAMES_LOADER,
+        frozenset(ext.lstrip(".").lower() for ext in IMAGE_EXTENSIONS),
+    ),
+    (
+        MOV_LOADER,
+        frozenset(ext.lstrip(".").lower() for ext in VIDEO_EXTENSIONS),
+    ),
+)
+
+
+class LoaderRegistry:
+    """Loader plugins of a project indexed by name and file extension.
+
+    Args:
+        loaders: Discovered loader plugin classes.
+    """
+
+    def __init__(self, loaders: Iterable[Any]) -> None:
+        self.loaders_by_name: dict[str, Any] = {}
+        for loader in loaders:
+            self.loaders_by_name.setdefault(loader.__name__, loader)
+
+        self.loaders_by_extension: dict[str, Any] = {}
+        for loader_name, extensions in LOADER_EXTENSIONS:
+            loader = self.loaders_by_name.get(loader_name)
+            if loader is None:
+                log.warning(f"{loader_name} plugin not found")
+                continue
+            for extension in extensions:
+                self.loaders_by_extension.setdefault(extension, loader)
+
+    def get_loader(self, name: str) -> Any | None:
+        """Return the loader plugin with a class name, if discovered."""
+        return self.loaders_by_name.get(name)
+
+    def get_loader_for_extension(self, extension: str) -> Any | None:
+        """Return the loader plugin for a file extension.
+
+        Args:
+            extension: File extension, with or without leading dot.
+
+        Returns:
+            The loader plugin, None if no loader handles the extension.
+        """
+        return self.loaders_by_extension.get(extension.lstrip(".").lower())
+
+
+_registries: dict[str, LoaderRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_loader_registry(project_name: str) -> LoaderRegistry:
+    """Return the cached loader registry of a project.
+
+    Loader plugins are discovered on first use for the project.
+
+    Args:
+        project_name: Name of the project.
+
+    Returns:
+        The loader registry.
+    """
+    with _registries_lock:
+        registry = _registries.get(project_name)
+    if registry is not None:
+        return registry
+
+    # Discovery may be slow, do not block other projects meanwhile
+    registry = LoaderRegistry(discover_loader_plugins(project_name))
+    with _registries_lock:
+        return _registries.setdefault(project_name, registry)
+
+
+def invalidate_loader_registry(project_name: str | None = None) -> None:
+    """Drop cached loader registries, e.g. after plugin paths changed.
+
+    Args:
+        project_name: Only drop the registry of this project, all are
+            dropped by default.
+    """
+    with _registries_lock:
+        if project_name is None:
+            _registries.clear()
+        else:
+            _registries.pop(project_name, None)
+
+
+def register_loader_plugin_path(path: str) -> None:
+    """Register a loader plugin path, see `invalidate_loader_registry`.
+
+    Use instead of `ayon_core.pipeline.register_loader_plugin_path` so
+    loaders of the path are discovered on next use.
+
+    Args:
+        path: Directory with loader plugins.
+    """
+    _register_loader_plugin_path(path)
+    invalidate_loader_registry()
+
+
+def deregister_loader_plugin_path(path: str) -> None:
+    """Deregister a loader plugin path, see `invalidate_loader_registry`.
+
+    Args:
+        path: Directory with loader plugins.
+    """
+    _deregister_loader_plugin_path(path)
+    invalidate_loader_registry()
@@ -0,0 +1,335 @@
+"""Runtime metrics of the RV network connector.
+
+Every connector owns a `ConnectorMetrics`. Metrics of all live
+connectors of the process can be queried with `get_connector_metrics`
+and `collect_metrics`. When `AYON_RV_METRICS_FILE` is set, connectors
+append a JSON line with their metrics to that file when they close, so
+metrics can be aggregated across machines.
+"""
+
+from __future__ import annotations
+
+import bisect
+import collections
+import json
+import math
+import os
+import socket
+import threading
+import weakref
+from time import time
+from typing import Any
+
+from ayon_core.lib import Logger
+
+log = Logger.get_logger(__name__)
+
+# Upper bounds of latency buckets in seconds
+DEFAULT_LATENCY_BUCKETS = (
+    0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0,
+    10.0, 30.0,
+)
+
+
+class LatencyHistogram:
+    """Fixed bucket histogram of durations in seconds.
+
+    Keeps constant memory regardless of the number of observations,
+    percentiles are therefore approximated by the bucket upper bound.
+
+    Args:
+        buckets: Sorted upper bounds of the buckets in seconds.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        # Last bucket collects everything above the highest bound
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record a single duration.
+
+        Args:
+            value: Duration in seconds.
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """Approximate percentile of the recorded durations.
+
+        Args:
+            percent: Percentile to compute, 0-100.
+
+        Returns:
+            Upper bound of the bucket containing the percentile, clamped
+            to the maximum observed value.
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * percent / 100.0))
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """Add observations of another histogram with the same buckets.
+
+        Args:
+            other: Histogram to merge into this one.
+
+        Raises:
+            ValueError: If bucket bounds of the histograms differ.
+        """
+        if other.buckets != self.buckets:
+            raise ValueError("Cannot merge histograms with other buckets")
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "mean": self.mean,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "buckets": list(self.buckets),
+            "counts": list(self.counts),
+        }
+
+
+class ConnectorMetrics:
+    """Metrics collected by a single `RVConnector`.
+
+    Attributes:
+        connect: Durations of successful connection attempts including
+            the greeting.
+        connect_wait: Durations of waiting for a connection including
+            failed attempts and backoff, e.g. while RV starts up.
+        connect_attempts: Number of connection attempts.
+        connect_failures: Number of failed connection attempts.
+        connect_retries: Number of connection attempts made after a
+            failed one.
+        connect_timeouts: Number of times waiting for a connection
+            timed out.
+        round_trip: Durations of RETURNEVENT round trips.
+        close: Durations of the DISCONNECT handshake on close.
+        close_time_saved: Total seconds saved on closing compared to
+            waiting the full close timeout.
+        bytes_sent: Number of bytes sent to RV.
+        bytes_received: Number of bytes received from RV.
+        messages_sent: Number of sent frames by message type.
+        messages_received: Number of received frames by message type.
+        pings_answered: Number of PINGs of RV answered with PONG.
+        send_batches: Number of writes of the send queue, each carrying
+            one or more coalesced messages.
+        messages_dropped: Number of messages dropped from a full send
+            queue.
+    """
+
+    def __init__(self) -> None:
+        self.connect = LatencyHistogram()
+        self.connect_wait = LatencyHistogram()
+        self.connect_attempts = 0
+        self.connect_failures = 0
+        self.connect_retries = 0
+        self.connect_timeouts = 0
+        self.round_trip = LatencyHistogram()
+        self.close = LatencyHistogram()
+        self.close_time_saved = 0.0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.messages_sent: collections.Counter[str] = collections.Counter()
+        self.messages_received: collections.Counter[str] = (
+            collections.Counter()
+        )
+        self.pings_answered = 0
+        self.send_batches = 0
+        self.messages_dropped = 0
+
+        _live_metrics.add(self)
+
+    def observe_connect(self, elapsed: float) -> None:
+        """Record a connection attempt.
+
+        Args:
+            elapsed: Seconds the attempt took.
+        """
+        self.connect_attempts += 1
+        self.connect.observe(elapsed)
+
+    def observe_connect_failure(self) -> None:
+        """Record a failed connection attempt."""
+        self.connect_attempts += 1
+        self.connect_failures += 1
+
+    def observe_sent(self, msg_type: str, size: int, count: int = 1):
+        """Record frames sent to RV.
+
+        Args:
+            msg_type: Message type of the frames.
+            size: Total size of the frames in bytes.
+            count: Number of frames.
+        """
+        self.bytes_sent += size
+        self.messages_sent[msg_type] += count
+
+    def observe_close(self, elapsed: float, timeout: float) -> None:
+        """Record a finished close handshake.
+
+        Args:
+            elapsed: Seconds the handshake took.
+            timeout: Seconds a close was allowed to take at most.
+        """
+        self.close.observe(elapsed)
+        self.close_time_saved += max(0.0, timeout - elapsed)
+
+    def merge(self, other: ConnectorMetrics) -> None:
+        """Add metrics of another connector to this one.
+
+        Args:
+            other: Metrics to merge into these.
+        """
+        for name in _HISTOGRAMS:
+            getattr(self, name).merge(getattr(other, name))
+        for name in _COUNTERS:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        self.messages_sent.update(other.messages_sent)
+        self.messages_received.update(other.messages_received)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a JSON serializable copy of the current metrics."""
+        data: dict[str, Any] = {
+            name: getattr(self, name).to_dict() for name in _HISTOGRAMS
+        }
+        for name in _COUNTERS:
+            data[name] = getattr(self, name)
+        data["messages_sent"] = dict(self.messages_sent)
+        data["messages_received"] = dict(self.messages_received)
+        return data
+
+
+_HISTOGRAMS = ("connect", "connect_wait", "round_trip", "close")
+_COUNTERS = (
+    "connect_attempts",
+    "connect_failures",
+    "connect_retries",
+    "connect_timeouts",
+    "close_time_saved",
+    "bytes_sent",
+    "bytes_received",
+    "pings_answered",
+    "send_batches",
+    "messages_dropped",
+)
+
+# Metrics of connectors which are still referenced
+_live_metrics: weakref.WeakSet[ConnectorMetrics] = weakref.WeakSet()
+
+
+def get_connector_metrics() -> list[ConnectorMetrics]:
+    """Return metrics of all live connectors of this process."""
+    return list(_live_metrics)
+
+
+def collect_metrics() -> dict[str, Any]:
+    """Aggregate metrics of all live connectors of this process.
+
+    Returns:
+        JSON serializable dictionary with the number of connectors and
+        the merged metrics under "total".
+    """
+    total = ConnectorMetrics()
+    # Not a connector itself
+    _live_metrics.discard(total)
+    connectors = get_connector_metrics()
+    for metrics in connectors:
+        total.merge(metrics)
+    return {"connectors": len(connectors), "total": total.snapshot()}
+
+
+class MetricsSink:
+    """Appends metrics as JSON lines to a file.
+
+    Each line is a single JSON object, safe to append to from several
+    processes and easy to aggregate with line based tools.
+
+    Args:
+        path: Path to the file, created if missing.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+
+    def write(self, metrics: ConnectorMetrics, **labels: Any) -> None:
+        """Append metrics of a connector.
+
+        Args:
+            metrics: Metrics to write.
+            **labels: Extra fields identifying the connection, e.g. host
+                and port.
+        """
+        record = {
+            "timestamp": time(),
+            "hostname": socket.gethostname(),
+            "pid": os.getpid(),
+            **labels,
+            "metrics": metrics.snapshot(),
+        }
+        line = json.dumps(record) + "\n"
+        try:
+            with self._lock, open(self.path, "a") as stream:
+                stream.write(line)
+        except OSError as err:
+            log.warning(f"Failed to write RV metrics to {self.path}: {err}")
+
+
+_sinks: dict[str, MetricsSink] = {}
+
+
+def get_metrics_sink() -> MetricsSink | None:
+    """Return the sink configured with `AYON_RV_METRICS_FILE`, if any."""
+    path = os.environ.get("AYON_RV_METRICS_FILE")
+    if not path:
+        return None
+    sink = _sinks.get(path)
+    if sink is None:
+        sink = _sinks.setdefault(path, MetricsSink(path))
+    return sink
+
+
+def emit_metrics(metrics: ConnectorMetrics, **labels: Any) -> None:
+    """Write metrics to the configured sink, does nothing without one.
+
+    Args:
+        metrics: Metrics to write.
+        **labels: Extra fields identifying the connection.
+    """
+    sink = get_metrics_sink()
+    if sink is not None:
+        sink.write(metrics, **labels)
@@ -6,30 +6,85 @@ and container loading functionality.
 
 from __future__ import annotations
 
+import functools
+import itertools
 import json
 import os
+import selectors
 import socket
-from time import sleep, time
+import threading
+from concurrent.futures import Future
+from time import monotonic, perf_counter, sleep, time
 from typing import TYPE_CHECKING
 
-from ayon_api import get_addon_settings, get_representations
+from ayon_api import get_representations
 from ayon_core.lib import Logger
-from ayon_core.lib.transcoding import IMAGE_EXTENSIONS, VIDEO_EXTENSIONS
-from ayon_core.pipeline import (
-    discover_loader_plugins,
-    get_current_project_name,
-    get_representation_path,
-    load_container,
+from ayon_core.pipeline import get_current_project_name
+from ayon_core.pipeline.load import (
+    get_representation_contexts,
+    load_with_repre_context,
 )
 
-from ayon_openrv.addon import OpenRVAddon
-from ayon_openrv.version import __version__
+from ayon_openrv.chunking import (
+    DEFAULT_CHUNK_SIZE,
+    ChunkReassembler,
+    iter_chunks,
+)
+from ayon_openrv.loader_registry import get_loader_registry
+from ayon_openrv.metrics import ConnectorMetrics, emit_metrics
+from ayon_openrv.path_resolver import (
+    get_loader_options,
+    resolve_representation_paths,
+)
+from ayon_openrv.protocol import (
+    RPC_EVENT,
+    FrameReader,
+    ProtocolError,
+    decode_rpc_return,
+    encode_frame,
+    encode_rpc_request,
+)
+from ayon_openrv.send_queue import (
+    DEFAULT_CAPACITY,
+    OVERFLOW_BLOCK,
+    SendQueue,
+)
+from ayon_openrv.settings_cache import get_addon_settings
+from ayon_openrv.transport import Transport, get_transports
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
     from typing import Any
 
 log = Logger.get_logger(__name__)
 
+# Seconds of silence after which the I/O thread pings RV
+DEFAULT_KEEPALIVE_INTERVAL = 30.0
+# Maximum seconds the I/O thread blocks, bounds the time to stop it
+IO_POLL_INTERVAL = 0.5
+
+
+def get_close_timeout() -> float:
+    """Return the maximum time to wait for RV to acknowledge DISCONNECT.
+
+    Configured in milliseconds with `AYON_RV_SOCKET_CLOSE_TIMEOUT`.
+
+    Returns:
+        The timeout in seconds.
+    """
+    return int(os.environ.get("AYON_RV_SOCKET_CLOSE_TIMEOUT", 100)) / 1000
+
+
+def _synchronized(method: Callable) -> Callable:
+    """Run the method holding the connection's I/O lock."""
+
+    @functools.wraps(method)
+    def wrapper(self: RVConnector, *args: Any, **kwargs: Any) -> Any:
+        with self._io_lock:
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
 
 class RVConnector:
     """Manages socket connection to RV for remote control.
@@ -38,13 +93,23 @@ class RVConnector:
     to RV's network control interface, sending commands, and
     receiving responses.
 
+    The connection may be shared with a background I/O thread, see
+    `start_io_thread`, which answers PINGs, dispatches MESSAGEs to
+    callbacks and keeps the connection alive while it is idle. Messages
+    may be sent by a writer thread, see `start_writer`.
+
     Attributes:
         host: The hostname to connect to.
         name: The connection name for identification.
         port: The port to connect to.
         is_connected: Whether currently connected to RV.
+        metrics: Runtime metrics of this connection.
+        transport: Transport used for connecting, None picks one on
+            each connection attempt, see `get_transports`.
+        active_transport: Transport of the current connection.
     """
 
+    # Fixed settings used instead of the addon settings, e.g. in tests
     _cached_settings: dict[str, Any] | None = None
 
     def __init__(
@@ -52,6 +117,7 @@ class RVConnector:
         host: str | None = None,
         name: str | None = None,
         port: int | None = None,
+        transport: Transport | None = None,
     ) -> None:
         """Initialize RV connector.
 
@@ -59,15 +125,42 @@ class RVConnector:
             host: Hostname to connect to. Defaults to "localhost".
             name: Connection name. Defaults to value from addon settings.
             port: Port number. Defaults to value from addon settings.
+            transport: Transport to connect with. By default the
+                Unix domain socket relay of a local RV session is used
+                if available, TCP otherwise.
         """
-        settings = self._get_settings()
+        settings = self.get_settings()
 
         self.host = host or "localhost"
         self.name = name or settings["network"]["conn_name"]
         self.port = port or settings["network"]["conn_port"]
+        self.transport = transport
+        self.active_transport: Transport | None = None
 
         self.is_connected = False
         self._sock: socket.socket | None = None
+        self._reader = FrameReader()
+        self._selector: selectors.BaseSelector | None = None
+
+        # Guards the socket against the I/O thread
+        self._io_lock = threading.RLock()
+        # Keeps frames written by several threads from interleaving
+        self._write_lock = threading.Lock()
+        self._send_queue: SendQueue | None = None
+        self._io_thread: threading.Thread | None = None
+        self._io_stop = threading.Event()
+        self._last_activity = monotonic()
+        self._message_callbacks: list[Callable[[str], None]] = []
+        self._disconnect_callbacks: list[Callable[[RVConnector], None]] = []
+
+        self.metrics = ConnectorMetrics()
+
+        # Pipelined RETURNEVENTs waiting for their RETURN by request id
+        self._pending_events: dict[int, tuple[Future, float]] = {}
+        self._request_ids = itertools.count(1)
+        # RETURNs of events sent with `shall_return=False` still to come
+        self._unclaimed_returns = 0
+        self._unclaimed_returns_lock = threading.Lock()
 
         self._attempts = 0
         self._elapsed = 0.0
@@ -75,39 +168,61 @@ class RVConnector:
         self.connect()
 
     @classmethod
-    def _get_settings(cls) -> dict[str, Any]:
-        """Get addon settings with lazy loading.
+    def get_settings(cls) -> dict[str, Any]:
+        """Get addon settings.
+
+        Served from the settings cache, which only blocks on the
+        server when no settings were cached yet.
 
         Returns:
             The addon settings dictionary.
         """
-        if cls._cached_settings is None:
-            cls._cached_settings = get_addon_settings(
-                OpenRVAddon.name, __version__
-            )
-        # At this point _cached_settings is guaranteed to be set
-        return cls._cached_settings  # type: ignore[return-value]
+        if cls._cached_settings is not None:
+            return cls._cached_settings
+        return get_addon_settings()
 
     def __enter__(self) -> RVConnector:
         """Enter the context manager with retry logic.
 
-        Attempts to connect with exponential backoff until success
-        or timeout is reached.
-
         Returns:
             Self for context manager usage.
 
         Raises:
             ConnectionError: If connection times out.
         """
-        settings = self._get_settings()
+        self.wait_for_connection()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Exit the context manager and close connection."""
+        self.close()
+
+    def wait_for_connection(self, timeout: float | None = None) -> None:
+        """Connect to RV, retrying until success or timeout.
+
+        Attempts to connect with exponential backoff, e.g. while RV is
+        still starting up.
+
+        Args:
+            timeout: Seconds to keep retrying. Defaults to the timeout
+                from addon settings.
+
+        Raises:
+            ConnectionError: If connection times out.
+        """
         start = time()
         self._attempts = 0
-        timeout = float(settings["network"]["timeout"])
+        if timeout is None:
+            settings = self.get_settings()
+            timeout = float(settings["network"]["timeout"])
+
+        if self.is_connected:
+            return
 
         while not self.is_connected:
             self._elapsed = time() - start
             if self._elapsed > timeout:
+                self.metrics.connect_timeouts += 1
                 raise ConnectionError(
                     f"Timeout after {self._elapsed:.1f}s connecting to RV. "
                     f"host={self.host}, port={self.port}, name={self.name}"
@@ -120,15 +235,12 @@ class RVConnector:
                     f"Retry attempt {self._attempts}, waiting {delay:.2f}s"
                 )
                 sleep(delay)
+                self.metrics.connect_retries += 1
 
             self._attempts += 1
             self.connect()
 
-        return self
-
-    def __exit__(self, *args: Any) -> None:
-        """Exit the context manager and close connection."""
-        self.close()
+        self.metrics.connect_wait.observe(time() - start)
 
     @property
     def sock(self) -> socket.socket:
@@ -149,20 +261,12 @@ class RVConnector:
         """Check if a message is available on the socket.
 
         Returns:
-            True if data is available to read, False otherwise.
+            True if a complete message can be read without blocking,
+            False otherwise.
         """
-        if self._sock is None:
-            return False
-
-        try:
-            msg = self._sock.recv(1, socket.MSG_PEEK)
-            return len(msg) > 0
-        except socket.timeout:
-            return False
-        except OSError as err:
-            log.error(f"Error checking for message: {err}", exc_info=True)
-            return False
+        return self._wait_for_message(timeout=0)
 
+    @_synchronized
     def connect(self) -> None:
         """Connect to the RV server.
 
@@ -181,19 +285,115 @@ class RVConnector:
     def send_message(self, message: str) -> None:
         """Send a message to RV.
 
+        Only queues the message if the writer thread is running.
+
         Args:
             message: The message string to send.
+
+        Raises:
+            SendQueueFull: If the writer's queue is full, depending on
+                its overflow policy.
+        """
+        self.queue_message(message)
+
+    def queue_message(
+        self, message: str, timeout: float | None = None
+    ) -> Future:
+        """Send a message to RV, with the writer thread if running.
+
+        Args:
+            message: The message string to send.
+            timeout: Maximum seconds to wait for space in the writer's
+                queue with the "block" overflow policy.
+
+        Returns:
+            Future resolved once the message was written, it fails if
+            writing failed or the message was dropped.
+
+        Raises:
+            SendQueueFull: If the writer's queue is full, depending on
+                its overflow policy.
         """
         log.debug(f"send_message: {message}")
         if not self.is_connected or self._sock is None:
+            future = Future()
+            future.set_running_or_notify_cancel()
+            future.set_exception(ConnectionError("Not connected to RV"))
+            return future
+
+        frame = encode_frame("MESSAGE", message)
+        send_queue = self._send_queue
+        if send_queue is not None:
+            return send_queue.put(frame, timeout=timeout)
+
+        future = Future()
+        future.set_running_or_notify_cancel()
+        with self._io_lock:
+            try:
+                self._sendall(frame, "MESSAGE")
+            except (OSError, RuntimeError) as err:
+                log.warning(f"Sending message to RV failed: {err}")
+                self._close()
+                future.set_exception(err)
+            else:
+                future.set_result(None)
+        return future
+
+    def start_writer(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        overflow: str = OVERFLOW_BLOCK,
+    ) -> None:
+        """Send messages on a writer thread from now on.
+
+        `send_message` and `submit_events` then only queue the
+        messages. Messages queued while the writer is busy are
+        coalesced into a single send call.
+
+        Args:
+            capacity: Maximum number of queued messages.
+            overflow: What to do when the queue is full, "block" the
+                sender, "drop-oldest" queued message or raise an
+                "error", see `ayon_openrv.send_queue`.
+        """
+        if self._send_queue is not None:
             return
+        self._send_queue = SendQueue(
+            self._write_frames,
+            capacity=capacity,
+            overflow=overflow,
+            on_error=self._on_write_error,
+            on_drop=self._on_messages_dropped,
+            name=f"ayon-openrv-writer-{self.name}",
+        )
 
-        msg = f"MESSAGE {len(message)} {message}"
-        try:
-            self._sock.sendall(msg.encode("utf-8"))
-        except OSError:
-            self.close()
+    def stop_writer(self, timeout: float | None = None) -> None:
+        """Write queued messages and stop the writer thread.
 
+        Args:
+            timeout: Maximum seconds to wait for queued messages, those
+                not written in time are failed.
+        """
+        send_queue = self._send_queue
+        if send_queue is None:
+            return
+        self._send_queue = None
+        send_queue.close(timeout)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until the writer thread wrote all queued messages.
+
+        Args:
+            timeout: Maximum seconds to wait, None waits indefinitely.
+
+        Returns:
+            True if all messages were written in time.
+        """
+        if self._send_queue is None:
+            return True
+        return self._send_queue.flush(timeout)
+
+    @_synchronized
     def send_event(
         self,
         event_name: str,
@@ -211,22 +411,326 @@ class RVConnector:
             The return value string, or empty string if not waiting.
         """
         message = f"RETURNEVENT {event_name} * {event_contents}"
-        self.send_message(message)
+        start = perf_counter()
         if shall_return:
-            return self._process_events(process_return_only=True)
+            self.send_message(message)
+            result = self._process_events(process_return_only=True)
+            elapsed = perf_counter() - start
+            self.metrics.round_trip.observe(elapsed)
+            log.debug(f"{event_name} round trip took {elapsed * 1000:.2f}ms")
+            return result
+
+        # Counted up front as the RETURN may arrive before the writer
+        # reports the write, uncounted if the event is never written
+        self._count_unclaimed_returns(1)
+        try:
+            written = self.queue_message(message)
+        except Exception:
+            self._count_unclaimed_returns(-1)
+            raise
+        written.add_done_callback(self._on_unclaimed_event_written)
         return ""
 
+    def send_chunked_event(
+        self,
+        event_name: str,
+        items: Iterable[Any],
+        max_chunk_size: int = DEFAULT_CHUNK_SIZE,
+        compress: bool = False,
+    ) -> int:
+        """Send a list of items as a sequence of chunk events.
+
+        Chunks are encoded and sent one at a time without waiting for
+        RV to return, see `ayon_openrv.chunking`.
+
+        Args:
+            event_name: Name of the event handling the chunks.
+            items: JSON serializable items.
+            max_chunk_size: Maximum size of the JSON of a chunk.
+            compress: Compress the chunks with zlib.
+
+        Returns:
+            Number of sent chunks.
+        """
+        count = 0
+        for chunk in iter_chunks(items, max_chunk_size, compress):
+            if not self.is_connected:
+                break
+            self.send_message(f"EVENT {event_name} * {chunk}")
+            count += 1
+        log.debug(f"Sent {event_name} in {count} chunks")
+        return count
+
+    def submit_event(self, event_name: str, event_contents: str) -> Future:
+        """Send a remote event without waiting for its return value.
+
+        Any number of events may be in flight on the connection. Each is
+        wrapped in a request envelope which RV echoes back with the
+        result, so results are matched to their request regardless of
+        order. Results arrive while the connection processes events, use
+        `wait_for_events` to collect them.
+
+        Requires the `ayon-rpc` handler of the `ayon_menus` package in
+        the RV session.
+
+        Args:
+            event_name: Event name from RV Reference Manual.
+            event_contents: Event payload data.
+
+        Returns:
+            Future resolved with the return value string.
+        """
+        return self.submit_events([(event_name, event_contents)])[0]
+
+    @_synchronized
+    def submit_events(
+        self, events: Iterable[tuple[str, str]]
+    ) -> list[Future]:
+        """Send multiple remote events at once, see `submit_event`.
+
+        All events are written with a single send call.
+
+        Args:
+            events: Pairs of (event_name, event_contents).
+
+        Returns:
+            Futures resolved with the return values, in order of events.
+
+        Raises:
+            SendQueueFull: If the writer's queue is full, depending on
+                its overflow policy. The events are not sent then.
+        """
+        futures = []
+        frames = []
+        request_ids = []
+        start = perf_counter()
+        for event_name, event_contents in events:
+            future = Future()
+            futures.append(future)
+            request_id = next(self._request_ids)
+            request_ids.append(request_id)
+            self._pending_events[request_id] = (future, start)
+            envelope = encode_rpc_request(
+                request_id, event_name, event_contents
+            )
+            message = f"RETURNEVENT {RPC_EVENT} * {envelope}"
+            frames.append(encode_frame("MESSAGE", message))
+
+        if not self.is_connected or self._sock is None:
+            self._fail_pending_events()
+            return futures
+
+        data = b"".join(frames)
+        if self._send_queue is not None:
+            try:
+                written = self._send_queue.put(data, len(frames))
+            except Exception as err:
+                # Nothing was queued, no result will ever arrive
+                self._fail_events(request_ids, err)
+                raise
+            written.add_done_callback(
+                functools.partial(self._on_events_written, request_ids)
+            )
+            return futures
+
+        try:
+            self._sendall(data, "MESSAGE", len(frames))
+        except OSError as err:
+            log.warning(f"Sending events to RV failed: {err}")
+            self._close()
+        return futures
+
+    @_synchronized
+    def wait_for_events(
+        self,
+        futures: Iterable[Future],
+        timeout: float | None = None,
+    ) -> list[str]:
+        """Process incoming events until the given requests finished.
+
+        Args:
+            futures: Futures returned by `submit_event`.
+            timeout: Maximum time to wait in seconds. None waits until
+                all results arrived or the connection is closed.
+
+        Returns:
+            The return values in order of futures.
+
+        Raises:
+            ConnectionError: If the connection was lost.
+            TimeoutError: If results did not arrive in time.
+        """
+        futures = list(futures)
+        deadline = None if timeout is None else monotonic() + timeout
+        # Results mostly arrive in order, skip the finished head only
+        index = 0
+        while self.is_connected:
+            while index < len(futures) and futures[index].done():
+                index += 1
+            if index == len(futures):
+                break
+
+            remaining = None
+            if deadline is not None:
+                remaining = max(0.0, deadline - monotonic())
+            if not self._wait_for_message(timeout=remaining):
+                if remaining is not None:
+                    break
+                continue
+            self._handle_message(*self.receive_message())
+
+        return [future.result(timeout=0) for future in futures]
+
+    @_synchronized
+    def ping(self, timeout: float = 1.0) -> bool:
+        """Check the connection is alive with a PING/PONG exchange.
+
+        Messages received before the PONG are processed as usual, stale
+        RETURNs of events sent with `shall_return=False` are dropped.
+
+        Args:
+            timeout: Maximum time in seconds to wait for the PONG.
+
+        Returns:
+            True if RV answered in time, False otherwise.
+        """
+        if not self.is_connected or self._sock is None:
+            return False
+
+        try:
+            self._sendall(b"PING 1 p", "PING")
+        except OSError:
+            self._close()
+            return False
+
+        deadline = monotonic() + timeout
+        while self.is_connected:
+            remaining = max(0.0, deadline - monotonic())
+            if not self._wait_for_message(timeout=remaining):
+                break
+            resp_type, resp_data = self.receive_message()
+            if resp_type == "PONG":
+                return True
+            self._handle_message(resp_type, resp_data)
+        return False
+
     def close(self) -> None:
-        """Close the connection and clean up resources."""
+        """Close the connection and clean up resources.
+
+        Sends DISCONNECT, half-closes the socket so the message is
+        flushed and waits until RV closes its side of the connection,
+        at most `AYON_RV_SOCKET_CLOSE_TIMEOUT` milliseconds.
+
+        Queued messages are written first and the writer thread is
+        stopped, as is the I/O thread unless called by it.
+        """
+        if threading.current_thread() is not self._io_thread:
+            self.stop_io_thread()
+        self.stop_writer()
+        with self._io_lock:
+            self._close()
+
+    def add_message_callback(self, callback: Callable[[str], None]) -> None:
+        """Register a callback receiving MESSAGE data sent by RV.
+
+        Callbacks are called by the thread processing incoming messages,
+        which is the I/O thread if running.
+
+        Args:
+            callback: Callable receiving the message data.
+        """
+        self._message_callbacks.append(callback)
+
+    def remove_message_callback(
+        self, callback: Callable[[str], None]
+    ) -> None:
+        """Unregister a callback added with `add_message_callback`."""
+        if callback in self._message_callbacks:
+            self._message_callbacks.remove(callback)
+
+    def add_disconnect_callback(
+        self, callback: Callable[[RVConnector], None]
+    ) -> None:
+        """Register a callback notified when the I/O thread lost RV.
+
+        The I/O thread stops then, it does not reconnect. Callbacks are
+        called by the I/O thread with the connector.
+
+        Args:
+            callback: Callable receiving the connector.
+        """
+        if callback not in self._disconnect_callbacks:
+            self._disconnect_callbacks.append(callback)
+
+    def remove_disconnect_callback(
+        self, callback: Callable[[RVConnector], None]
+    ) -> None:
+        """Unregister a callback added with `add_disconnect_callback`."""
+        if callback in self._disconnect_callbacks:
+            self._disconnect_callbacks.remove(callback)
+
+    def start_io_thread(
+        self,
+        keepalive_interval: float = DEFAULT_KEEPALIVE_INTERVAL,
+        ping_timeout: float = 1.0,
+    ) -> None:
+        """Service the connection on a background thread.
+
+        The thread answers PINGs and dispatches MESSAGEs as soon as they
+        arrive and pings RV after `keepalive_interval` seconds without
+        any traffic. Callers may keep using the connector meanwhile.
+
+        The thread stops when the connection is lost, without
+        reconnecting as RV may have quit or another session may listen
+        on the port by now. See `add_disconnect_callback`.
+
+        Args:
+            keepalive_interval: Seconds without traffic until RV is
+                pinged.
+            ping_timeout: Seconds to wait for the keepalive PONG.
+        """
+        if self._io_thread is not None and self._io_thread.is_alive():
+            return
+        self._io_stop = threading.Event()
+        self._io_thread = threading.Thread(
+            target=self._io_loop,
+            args=(self._io_stop, keepalive_interval, ping_timeout),
+            name=f"ayon-openrv-io-{self.name}",
+            daemon=True,
+        )
+        self._io_thread.start()
+
+    def stop_io_thread(self) -> None:
+        """Stop the I/O thread, waiting for it to finish."""
+        thread = self._io_thread
+        if thread is None:
+            return
+        self._io_stop.set()
+        self._io_thread = None
+        if thread is not threading.current_thread():
+            thread.join(IO_POLL_INTERVAL * 4)
+
+    @property
+    def has_io_thread(self) -> bool:
+        """Whether the background I/O thread is running."""
+        return self._io_thread is not None and self._io_thread.is_alive()
+
+    def _close(self) -> None:
         if self.is_connected and self._sock is not None:
+            timeout = get_close_timeout()
+            start = perf_counter()
             try:
-                self.send_message("DISCONNECT")
-                timeout = int(
-                    os.environ.get("AYON_RV_SOCKET_CLOSE_TIMEOUT", 100)
+                self._sendall(
+                    encode_frame("MESSAGE", "DISCONNECT"), "MESSAGE"
                 )
-                sleep(timeout / 1000)
+                self._sock.shutdown(socket.SHUT_WR)
+                self._wait_for_peer_close(timeout)
             except OSError:
                 pass  # Best effort disconnect message
+            self.metrics.observe_close(perf_counter() - start, timeout)
+            emit_metrics(
+                self.metrics, host=self.host, port=self.port, name=self.name
+            )
 
         if self._sock is not None:
             try:
@@ -241,12 +745,17 @@ class RVConnector:
 
             self._sock = None
 
+        self._close_selector()
         self.is_connected = False
+        self._fail_pending_events()
 
+    @_synchronized
     def receive_message(self) -> tuple[str, str | None]:
         """Receive a message from the socket.
 
-        Parses the RV protocol format: TYPE LENGTH DATA
+        Parses the RV protocol format: TYPE LENGTH DATA. Data is read
+        in bulk into the connection's receive buffer so any frames
+        following this one are served without touching the socket.
 
         Returns:
             Tuple of (message_type, message_data). Data may be None
@@ -259,34 +768,17 @@ class RVConnector:
             return (msg_type, msg_data)
 
         try:
-            # Read message type until space
-            while True:
-                char = self._sock.recv(1).decode("utf-8")
-                if char == " ":
-                    break
-                msg_type += char
-
-            # Read message length until space
-            length_str = ""
-            while True:
-                char = self._sock.recv(1).decode("utf-8")
-                if char == " ":
-                    break
-                length_str += char
-
-            # Read the actual message data
-            msg_length = int(length_str)
-            if msg_length > 0:
-                data_bytes = b""
-                while len(data_bytes) < msg_length:
-                    chunk = self._sock.recv(msg_length - len(data_bytes))
-                    if not chunk:
-                        break
-                    data_bytes += chunk
-                msg_data = data_bytes.decode("utf-8")
+            frame = self._reader.next_frame()
+            while frame is None:
+                if not self._fill():
+                    raise ConnectionResetError("Connection closed by RV")
+                frame = self._reader.next_frame()
+            msg_type, msg_data = frame
+            self.metrics.messages_received[msg_type] += 1
 
         except (OSError, ValueError) as err:
             log.error(f"Error receiving message: {err}", exc_info=True)
+            self._close()
 
         return (msg_type, msg_data)
 
@@ -296,75 +788,332 @@ class RVConnector:
             return
 
         greeting = f"{self.name} rvController"
-        cmd = f"NEWGREETING {len(greeting)} {greeting}"
         try:
-            self._sock.sendall(cmd.encode("utf-8"))
+            self._sendall(encode_frame("NEWGREETING", greeting), "NEWGREETING")
         except OSError:
             self.is_connected = False
 
     def process_message(self, data: str | None) -> None:
         """Process a received message.
 
+        Dispatches the message to callbacks registered with
+        `add_message_callback`.
+
         Args:
             data: The message data to process.
         """
         log.debug(f"process message: data={data}")
+        if data is None:
+            return
+        for callback in list(self._message_callbacks):
+            try:
+                callback(data)
+            except Exception:
+                log.error("RV message callback failed", exc_info=True)
 
-    def _wait_for_message(self, timeout: float = 0.1) -> bool:
+    def _io_loop(
+        self,
+        stop: threading.Event,
+        keepalive_interval: float,
+        ping_timeout: float,
+    ) -> None:
+        """Service the connection until `stop` is set or it is lost."""
+        while not stop.is_set():
+            sock = self._sock
+            selector = self._selector
+            if not self.is_connected or sock is None or selector is None:
+                self._on_io_disconnected(stop)
+                return
+
+            idle = monotonic() - self._last_activity
+            wait = min(max(0.0, keepalive_interval - idle), IO_POLL_INTERVAL)
+            try:
+                # Unlike select.select, not limited to descriptors < 1024
+                readable = bool(selector.select(wait))
+            except (OSError, ValueError):
+                # Connection was closed meanwhile
+                continue
+            if stop.is_set():
+                break
+
+            # Waits while a caller is busy with the connection, the
+            # caller then processes the incoming messages itself
+            with self._io_lock:
+                if self._sock is not sock:
+                    continue
+                if readable:
+                    while self._wait_for_message(timeout=0):
+                        self._handle_message(*self.receive_message())
+                elif monotonic() - self._last_activity >= keepalive_interval:
+                    if not self.ping(ping_timeout):
+                        log.debug("RV did not answer keepalive PING")
+                        self._close()
+
+    def _on_io_disconnected(self, stop: threading.Event) -> None:
+        log.debug("Connection to RV lost, stopping I/O thread")
+        stop.set()
+        if self._io_thread is threading.current_thread():
+            self._io_thread = None
+        for callback in list(self._disconnect_callbacks):
+            try:
+                callback(self)
+            except Exception:
+                log.error("Disconnect callback failed", exc_info=True)
+
+    def _wait_for_message(self, timeout: float | None = 0.1) -> bool:
         """Wait for a message to become available.
 
+        Blocks on socket readiness so it wakes up as soon as data
+        arrives and does not consume any CPU while idle.
+
         Args:
-            timeout: Maximum time to wait in seconds.
+            timeout: Maximum time to wait in seconds. None waits until
+                a message arrives or the connection is closed.
 
         Returns:
             True if message is available, False otherwise.
         """
-        start = time()
-        while time() - start < timeout:
-            if not self.is_connected:
+        deadline = None if timeout is None else monotonic() + timeout
+        while True:
+            try:
+                if self._reader.has_frame:
+                    return True
+            except ProtocolError as err:
+                # Framing of the stream is lost, it can't be recovered
+                log.error(f"Invalid data received from RV: {err}")
+                self._close()
+                return False
+            if (
+                not self.is_connected
+                or self._sock is None
+                or self._selector is None
+            ):
                 return False
-            if self.message_available:
-                return True
-            sleep(0.01)
-        return False
 
-    def _process_events(self, process_return_only: bool = False) -> str:
+            remaining = None
+            if deadline is not None:
+                remaining = max(0.0, deadline - monotonic())
+            if not self._selector.select(remaining):
+                return False
+
+            try:
+                received = self._fill()
+            except BlockingIOError:
+                continue
+            except OSError as err:
+                log.error(f"Error checking for message: {err}", exc_info=True)
+                self._close()
+                return False
+
+            if not received:
+                log.debug("Connection closed by RV")
+                self._close()
+                return False
+
+    @_synchronized
+    def _process_events(
+        self,
+        process_return_only: bool = False,
+        timeout: float | None = None,
+    ) -> str:
         """Process incoming events from RV.
 
         Args:
             process_return_only: If True, only process RETURN events
                 and return immediately upon receiving one.
+            timeout: Maximum time in seconds to wait for the RETURN
+                event. None waits until it arrives or the connection
+                is closed. Ignored unless `process_return_only` is set,
+                otherwise only already pending events are processed.
 
         Returns:
             The return value for RETURN events, empty string otherwise.
         """
+        deadline = None
+        if process_return_only and timeout is not None:
+            deadline = monotonic() + timeout
+
         while self.is_connected:
-            if not self._wait_for_message(timeout=0.1):
-                if not process_return_only:
+            if not process_return_only:
+                wait = 0.1
+            elif deadline is None:
+                wait = None
+            else:
+                wait = max(0.0, deadline - monotonic())
+
+            if not self._wait_for_message(timeout=wait):
+                if not process_return_only or wait is not None:
                     break
                 continue
 
             resp_type, resp_data = self.receive_message()
-            log.debug(f"Received message: {resp_type}: {resp_data}")
-
-            if resp_type == "MESSAGE":
-                if resp_data == "DISCONNECT":
-                    self.close()
-                    return ""
-                self.process_message(resp_data)
-
-            elif resp_type == "PING":
-                if self._sock is not None:
-                    try:
-                        self._sock.sendall(b"PONG 1 p")
-                    except OSError:
-                        pass
-
-            elif resp_type == "RETURN" and process_return_only:
+            if (
+                resp_type == "RETURN"
+                and process_return_only
+                and not self._unclaimed_returns
+                and decode_rpc_return(resp_data) is None
+            ):
                 return resp_data or ""
+            self._handle_message(resp_type, resp_data)
 
         return ""
 
+    def _handle_message(self, resp_type: str, resp_data: str | None) -> None:
+        """Handle a received message other than an awaited RETURN.
+
+        Args:
+            resp_type: The message type.
+            resp_data: The message data.
+        """
+        log.debug(f"Received message: {resp_type}: {resp_data}")
+
+        if resp_type == "MESSAGE":
+            if resp_data == "DISCONNECT":
+                self._close()
+                return
+            self.process_message(resp_data)
+
+        elif resp_type == "PING":
+            if self._sock is not None:
+                try:
+                    self._sendall(b"PONG 1 p", "PONG")
+                    self.metrics.pings_answered += 1
+                except OSError:
+                    pass
+
+        elif resp_type == "RETURN":
+            self._resolve_pipelined_event(resp_data)
+
+    def _resolve_pipelined_event(self, data: str | None) -> None:
+        """Resolve the pipelined request the RETURN belongs to."""
+        rpc_return = decode_rpc_return(data)
+        if rpc_return is None:
+            # RETURN of an event sent with `shall_return=False`
+            self._count_unclaimed_returns(-1)
+            return
+
+        request_id, result = rpc_return
+        pending = self._pending_events.pop(request_id, None)
+        if pending is None:
+            log.warning(f"RETURN for unknown request id {request_id}")
+            return
+
+        future, start = pending
+        self.metrics.round_trip.observe(perf_counter() - start)
+        if future.set_running_or_notify_cancel():
+            future.set_result(result)
+
+    def _count_unclaimed_returns(self, delta: int) -> None:
+        with self._unclaimed_returns_lock:
+            self._unclaimed_returns = max(0, self._unclaimed_returns + delta)
+
+    def _on_unclaimed_event_written(self, written: Future) -> None:
+        if written.exception() is not None:
+            # Dropped or failed, its RETURN will never arrive
+            self._count_unclaimed_returns(-1)
+
+    def _on_events_written(
+        self, request_ids: list[int], written: Future
+    ) -> None:
+        error = written.exception()
+        if error is not None:
+            self._fail_events(request_ids, error)
+
+    def _fail_events(
+        self, request_ids: Iterable[int], error: BaseException
+    ) -> None:
+        """Fail pipelined requests whose frames were not written."""
+        for request_id in request_ids:
+            pending = self._pending_events.pop(request_id, None)
+            if pending is not None and not pending[0].done():
+                pending[0].set_exception(error)
+
+    def _fail_pending_events(self) -> None:
+        """Fail all pipelined requests, e.g. when the connection is lost."""
+        pending = self._pending_events
+        self._pending_events = {}
+        for future, _ in pending.values():
+            if future.set_running_or_notify_cancel():
+                future.set_exception(ConnectionError("Connection to RV lost"))
+
+    def _wait_for_peer_close(self, timeout: float) -> bool:
+        """Wait until RV closes its side of the connection.
+
+        Anything RV still sends meanwhile is discarded.
+
+        Args:
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            True if RV closed the connection in time.
+        """
+        if self._sock is None or self._selector is None:
+            return False
+
+        deadline = monotonic() + timeout
+        while True:
+            remaining = deadline - monotonic()
+            if remaining <= 0 or not self._selector.select(remaining):
+                return False
+            try:
+                if not self._fill():
+                    return True
+            except BlockingIOError:
+                continue
+            self._reader.reset()
+
+    def _sendall(self, data: bytes, msg_type: str, count: int = 1) -> None:
+        """Send encoded frames and record them in the metrics.
+
+        Args:
+            data: Encoded frames.
+            msg_type: Message type of the frames.
+            count: Number of frames in `data`.
+
+        Raises:
+            OSError: If sending failed.
+        """
+        with self._write_lock:
+            self.sock.sendall(data)
+        self._last_activity = monotonic()
+        self.metrics.observe_sent(msg_type, len(data), count)
+
+    def _write_frames(self, data: bytes, count: int) -> None:
+        """Write frames coalesced by the writer thread."""
+        self._sendall(data, "MESSAGE", count)
+        self.metrics.send_batches += 1
+
+    def _on_write_error(self, error: BaseException) -> None:
+        log.warning(f"Sending queued messages to RV failed: {error}")
+        sock = self._sock
+        if sock is not None:
+            # Reading then notices the connection is gone and closes it,
+            # without the writer thread waiting for the I/O lock
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+    def _on_messages_dropped(self, count: int) -> None:
+        self.metrics.messages_dropped += count
+        log.warning(f"Dropped {count} messages from full send queue")
+
+    def _fill(self) -> int:
+        """Receive available data into the frame reader.
+
+        Returns:
+            Number of received bytes, 0 when RV closed the connection.
+        """
+        received = self._reader.fill(self.sock)
+        self._last_activity = monotonic()
+        self.metrics.bytes_received += received
+        return received
+
+    def _close_selector(self) -> None:
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+
     def _connect_socket(self) -> None:
         """Create and connect a new socket to RV.
 
@@ -372,6 +1121,7 @@ class RVConnector:
         reuse issues with failed connections.
         """
         # Close existing socket if any
+        self._close_selector()
         if self._sock is not None:
             try:
                 self._sock.close()
@@ -380,16 +1130,20 @@ class RVConnector:
             self._sock = None
 
         # Create fresh socket
-        self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        self._sock.settimeout(5.0)
+        self._reader.reset()
+        self._unclaimed_returns = 0
 
+        start = perf_counter()
         try:
-            self._sock.connect((self.host, self.port))
+            self._sock = self._open_socket()
             self._send_initial_greeting()
-            self._sock.sendall(b"PINGPONGCONTROL 1 0")
+            self._sendall(b"PINGPONGCONTROL 1 0", "PINGPONGCONTROL")
+            self._selector = selectors.DefaultSelector()
+            self._selector.register(self._sock, selectors.EVENT_READ)
             self.is_connected = True
         except OSError as err:
             log.debug(f"Connection failed: {err}")
+            self.metrics.observe_connect_failure()
             self.is_connected = False
             # Clean up failed socket
             if self._sock is not None:
@@ -399,20 +1153,56 @@ class RVConnector:
                     pass
                 self._sock = None
         else:
+            self.metrics.observe_connect(perf_counter() - start)
             log.info(
                 f"Connected with: host={self.host}, "
                 f"port={self.port}, name={self.name} "
                 f"in {self._elapsed:.1f}sec. after {self._attempts} attempts."
+                f" transport={self.active_transport}"
             )
 
+    def _open_socket(self) -> socket.socket:
+        """Connect with the first transport which succeeds.
+
+        Returns:
+            The connected socket.
+
+        Raises:
+            OSError: If none of the transports could connect.
+        """
+        transports = (
+            [self.transport]
+            if self.transport is not None
+            else get_transports(self.host, self.port)
+        )
+        error: OSError | None = None
+        for transport in transports:
+            try:
+                sock = transport.connect(timeout=5.0)
+            except OSError as err:
+                log.debug(f"Connection with {transport} failed: {err}")
+                error = err
+                continue
+            self.active_transport = transport
+            return sock
+        raise error or ConnectionError("No transport to connect with")
+
 
 class LoadContainerHandler:
     """Handles loading containers from RV events.
 
     Processes ayon_load_container events to load representations
-    using appropriate loader plugins.
+    using appropriate loader plugins. Large requests arrive as
+    ayon_load_container_chunk events, representations of each chunk
+    are loaded as soon as it arrives.
     """
 
+    event_name = "ayon_load_container"
+    chunk_event_name = "ayon_load_container_chunk"
+
+    # Chunked transfers in progress, shared by all events
+    reassembler = ChunkReassembler()
+
     def __init__(self, event: Any) -> None:
         """Initialize the handler with an event.
 
@@ -422,7 +1212,7 @@ class LoadContainerHandler:
         Raises:
             ValueError: If event is not an ayon_load_container event.
         """
-        if event.name() != "ayon_load_container":
+        if event.name() not in {self.event_name, self.chunk_event_name}:
             raise ValueError(
                 f"LoadContainerHandler called on wrong event: {event}"
             )
@@ -434,12 +1224,60 @@ class LoadContainerHandler:
         Loads representations based on their file types using
         appropriate loader plugins.
         """
-        event_data: dict = json.loads(self.event.contents())
-        project_name = get_current_project_name()
+        event_data = self.get_event_data()
+        if event_data:
+            self.load_representations(event_data)
+
+    def get_event_data(self) -> list[dict]:
+        """Return the items of the event.
+
+        Chunks of a chunked transfer return the items which are ready in
+        order of the transfer, possibly none.
+
+        Returns:
+            Items with "representation" id and "objectName".
+        """
+        if self.event.name() != self.chunk_event_name:
+            return json.loads(self.event.contents())
+
+        event_data, finished = self.reassembler.feed(self.event.contents())
+        if finished:
+            log.debug("Received last chunk of ayon_load_container")
+        return event_data
+
+    def load_representations(self, event_data: list[dict]) -> None:
+        """Load representations listed in the event data.
+
+        Args:
+            event_data: Items with "representation" id and "objectName".
+        """
+        for loader, context, options in self.prepare_loads(event_data):
+            self.apply_load(loader, context, options)
+
+    @staticmethod
+    def prepare_loads(
+        event_data: list[dict],
+        project_name: str | None = None,
+    ) -> list[tuple[Any, dict, dict]]:
+        """Query everything needed to load the representations.
+
+        Only talks to the server and resolves paths, nothing touches the
+        RV session, so it may run off the main thread.
+
+        Args:
+            event_data: Items with "representation" id and "objectName".
+            project_name: Name of the project, the current one by
+                default.
+
+        Returns:
+            Loader, representation context and load options of each
+            representation which can be loaded, see `apply_load`.
+        """
+        project_name = project_name or get_current_project_name()
 
         if project_name is None:
             log.error("No current project name available")
-            return
+            return []
 
         representation_ids = [
             event["representation"]
@@ -448,81 +1286,39 @@ class LoadContainerHandler:
         ]
         log.debug(f"representation_ids: {representation_ids}")
 
-        repre_entities = get_representations(
-            project_name=project_name, representation_ids=representation_ids
-        )
-
-        available_loaders = discover_loader_plugins(project_name)
-
-        frames_loader_plugin = next(
-            (
-                loader
-                for loader in available_loaders
-                if loader.__name__ == "FramesLoader"
-            ),
-            None,
-        )
-        mov_loader_plugin = next(
-            (
-                loader
-                for loader in available_loaders
-                if loader.__name__ == "MovLoader"
-            ),
-            None,
+        repre_entities = list(
+            get_representations(
+                project_name=project_name,
+                representation_ids=representation_ids,
+            )
         )
+        # Resolve all paths against one anatomy, loaders reuse them
+        paths = resolve_representation_paths(project_name, repre_entities)
+        contexts = get_representation_contexts(project_name, repre_entities)
 
-        if frames_loader_plugin is None:
-            log.warning("FramesLoader plugin not found")
-        if mov_loader_plugin is None:
-            log.warning("MovLoader plugin not found")
-
+        registry = get_loader_registry(project_name)
+        loads = []
         for repre in repre_entities:
-            filepath = get_representation_path(repre)
-            extension = os.path.splitext(filepath)[1].lstrip(".").lower()
-
-            self._load_by_extension(
-                repre,
-                extension,
-                project_name,
-                frames_loader_plugin,
-                mov_loader_plugin,
-            )
+            filepath = paths.get(repre["id"])
+            context = contexts.get(repre["id"])
+            if filepath is None or context is None:
+                continue
+            extension = os.path.splitext(filepath)[1]
 
-    def _load_by_extension(
-        self,
-        repre: Any,
-        extension: str,
-        project_name: str,
-        frames_loader: Any | None,
-        mov_loader: Any | None,
-    ) -> None:
-        """Load a representation using the appropriate loader.
+            loader = registry.get_loader_for_extension(extension)
+            if loader is None:
+                log.warning(f"No loader found for extension: {extension}")
+                continue
+            loads.append((loader, context, get_loader_options(filepath)))
+        return loads
+
+    @staticmethod
+    def apply_load(loader: Any, context: dict, options: dict) -> None:
+        """Load a representation into the session, on the main thread.
 
         Args:
-            repre: The representation entity.
-            extension: The file extension (without dot).
-            project_name: The current project name.
-            frames_loader: The frames loader plugin, if available.
-            mov_loader: The mov loader plugin, if available.
-        """
-        # Check image extensions
-        if frames_loader is not None:
-            for ext in IMAGE_EXTENSIONS:
-                ext = ext.lstrip(".")
-                if ext == extension:
-                    load_container(
-                        frames_loader, repre, project_name=project_name
-                    )
-                    return
-
-        # Check video extensions
-        if mov_loader is not None:
-            for ext in VIDEO_EXTENSIONS:
-                ext = ext.lstrip(".")
-                if ext == extension:
-                    load_container(
-                        mov_loader, repre, project_name=project_name
-                    )
-                    return
-
-        log.warning(f"No loader found for extension: {extension}")
+            loader: The loader plugin.
+            context: Representation context.
+            options: Load options.
+        """
+        load_with_repre_context(loader, context, options=options)
@@ -0,0 +1,97 @@
+"""Resolve file paths of many representations at once.
+
+`get_representation_path` and `LoaderPlugin.filepath_from_context` set
+up the project anatomy and its roots on every call. Batches resolve all
+paths against a single `Anatomy` instead and hand each path to its
+loader through the load options, see `get_loader_filepath`.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ayon_core.lib import Logger
+from ayon_core.pipeline import Anatomy
+from ayon_core.pipeline.load import get_representation_path_with_anatomy
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import Any
+
+log = Logger.get_logger(__name__)
+
+# Load option holding the path resolved in advance
+RESOLVED_PATH_OPTION = "ayon_openrv_filepath"
+
+
+def resolve_representation_paths(
+    project_name: str,
+    repre_entities: Iterable[dict[str, Any]],
+    anatomy: Anatomy | None = None,
+) -> dict[str, str]:
+    """Resolve file paths of representations of a project.
+
+    Representations whose path can't be resolved are logged and left
+    out of the result.
+
+    Args:
+        project_name: Name of the project.
+        repre_entities: Representation entities.
+        anatomy: Anatomy of the project, created once if not passed.
+
+    Returns:
+        Resolved path by representation id.
+    """
+    if anatomy is None:
+        anatomy = Anatomy(project_name)
+
+    paths = {}
+    for repre in repre_entities:
+        try:
+            paths[repre["id"]] = get_representation_path_with_anatomy(
+                repre, anatomy
+            )
+        except Exception as err:
+            log.warning(
+                f"Failed to resolve path of representation {repre['id']}:"
+                f" {err}"
+            )
+    return paths
+
+
+def get_loader_options(filepath: str | None) -> dict[str, Any]:
+    """Return load options handing a resolved path to the loader.
+
+    Args:
+        filepath: Path resolved in advance, None lets the loader
+            resolve it.
+
+    Returns:
+        Options for `load_container`.
+    """
+    if filepath is None:
+        return {}
+    return {RESOLVED_PATH_OPTION: filepath}
+
+
+def get_loader_filepath(
+    loader: Any,
+    context: dict[str, Any],
+    options: dict[str, Any] | None,
+) -> str:
+    """Return the path a loader loads.
+
+    Args:
+        loader: The loader plugin instance.
+        context: Representation context passed to the loader.
+        options: Load options passed to the loader.
+
+    Returns:
+        The path resolved in advance if passed in `options`, otherwise
+        resolved from the context.
+    """
+    if options:
+        filepath = options.get(RESOLVED_PATH_OPTION)
+        if filepath:
+            return filepath
+    return loader.filepath_from_context(context)
@@ -1,4 +1,5 @@
 import json
+import time
 
 import ayon_api
 from ayon_applications import ApplicationManager
@@ -9,7 +10,10 @@ from ayon_core.lib.transcoding import (
 from ayon_core.pipeline import load
 from ayon_core.pipeline.load import LoadError
 
-from ayon_openrv.networking import RVConnector
+from ayon_openrv.connection_pool import get_connection_pool
+from ayon_openrv.networking import LoadContainerHandler
+from ayon_openrv.readiness import READY_ADDRESS_KEY, ReadinessListener
+from ayon_openrv.settings_cache import get_settings_cache
 
 
 class PlayInRV(load.LoaderPlugin):
@@ -17,6 +21,9 @@ class PlayInRV(load.LoaderPlugin):
 
     Could be run from Loader in DCC or outside.
     It expects to be run only on representations published to any task!
+
+    Selected products are opened with a single event by
+    `PlayProductsInRV`.
     """
 
     product_types = {"*"}
@@ -31,47 +38,119 @@ class PlayInRV(load.LoaderPlugin):
     icon = "play-circle"
     color = "orange"
 
+    # Batches with more representations are sent in chunks
+    chunk_threshold = 500
+    compress_chunks = False
+
     def load(self, context, name, namespace, data):
-        rvcon = RVConnector()
-        if not rvcon.is_connected:
-            # get launch context variables
-            project_name, folder_path, task_name = (
-                self._get_launch_context(context)
-            )
-            # launch RV with context
-            app_manager = ApplicationManager()
-            openrv_app = app_manager.find_latest_available_variant_for_group(
-                "openrv"
-            )
-            if not openrv_app:
-                raise LoadError(
-                    "No configured OpenRV found in"
-                    " Applications. Ask admin to configure it"
-                    " in ayon+settings://applications/applications/openrv."
+        # Fetch connection settings while the application is looked up
+        get_settings_cache().prefetch()
+        self.load_batch([context])
+
+    def load_batch(self, contexts):
+        """Open multiple representations in RV with a single event.
+
+        Launches RV with the context of the first representation if no
+        RV session is listening and connects as soon as the launched
+        session reports it is ready.
+
+        Args:
+            contexts (list[dict]): Representation contexts to open.
+        """
+        with get_connection_pool().connection() as rvcon:
+            if not rvcon.is_connected:
+                openrv_app = self._find_openrv_app()
+                self._launch_openrv_and_wait(rvcon, contexts[0], openrv_app)
+
+            items = [
+                {
+                    "objectName": context["representation"]["name"],
+                    "representation": context["representation"]["id"],
+                }
+                for context in contexts
+            ]
+            if len(items) > self.chunk_threshold:
+                rvcon.send_chunked_event(
+                    LoadContainerHandler.chunk_event_name,
+                    items,
+                    compress=self.compress_chunks,
+                )
+            else:
+                rvcon.send_event(
+                    LoadContainerHandler.event_name,
+                    json.dumps(items),
+                    shall_return=False
                 )
-            openrv_app.launch(
-                project_name=project_name,
-                folder_path=folder_path,
-                task_name=task_name,
-                # Enforce the `-network` argument so that RV allows receiving
-                # the event we will send it. Note that passing `-network`
-                # multiple times seems fine, so if app arguments or a
-                # pre-launch hook may be enforcing it as well it should not
-                # cause any issues.
-                app_args=["-network"],
-            )
 
-        payload = json.dumps([{
-            "objectName": context["representation"]["name"],
-            "representation": context["representation"]["id"],
-        }])
-        # This also retries the connection
-        with rvcon:
-            rvcon.send_event(
-                "ayon_load_container",
-                payload,
-                shall_return=False
+    def _find_openrv_app(self):
+        app_manager = ApplicationManager()
+        openrv_app = app_manager.find_latest_available_variant_for_group(
+            "openrv"
+        )
+        if not openrv_app:
+            raise LoadError(
+                "No configured OpenRV found in"
+                " Applications. Ask admin to configure it"
+                " in ayon+settings://applications/applications/openrv."
             )
+        return openrv_app
+
+    def _launch_openrv_and_wait(self, rvcon, context, openrv_app):
+        """Launch RV and wait until it is ready to receive events.
+
+        Returns as soon as the launched session reports readiness. The
+        connection is still retried with backoff meanwhile, in case the
+        session can't report it, e.g. when started without AYON menus.
+
+        Raises:
+            ConnectionError: If no connection was made within the
+                timeout from addon settings.
+        """
+        timeout = float(rvcon.get_settings()["network"]["timeout"])
+        with ReadinessListener() as listener:
+            start = time.monotonic()
+            deadline = start + timeout
+            self._launch_openrv(context, openrv_app, listener.address)
+
+            delay = 0.1
+            while not rvcon.is_connected:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise ConnectionError(
+                        f"Timeout after {timeout:.1f}s connecting to the"
+                        f" launched RV. host={rvcon.host},"
+                        f" port={rvcon.port}, name={rvcon.name}"
+                    )
+                if listener.is_ready:
+                    # Reported readiness but refused the connection
+                    time.sleep(min(delay, remaining))
+                elif listener.wait(min(delay, remaining)):
+                    self.log.debug(
+                        "RV reported readiness after "
+                        f"{time.monotonic() - start:.2f}s"
+                    )
+                rvcon.connect()
+                delay = min(delay * 2, 2.0)
+
+    def _launch_openrv(self, context, openrv_app, ready_address=None):
+        # get launch context variables
+        project_name, folder_path, task_name = (
+            self._get_launch_context(context)
+        )
+        # launch RV with context
+        openrv_app.launch(
+            project_name=project_name,
+            folder_path=folder_path,
+            task_name=task_name,
+            # Enforce the `-network` argument so that RV allows receiving
+            # the event we will send it. Note that passing `-network`
+            # multiple times seems fine, so if app arguments or a
+            # pre-launch hook may be enforcing it as well it should not
+            # cause any issues.
+            app_args=["-network"],
+            # Passed to RV by the `PreReadinessNotification` hook
+            **{READY_ADDRESS_KEY: ready_address},
+        )
 
     def _get_launch_context(self, context):
         # get launch context variables
@@ -110,3 +189,61 @@ class PlayInRV(load.LoaderPlugin):
         if task_entity:
             task_name = task_entity["name"]
         return project_name, folder_path, task_name
+
+
+class PlayProductsInRV(PlayInRV, load.ProductLoaderPlugin):
+    """Opens all selected products in OpenRV with a single event
+
+    The Loader passes the whole selection at once. A representation RV
+    can play is picked for each selected version, all of them queried
+    in one request, and they are opened with one connection, see
+    `PlayInRV.load_batch`.
+    """
+
+    is_multiple_contexts_compatible = True
+
+    label = "Open products in RV"
+    order = -9
+
+    def load(self, context, name=None, namespace=None, options=None):
+        get_settings_cache().prefetch()
+        # Selection of multiple products is passed as a list
+        contexts = context if isinstance(context, list) else [context]
+        repre_contexts = self._get_representation_contexts(contexts)
+        if not repre_contexts:
+            raise LoadError(
+                "Selected products have no representation to open in RV."
+            )
+        self.load_batch(repre_contexts)
+
+    def _get_representation_contexts(self, contexts):
+        """Return a context of a playable representation per version.
+
+        Versions without a representation of supported extension are
+        skipped.
+        """
+        project_name = contexts[0]["project"]["name"]
+        version_ids = {context["version"]["id"] for context in contexts}
+        repres_by_version_id = {}
+        for repre_entity in ayon_api.get_representations(
+            project_name, version_ids=version_ids
+        ):
+            ext = repre_entity["context"].get("ext") or ""
+            if ext.lstrip(".").lower() in self.extensions:
+                repres_by_version_id.setdefault(
+                    repre_entity["versionId"], repre_entity
+                )
+
+        repre_contexts = []
+        for context in contexts:
+            repre_entity = repres_by_version_id.get(context["version"]["id"])
+            if repre_entity is None:
+                self.log.warning(
+                    "No representation to open in RV found for"
+                    f" {context['product']['name']}"
+                )
+                continue
+            repre_contexts.append(
+                dict(context, representation=repre_entity)
+            )
+        return repre_contexts
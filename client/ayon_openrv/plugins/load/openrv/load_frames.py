@@ -11,7 +11,14 @@ from ayon_openrv.api.ocio import (
     set_group_ocio_active_state,
     set_group_ocio_colorspace,
 )
-from ayon_openrv.api.pipeline import imprint_container
+from ayon_openrv.api.lib import reload_sources
+from ayon_openrv.api.pipeline import (
+    AYON_ATTR_PREFIX,
+    get_container_index,
+    imprint,
+    imprint_container,
+)
+from ayon_openrv.path_resolver import get_loader_filepath
 
 import rv
 
@@ -37,7 +44,7 @@ class FramesLoader(load.LoaderPlugin):
     ) -> None:
         """Load the frames into OpenRV."""
         filepath = rv.commands.sequenceOfFile(
-            self.filepath_from_context(context),
+            get_loader_filepath(self, context, options),
         )[0]
 
         rep_name = os.path.basename(filepath)
@@ -112,7 +119,7 @@ class FramesLoader(load.LoaderPlugin):
 
         rv.commands.setStringProperty(f"{node}.media.name", [rep_name], True)
 
-        rv.commands.reload()
+        reload_sources()
         return node
 
     def update(self, container: dict, context: dict) -> None:
@@ -149,12 +156,13 @@ class FramesLoader(load.LoaderPlugin):
         self.set_representation_colorspace(node, context["representation"])
 
         # add data for inventory manager
-        rv.commands.setStringProperty(
-            f"{node}.ayon.representation",
-            [repre_entity["id"]],
-            True,
+        imprint(
+            node,
+            {"representation": repre_entity["id"]},
+            prefix=AYON_ATTR_PREFIX,
         )
-        rv.commands.reload()
+        get_container_index().invalidate(node)
+        reload_sources()
 
     def remove(self, container: dict) -> None:  # noqa: PLR6301
         """Remove loaded container."""
@@ -176,7 +184,7 @@ class FramesLoader(load.LoaderPlugin):
                 self.log.info(f"Removing: {source_node_name}")
                 rv.commands.deleteNode(node_group)
 
-        rv.commands.reload()
+        reload_sources()
         # switch node is child of some other node. find its parent node
         parent_node = rv.commands.nodeGroup(switch_node)
         if parent_node:
@@ -9,7 +9,14 @@ from ayon_openrv.api.ocio import (
     set_group_ocio_active_state,
     set_group_ocio_colorspace,
 )
-from ayon_openrv.api.pipeline import imprint_container
+from ayon_openrv.api.lib import reload_sources
+from ayon_openrv.api.pipeline import (
+    AYON_ATTR_PREFIX,
+    get_container_index,
+    imprint,
+    imprint_container,
+)
+from ayon_openrv.path_resolver import get_loader_filepath
 
 
 class MovLoader(load.LoaderPlugin):
@@ -31,7 +38,7 @@ class MovLoader(load.LoaderPlugin):
         namespace: str | None = None,
         options: dict | None = None,
     ) -> None:
-        filepath = self.filepath_from_context(context)
+        filepath = get_loader_filepath(self, context, options)
         namespace = namespace if namespace else context["folder"]["name"]
         rep_name = os.path.basename(filepath)
 
@@ -99,7 +106,7 @@ class MovLoader(load.LoaderPlugin):
 
         rv.commands.setStringProperty(f"{node}.media.name", [rep_name], True)
 
-        rv.commands.reload()
+        reload_sources()
         return node
 
     def update(self, container, context):
@@ -132,12 +139,13 @@ class MovLoader(load.LoaderPlugin):
         self.set_representation_colorspace(node, representation)
 
         # add data for inventory manager
-        rv.commands.setStringProperty(
-            f"{node}.ayon.representation",
-            [repre_entity["id"]],
-            True,
+        imprint(
+            node,
+            {"representation": repre_entity["id"]},
+            prefix=AYON_ATTR_PREFIX,
         )
-        rv.commands.reload()
+        get_container_index().invalidate(node)
+        reload_sources()
 
     def remove(self, container):
         node = container["node"]
@@ -155,7 +163,7 @@ class MovLoader(load.LoaderPlugin):
                 self.log.warning(f">> source_node_name: {source_node_name}")
                 rv.commands.deleteNode(node_group)
 
-        rv.commands.reload()
+        reload_sources()
 
     def set_representation_colorspace(self, node, representation):
         colorspace_data = representation.get("data", {}).get("colorspaceData")
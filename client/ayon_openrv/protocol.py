@@ -0,0 +1,261 @@
+"""RV network protocol framing.
+
+RV's network interface exchanges frames in the form ``TYPE LENGTH DATA``
+where ``TYPE`` is the message kind (``MESSAGE``, ``RETURN``, ``PING``...),
+``LENGTH`` the byte size of ``DATA`` and both header fields are terminated
+by a single space.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import socket
+
+# Header is "TYPE LENGTH " - anything longer is garbage on the wire
+MAX_HEADER_SIZE = 64
+
+
+class ProtocolError(ValueError):
+    """Error raised when the received data is not a valid RV frame."""
+
+
+def encode_frame(msg_type: str, data: str) -> bytes:
+    """Encode a single protocol frame.
+
+    Args:
+        msg_type: The message type, e.g. "MESSAGE".
+        data: The message data.
+
+    Returns:
+        The encoded frame ready to be sent.
+    """
+    payload = data.encode("utf-8")
+    return b"%s %d %s" % (msg_type.encode("ascii"), len(payload), payload)
+
+
+class FrameReader:
+    """Buffered parser of ``TYPE LENGTH DATA`` frames.
+
+    Keeps one receive buffer per connection which is filled with bulk
+    ``recv_into`` calls. Complete frames are sliced out of the buffer
+    through memoryviews so the payload is decoded straight from the
+    receive buffer without intermediate copies.
+
+    Args:
+        chunk_size: Minimum free space requested from the socket on
+            each fill.
+    """
+
+    def __init__(self, chunk_size: int = 65536) -> None:
+        self._chunk_size = chunk_size
+        self._buffer = bytearray(chunk_size)
+        # Valid data lives in `_buffer[_start:_end]`
+        self._start = 0
+        self._end = 0
+
+    @property
+    def pending(self) -> int:
+        """Number of buffered bytes which were not consumed yet."""
+        return self._end - self._start
+
+    @property
+    def has_frame(self) -> bool:
+        """Whether a complete frame is waiting in the buffer."""
+        return self._frame_bounds() is not None
+
+    def reset(self) -> None:
+        """Drop all buffered data, e.g. after reconnecting."""
+        self._start = 0
+        self._end = 0
+
+    def fill(self, sock: socket.socket) -> int:
+        """Receive available data from the socket into the buffer.
+
+        Args:
+            sock: Connected socket to read from.
+
+        Returns:
+            Number of received bytes, 0 when the peer closed the
+            connection.
+        """
+        self._reserve(self._chunk_size)
+        with memoryview(self._buffer) as view:
+            received = sock.recv_into(view[self._end:])
+        self._end += received
+        return received
+
+    def feed(self, data: bytes) -> None:
+        """Append already received data to the buffer.
+
+        Args:
+            data: Raw bytes received from the peer.
+        """
+        size = len(data)
+        self._reserve(size)
+        self._buffer[self._end:self._end + size] = data
+        self._end += size
+
+    def next_frame(self) -> tuple[str, str] | None:
+        """Pop the next complete frame from the buffer.
+
+        Returns:
+            Tuple of (message_type, message_data) or None if the buffer
+            does not contain a complete frame yet.
+
+        Raises:
+            ProtocolError: If the buffered data is not a valid frame.
+        """
+        bounds = self._frame_bounds()
+        if bounds is None:
+            return None
+
+        type_end, data_start, data_end = bounds
+        with memoryview(self._buffer) as view:
+            msg_type = str(view[self._start:type_end], "ascii")
+            msg_data = str(view[data_start:data_end], "utf-8")
+
+        self._start = data_end
+        if self._start == self._end:
+            # Everything consumed - rewind without moving any data
+            self._start = self._end = 0
+        return (msg_type, msg_data)
+
+    def _frame_bounds(self) -> tuple[int, int, int] | None:
+        """Locate the next frame in the buffer.
+
+        Returns:
+            Tuple of (type_end, data_start, data_end) offsets or None if
+            the frame is not complete yet.
+
+        Raises:
+            ProtocolError: If the header is malformed.
+        """
+        buffer = self._buffer
+        header_limit = min(self._end, self._start + MAX_HEADER_SIZE)
+        type_end = buffer.find(b" ", self._start, header_limit)
+        if type_end < 0:
+            self._check_header_size()
+            return None
+
+        length_end = buffer.find(b" ", type_end + 1, header_limit)
+        if length_end < 0:
+            self._check_header_size()
+            return None
+
+        try:
+            length = int(buffer[type_end + 1:length_end])
+        except ValueError:
+            raise ProtocolError(
+                "Invalid frame length: "
+                f"{bytes(buffer[type_end + 1:length_end])!r}"
+            ) from None
+        if length < 0:
+            raise ProtocolError(f"Invalid frame length: {length}")
+
+        data_start = length_end + 1
+        data_end = data_start + length
+        if data_end > self._end:
+            # Make room for the whole payload so it arrives in bulk
+            self._reserve(data_end - self._end)
+            return None
+        return (type_end, data_start, data_end)
+
+    def _check_header_size(self) -> None:
+        if self.pending >= MAX_HEADER_SIZE:
+            raise ProtocolError(
+                "Frame header exceeds "
+                f"{MAX_HEADER_SIZE} bytes: "
+                f"{bytes(self._buffer[self._start:self._start + 16])!r}"
+            )
+
+    def _reserve(self, size: int) -> None:
+        """Ensure there is room for `size` more bytes after the data."""
+        free = len(self._buffer) - self._end
+        if free >= size:
+            return
+
+        pending = self.pending
+        if self._start:
+            # Move the unconsumed tail to the front of the buffer
+            self._buffer[:pending] = self._buffer[self._start:self._end]
+            self._start = 0
+            self._end = pending
+            free = len(self._buffer) - self._end
+            if free >= size:
+                return
+
+        grow = max(size - free, len(self._buffer))
+        self._buffer.extend(bytes(grow))
+
+
+# Pipelined RETURNEVENTs are wrapped into an envelope carrying a request id
+# which RV echoes back in the RETURN, see `ayon_menus.on_ayon_rpc`.
+RPC_EVENT = "ayon-rpc"
+RPC_RETURN_PREFIX = "ayon-rpc "
+
+
+def encode_rpc_request(
+    request_id: int, event_name: str, event_contents: str
+) -> str:
+    """Wrap event contents into a pipelined request envelope.
+
+    Args:
+        request_id: Id echoed back by RV with the result.
+        event_name: Name of the event to dispatch in RV.
+        event_contents: Contents of the event.
+
+    Returns:
+        Contents for a RETURNEVENT of `RPC_EVENT`.
+    """
+    return f"{request_id} {event_name} {event_contents}"
+
+
+def decode_rpc_request(data: str) -> tuple[int, str, str]:
+    """Unwrap a pipelined request envelope.
+
+    Args:
+        data: Contents of the `RPC_EVENT` event.
+
+    Returns:
+        Tuple of (request_id, event_name, event_contents).
+
+    Raises:
+        ProtocolError: If the envelope is malformed.
+    """
+    parts = data.split(" ", 2)
+    if len(parts) < 2:
+        raise ProtocolError(f"Invalid request envelope: {data[:64]!r}")
+    request_id, event_name = parts[:2]
+    event_contents = parts[2] if len(parts) > 2 else ""
+    try:
+        return (int(request_id), event_name, event_contents)
+    except ValueError:
+        raise ProtocolError(
+            f"Invalid request id in envelope: {request_id!r}"
+        ) from None
+
+
+def encode_rpc_return(request_id: int, result: str) -> str:
+    """Wrap the result of a pipelined request for the RETURN."""
+    return f"{RPC_RETURN_PREFIX}{request_id} {result}"
+
+
+def decode_rpc_return(data: str | None) -> tuple[int, str] | None:
+    """Unwrap the RETURN of a pipelined request.
+
+    Args:
+        data: Data of a RETURN message.
+
+    Returns:
+        Tuple of (request_id, result) or None if the RETURN does not
+        belong to a pipelined request.
+    """
+    if not data or not data.startswith(RPC_RETURN_PREFIX):
+        return None
+    request_id, _, result = data[len(RPC_RETURN_PREFIX):].partition(" ")
+    try:
+        return (int(request_id), result)
+    except ValueError:
+        return None
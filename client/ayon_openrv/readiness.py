@@ -0,0 +1,150 @@
+"""Readiness notification of RV sessions launched by AYON.
+
+The launcher opens a `ReadinessListener` on a local socket and passes its
+address to RV in `READY_ADDRESS_ENV`. Once the session is initialized
+and RV's network listener is up, `ayon_menus` calls `notify_ready`, so
+the launcher connects the moment RV is usable instead of polling it
+with connection retries.
+"""
+
+from __future__ import annotations
+
+import os
+import secrets
+import selectors
+import socket
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from ayon_core.lib import Logger
+
+if TYPE_CHECKING:
+    from typing import Any
+
+log = Logger.get_logger(__name__)
+
+# Environment variable with the address RV notifies, "host:port:token"
+READY_ADDRESS_ENV = "AYON_RV_READY_ADDRESS"
+# Key of the launch data passed on to RV by the pre-launch hook
+READY_ADDRESS_KEY = "ayon_rv_ready_address"
+
+_READY_MESSAGE = b"READY "
+
+
+class ReadinessListener:
+    """Local socket waiting for a launched RV to report it is ready.
+
+    Only notifications carrying the listener's random token are
+    accepted, so unrelated connections can't release the launcher.
+    """
+
+    def __init__(self) -> None:
+        self._token = secrets.token_hex(8)
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._sock.bind(("127.0.0.1", 0))
+        self._sock.listen()
+        self._sock.setblocking(False)
+        self.is_ready = False
+
+    @property
+    def address(self) -> str:
+        """Address to pass to RV in `READY_ADDRESS_ENV`."""
+        host, port = self._sock.getsockname()[:2]
+        return f"{host}:{port}:{self._token}"
+
+    def __enter__(self) -> ReadinessListener:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def wait(self, timeout: float) -> bool:
+        """Wait until RV reports it is ready.
+
+        Args:
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            True if RV is ready, False if it did not report in time.
+        """
+        if self.is_ready:
+            return True
+
+        deadline = monotonic() + timeout
+        with selectors.DefaultSelector() as selector:
+            selector.register(self._sock, selectors.EVENT_READ)
+            while not self.is_ready:
+                remaining = deadline - monotonic()
+                if remaining <= 0 or not selector.select(remaining):
+                    return False
+                try:
+                    conn, _ = self._sock.accept()
+                except BlockingIOError:
+                    continue
+                with conn:
+                    self.is_ready = self._read_notification(conn, deadline)
+        return True
+
+    def close(self) -> None:
+        self._sock.close()
+
+    def _read_notification(
+        self, conn: socket.socket, deadline: float
+    ) -> bool:
+        expected = _READY_MESSAGE + self._token.encode("ascii")
+        data = b""
+        conn.setblocking(True)
+        try:
+            while len(data) < len(expected):
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    return False
+                conn.settimeout(remaining)
+                chunk = conn.recv(len(expected) - len(data))
+                if not chunk:
+                    break
+                data += chunk
+        except OSError as err:
+            log.debug(f"Failed to read RV readiness notification: {err}")
+            return False
+
+        if data != expected:
+            log.debug(f"Ignoring invalid RV readiness notification: {data!r}")
+            return False
+        return True
+
+
+def notify_ready(address: str | None = None, timeout: float = 1.0) -> bool:
+    """Tell the launcher that this RV session is ready.
+
+    Does nothing when RV was not launched with a readiness listener.
+    The address is consumed, so further sessions of this process do not
+    notify again.
+
+    Args:
+        address: Listener address, defaults to `READY_ADDRESS_ENV`.
+        timeout: Maximum time in seconds to reach the listener.
+
+    Returns:
+        True if the launcher was notified.
+    """
+    if address is None:
+        address = os.environ.pop(READY_ADDRESS_ENV, None)
+    if not address:
+        return False
+
+    try:
+        host, port, token = address.rsplit(":", 2)
+        port = int(port)
+    except ValueError:
+        log.warning(f"Invalid RV readiness address: {address}")
+        return False
+
+    try:
+        with socket.create_connection((host, port), timeout) as sock:
+            sock.sendall(_READY_MESSAGE + token.encode("ascii"))
+    except OSError as err:
+        # Launcher gave up waiting, it falls back to connection retries
+        log.debug(f"Failed to notify readiness to {host}:{port}: {err}")
+        return False
+    return True
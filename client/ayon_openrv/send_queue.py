@@ -0,0 +1,239 @@
+"""Outbound queue writing RV messages on a dedicated thread.
+
+Senders only encode and enqueue their frames, a writer thread sends
+them. Frames queued meanwhile are coalesced into a single send call, so
+bursts of small messages cost few syscalls and never block the sender
+on the socket.
+"""
+
+from __future__ import annotations
+
+import collections
+import threading
+from concurrent.futures import Future
+from time import monotonic
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# What to do when a message is queued while the queue is full
+OVERFLOW_BLOCK = "block"
+OVERFLOW_DROP_OLDEST = "drop-oldest"
+OVERFLOW_ERROR = "error"
+OVERFLOW_POLICIES = {OVERFLOW_BLOCK, OVERFLOW_DROP_OLDEST, OVERFLOW_ERROR}
+
+DEFAULT_CAPACITY = 1024
+# Maximum bytes coalesced into a single send call
+DEFAULT_MAX_BATCH_SIZE = 256 * 1024
+
+
+class SendQueueFull(Exception):
+    """Message could not be queued or was dropped as the queue is full."""
+
+
+class SendQueue:
+    """Bounded queue of encoded frames sent by a writer thread.
+
+    Every queued entry gets a future resolved once it was written, or
+    failed if writing failed or it was dropped.
+
+    Args:
+        write: Callable sending encoded frames, receives the data and the
+            number of frames in it. Raises `OSError` on failure.
+        capacity: Maximum number of queued entries.
+        overflow: Policy applied when the queue is full, "block" waits
+            for free space, "drop-oldest" drops the oldest queued entry
+            and "error" raises `SendQueueFull`.
+        max_batch_size: Maximum bytes coalesced into a single write.
+        on_error: Called with the exception when writing failed.
+        on_drop: Called with the number of frames dropped on overflow.
+        name: Name of the writer thread.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[bytes, int], None],
+        capacity: int = DEFAULT_CAPACITY,
+        overflow: str = OVERFLOW_BLOCK,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        on_error: Callable[[BaseException], None] | None = None,
+        on_drop: Callable[[int], None] | None = None,
+        name: str = "ayon-openrv-writer",
+    ) -> None:
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        if capacity < 1:
+            raise ValueError("Capacity must be at least 1")
+
+        self.capacity = capacity
+        self.overflow = overflow
+        self.max_batch_size = max_batch_size
+        self._write = write
+        self._on_error = on_error
+        self._on_drop = on_drop
+
+        self._entries: collections.deque[tuple[bytes, int, Future]] = (
+            collections.deque()
+        )
+        self._in_flight = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(
+            target=self._run, name=name, daemon=True
+        )
+        self._thread.start()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def put(
+        self,
+        data: bytes,
+        count: int = 1,
+        timeout: float | None = None,
+    ) -> Future:
+        """Queue encoded frames for sending.
+
+        Args:
+            data: Encoded frames.
+            count: Number of frames in `data`.
+            timeout: Maximum seconds to wait for free space with the
+                "block" policy, None waits indefinitely.
+
+        Returns:
+            Future resolved with None once the frames were written.
+
+        Raises:
+            SendQueueFull: If the queue is full with the "error" policy
+                or no space freed up in time with the "block" policy.
+            RuntimeError: If the queue was closed.
+        """
+        future = Future()
+        future.set_running_or_notify_cancel()
+        dropped = None
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Send queue is closed")
+            if len(self._entries) >= self.capacity:
+                if self.overflow == OVERFLOW_ERROR:
+                    raise SendQueueFull(
+                        f"Send queue is full ({self.capacity} messages)"
+                    )
+                if self.overflow == OVERFLOW_DROP_OLDEST:
+                    dropped = self._entries.popleft()
+                elif not self._condition.wait_for(
+                    lambda: len(self._entries) < self.capacity
+                    or self._closed,
+                    timeout,
+                ):
+                    raise SendQueueFull(
+                        f"Send queue stayed full for {timeout}s"
+                    )
+                elif self._closed:
+                    raise RuntimeError("Send queue is closed")
+
+            self._entries.append((data, count, future))
+            self._condition.notify_all()
+
+        if dropped is not None:
+            _, dropped_count, dropped_future = dropped
+            dropped_future.set_exception(
+                SendQueueFull("Message dropped from full send queue")
+            )
+            if self._on_drop is not None:
+                self._on_drop(dropped_count)
+        return future
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until all queued frames were written.
+
+        Args:
+            timeout: Maximum seconds to wait, None waits indefinitely.
+
+        Returns:
+            True if the queue was drained in time.
+        """
+        if threading.current_thread() is self._thread:
+            return not self._entries
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._entries and not self._in_flight,
+                timeout,
+            )
+
+    def close(self, timeout: float | None = None) -> None:
+        """Write the queued frames and stop the writer thread.
+
+        Frames still queued after `timeout` seconds are failed.
+
+        Args:
+            timeout: Maximum seconds to wait for queued frames.
+        """
+        deadline = None if timeout is None else monotonic() + timeout
+        self.flush(timeout)
+        with self._condition:
+            self._closed = True
+            remaining = list(self._entries)
+            self._entries.clear()
+            self._condition.notify_all()
+        self._fail(remaining, RuntimeError("Send queue is closed"))
+
+        if threading.current_thread() is not self._thread:
+            wait = None
+            if deadline is not None:
+                wait = max(0.0, deadline - monotonic())
+            self._thread.join(wait)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._entries or self._closed
+                )
+                if not self._entries:
+                    return
+                batch = [self._entries.popleft()]
+                size = len(batch[0][0])
+                while (
+                    self._entries
+                    and size + len(self._entries[0][0]) <= self.max_batch_size
+                ):
+                    entry = self._entries.popleft()
+                    size += len(entry[0])
+                    batch.append(entry)
+                self._in_flight = len(batch)
+                # Room for blocked senders
+                self._condition.notify_all()
+
+            try:
+                if len(batch) == 1:
+                    data = batch[0][0]
+                else:
+                    data = b"".join(entry[0] for entry in batch)
+                self._write(data, sum(entry[1] for entry in batch))
+            except Exception as err:
+                # Later frames depend on the failed ones, e.g. chunks of
+                # a transfer, so fail everything queued
+                with self._condition:
+                    remaining = list(self._entries)
+                    self._entries.clear()
+                self._fail(batch + remaining, err)
+                if self._on_error is not None:
+                    self._on_error(err)
+            else:
+                for _, _, future in batch:
+                    future.set_result(None)
+            finally:
+                with self._condition:
+                    self._in_flight = 0
+                    self._condition.notify_all()
+
+    def _fail(
+        self,
+        entries: list[tuple[bytes, int, Future]],
+        error: BaseException,
+    ) -> None:
+        for _, _, future in entries:
+            if not future.done():
+                future.set_exception(error)
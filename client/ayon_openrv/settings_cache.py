@@ -0,0 +1,238 @@
+"""Cache of the OpenRV addon settings.
+
+Settings are kept in memory for `AYON_RV_SETTINGS_TTL` seconds. Stale
+settings keep being served while a background thread fetches fresh ones
+from the server, so callers only block on the network when nothing was
+cached yet. The last fetched settings are stored on disk as well and
+used on cold starts.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from time import monotonic
+from typing import TYPE_CHECKING
+
+import ayon_api
+from ayon_core.lib import Logger, get_ayon_appdirs
+
+from ayon_openrv.addon import OpenRVAddon
+from ayon_openrv.version import __version__
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from typing import Any
+
+log = Logger.get_logger(__name__)
+
+DEFAULT_TTL = 300.0
+# Seconds to serve cached settings after a failed refresh before retrying
+FAILED_REFRESH_DELAY = 30.0
+
+
+def get_settings_ttl() -> float:
+    """Return seconds the settings are considered fresh.
+
+    Configured with `AYON_RV_SETTINGS_TTL`.
+    """
+    return float(os.environ.get("AYON_RV_SETTINGS_TTL", DEFAULT_TTL))
+
+
+class SettingsCache:
+    """Settings cached in memory and on disk, refreshed in background.
+
+    Args:
+        fetch: Callable returning the settings from the server.
+        ttl: Seconds fetched settings are considered fresh.
+        cache_path: JSON file with the last fetched settings, None
+            disables the on-disk fallback.
+        cache_key: Identifies the settings in the file, e.g. server,
+            settings variant and addon version, other settings in the
+            file are ignored.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], dict[str, Any]],
+        ttl: float = DEFAULT_TTL,
+        cache_path: str | None = None,
+        cache_key: str = "",
+    ) -> None:
+        self.fetch = fetch
+        self.ttl = ttl
+        self.cache_path = cache_path
+        self.cache_key = cache_key
+
+        self._lock = threading.Lock()
+        self._value: dict[str, Any] | None = None
+        # Monotonic time the value expires at
+        self._expires = 0.0
+        self._refresh_thread: threading.Thread | None = None
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether settings are cached and did not expire yet."""
+        return self._value is not None and monotonic() < self._expires
+
+    def get(self) -> dict[str, Any]:
+        """Return the settings.
+
+        Fresh settings are returned right away. Stale settings are
+        returned as well while fresh ones are fetched in background.
+        Only blocks on the server when there are no settings in memory
+        nor on disk.
+
+        Returns:
+            The settings dictionary.
+        """
+        with self._lock:
+            value = self._value
+            if value is None:
+                value = self._read_disk_cache()
+                if value is not None:
+                    # Use until refreshed but refresh right away
+                    self._value = value
+                    self._expires = 0.0
+
+        if value is None:
+            return self.refresh()
+
+        if not self.is_fresh:
+            self.prefetch()
+        return value
+
+    def prefetch(self) -> None:
+        """Fetch settings on a background thread unless fresh already."""
+        with self._lock:
+            if self.is_fresh or self._refresh_thread is not None:
+                return
+            self._refresh_thread = threading.Thread(
+                target=self._background_refresh,
+                name="ayon-openrv-settings",
+                daemon=True,
+            )
+            self._refresh_thread.start()
+
+    def refresh(self) -> dict[str, Any]:
+        """Fetch settings from the server and cache them.
+
+        Returns:
+            The fetched settings, or the cached ones if fetching failed.
+
+        Raises:
+            Exception: If fetching failed and nothing is cached.
+        """
+        try:
+            value = self.fetch()
+        except Exception:
+            with self._lock:
+                value = self._value
+                if value is not None:
+                    # Do not retry on every call while the server is down
+                    self._expires = monotonic() + min(
+                        self.ttl, FAILED_REFRESH_DELAY
+                    )
+            if value is None:
+                raise
+            log.warning(
+                "Failed to fetch OpenRV settings, using cached ones",
+                exc_info=True,
+            )
+            return value
+
+        with self._lock:
+            self._value = value
+            self._expires = monotonic() + self.ttl
+        self._write_disk_cache(value)
+        return value
+
+    def prime(self, value: dict[str, Any]) -> None:
+        """Cache settings fetched elsewhere, e.g. with studio settings.
+
+        Args:
+            value: The settings dictionary.
+        """
+        with self._lock:
+            self._value = value
+            self._expires = monotonic() + self.ttl
+
+    def invalidate(self) -> None:
+        """Drop cached settings so the next `get` fetches them again.
+
+        The on-disk copy is kept as fallback if the server can't be
+        reached.
+        """
+        with self._lock:
+            self._value = None
+            self._expires = 0.0
+
+    def _background_refresh(self) -> None:
+        try:
+            self.refresh()
+        except Exception:
+            log.warning("Failed to fetch OpenRV settings", exc_info=True)
+        finally:
+            with self._lock:
+                self._refresh_thread = None
+
+    def _read_disk_cache(self) -> dict[str, Any] | None:
+        if not self.cache_path or not os.path.exists(self.cache_path):
+            return None
+        try:
+            with open(self.cache_path) as stream:
+                data = json.load(stream)
+        except (OSError, ValueError) as err:
+            log.debug(f"Failed to read cached OpenRV settings: {err}")
+            return None
+        if data.get("key") != self.cache_key:
+            return None
+        return data.get("settings")
+
+    def _write_disk_cache(self, value: dict[str, Any]) -> None:
+        if not self.cache_path:
+            return
+        tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            with open(tmp_path, "w") as stream:
+                json.dump({"key": self.cache_key, "settings": value}, stream)
+            # Atomic so concurrent processes never read a partial file
+            os.replace(tmp_path, self.cache_path)
+        except (OSError, TypeError) as err:
+            log.debug(f"Failed to write cached OpenRV settings: {err}")
+
+
+def _fetch_addon_settings() -> dict[str, Any]:
+    return ayon_api.get_addon_settings(OpenRVAddon.name, __version__)
+
+
+_cache: SettingsCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_settings_cache() -> SettingsCache:
+    """Return the cache of the OpenRV addon settings of this process."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = SettingsCache(
+                _fetch_addon_settings,
+                ttl=get_settings_ttl(),
+                cache_path=get_ayon_appdirs(
+                    "addons", OpenRVAddon.name, "settings_cache.json"
+                ),
+                # Settings differ per variant, e.g. production and staging
+                cache_key=(
+                    f"{ayon_api.get_base_url()}"
+                    f" {ayon_api.get_default_settings_variant()}"
+                    f" {__version__}"
+                ),
+            )
+        return _cache
+
+
+def get_addon_settings() -> dict[str, Any]:
+    """Return the OpenRV addon settings, see `SettingsCache.get`."""
+    return get_settings_cache().get()
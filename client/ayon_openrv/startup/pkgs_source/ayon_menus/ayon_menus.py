@@ -1,15 +1,18 @@
+import collections
+import contextlib
 import importlib
 import json
 import logging
 import os
 import sys
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 
 import rv.qtutils
 from ayon_api import get_representations
 from ayon_core.pipeline import (
-    discover_loader_plugins,
     get_current_project_name,
     install_host,
     load_container,
@@ -18,8 +21,31 @@ from ayon_core.pipeline import (
 from ayon_core.settings import get_project_settings
 from ayon_core.tools.utils import host_tools
 from ayon_openrv.api import OpenRVHost
+from ayon_openrv.api.lib import batched_reload
+from ayon_openrv.api.pipeline import (
+    get_container_index,
+    invalidate_property_types,
+    migrate_legacy_properties,
+    reset_session_schema_version,
+)
+from ayon_openrv.loader_registry import FRAMES_LOADER, get_loader_registry
 from ayon_openrv.networking import LoadContainerHandler
+from ayon_openrv.path_resolver import (
+    get_loader_options,
+    resolve_representation_paths,
+)
+from ayon_openrv.protocol import (
+    RPC_EVENT,
+    FrameReader,
+    ProtocolError,
+    decode_rpc_request,
+    encode_frame,
+    encode_rpc_return,
+)
+from ayon_openrv.readiness import notify_ready
+from ayon_openrv.transport import get_relay_socket_path
 from qtpy.QtCore import QEvent, QObject, QTimer
+from qtpy.QtNetwork import QLocalServer
 from qtpy.QtWidgets import QApplication
 from rv.rvtypes import MinorMode
 
@@ -106,14 +132,56 @@ class AYONMenus(MinorMode):
             overrideBindings=[
                 # event name, callback, description
                 (
-                    "ayon_load_container",
+                    LoadContainerHandler.event_name,
                     on_ayon_load_container,
                     "Loads an AYON representation into the session.",
                 ),
+                (
+                    LoadContainerHandler.chunk_event_name,
+                    on_ayon_load_container,
+                    "Loads a chunk of AYON representations into the "
+                    "session.",
+                ),
+                (
+                    RPC_EVENT,
+                    on_ayon_rpc,
+                    "Dispatches pipelined AYON requests.",
+                ),
+                (
+                    "ayon-source-loaded",
+                    on_ayon_source_loaded,
+                    "Adds loaded AYON containers to the container index.",
+                ),
+                (
+                    "graph-state-change",
+                    on_graph_state_change,
+                    "Updates the container index and property types when "
+                    "properties change.",
+                ),
+                (
+                    "after-session-read",
+                    on_after_session_read,
+                    "Migrates legacy properties and rebuilds the container "
+                    "index for the read session.",
+                ),
+                (
+                    "after-clear-session",
+                    on_after_clear_session,
+                    "Drops the container index and property types of the "
+                    "cleared session.",
+                ),
+                (
+                    "new-node",
+                    on_new_node,
+                    "Forgets containers and property types of deleted "
+                    "nodes recreated under the same name.",
+                ),
                 (
                     "session-initialized",
-                    self._open_visible_panels,
-                    "Open visible panels on session initialization",
+                    self._on_session_initialized,
+                    "Open visible panels, start the local event relay and "
+                    "notify readiness to the launcher on session "
+                    "initialization",
                 ),
             ],
             menu=[
@@ -147,6 +215,12 @@ class AYONMenus(MinorMode):
             "ayon", "panel_startup_visibility", self._panel_startup_visibility
         )
 
+    def _on_session_initialized(self, event):
+        self._open_visible_panels(event)
+        migrate_legacy_properties()
+        start_event_relay()
+        notify_launcher_ready()
+
     def _open_visible_panels(self, event):
         event.reject()
         self._panel_startup_visibility: list[str] = (
@@ -246,6 +320,261 @@ class AYONMenus(MinorMode):
         return menu
 
 
+class RVEventRelay(QObject):
+    """Relays RV's network protocol from a local socket to RV's events.
+
+    Serves AYON connectors on the same machine through a Unix domain
+    socket next to RV's own TCP listener, see `ayon_openrv.transport`.
+    Events are dispatched with `sendInternalEvent` on the main thread.
+    """
+
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self._server = QLocalServer(self)
+        # Only the user running RV may connect
+        self._server.setSocketOptions(QLocalServer.UserAccessOption)
+        self._server.newConnection.connect(self._on_new_connection)
+        self._connections = {}
+
+    def listen(self):
+        # Remove socket left behind by a crashed session
+        QLocalServer.removeServer(self.path)
+        if not self._server.listen(self.path):
+            logging.warning(
+                "Failed to start AYON event relay on %s: %s",
+                self.path,
+                self._server.errorString(),
+            )
+            return False
+        return True
+
+    def close(self):
+        for connection in list(self._connections):
+            connection.abort()
+        self._connections.clear()
+        self._server.close()
+
+    def _on_new_connection(self):
+        while self._server.hasPendingConnections():
+            connection = self._server.nextPendingConnection()
+            # Sender name is set by the greeting
+            self._connections[connection] = [FrameReader(), "ayon-relay"]
+            connection.readyRead.connect(
+                partial(self._on_ready_read, connection)
+            )
+            connection.disconnected.connect(
+                partial(self._on_disconnected, connection)
+            )
+
+    def _on_disconnected(self, connection):
+        self._connections.pop(connection, None)
+        connection.deleteLater()
+
+    def _on_ready_read(self, connection):
+        state = self._connections.get(connection)
+        if state is None:
+            return
+        reader = state[0]
+        reader.feed(bytes(connection.readAll()))
+        try:
+            frame = reader.next_frame()
+            while frame is not None:
+                self._handle_frame(connection, state, *frame)
+                frame = reader.next_frame()
+        except (ProtocolError, ValueError):
+            # Malformed frames or messages, e.g. an event without contents
+            logging.error("Invalid data on AYON event relay", exc_info=True)
+            connection.abort()
+
+    def _handle_frame(self, connection, state, msg_type, data):
+        if msg_type == "NEWGREETING":
+            state[1] = data.split(" ", 1)[0]
+            connection.write(encode_frame("NEWGREETING", "ayon-relay rv"))
+
+        elif msg_type == "PING":
+            connection.write(encode_frame("PONG", data))
+
+        elif msg_type == "MESSAGE":
+            if data == "DISCONNECT":
+                connection.disconnectFromServer()
+                return
+
+            kind, _, rest = data.partition(" ")
+            if kind not in {"EVENT", "RETURNEVENT"}:
+                logging.debug("Ignoring relayed message: %s", kind)
+                return
+
+            # <kind> <event name> <target> <contents>
+            event_name, _, contents = rest.split(" ", 2)
+            try:
+                result = rv.commands.sendInternalEvent(
+                    event_name, contents, state[1]
+                )
+            except Exception:
+                logging.error(
+                    "Relayed event %s failed", event_name, exc_info=True
+                )
+                result = ""
+            if kind == "RETURNEVENT":
+                connection.write(encode_frame("RETURN", result or ""))
+
+
+class LoadQueue(QObject):
+    """Loads representations into the session without blocking RV.
+
+    Events arriving within `coalesce_interval` milliseconds, or while
+    the previous batch is being prepared, are merged into one batch with
+    each representation once. Server queries and path resolution of a
+    batch run on a worker thread, see `LoadContainerHandler.prepare_loads`.
+    The prepared loads are applied on the main thread by a QTimer in
+    short time slices and in the order the events arrived, so RV stays
+    interactive while a large batch streams in. Sources are reloaded
+    once the queue runs dry instead of after every load.
+    """
+
+    # Milliseconds to wait for more events before preparing a batch
+    coalesce_interval = 50
+    # Seconds of each time slice spent loading into the session
+    time_slice = 0.02
+    # Milliseconds between checks while a batch is being prepared
+    poll_interval = 20
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="ayon-openrv-load"
+        )
+        # Items of events waiting to be prepared by representation id
+        self._incoming = {}
+        # Batch being prepared by the worker
+        self._preparing = None
+        # Prepared loads waiting to be applied
+        self._ready = collections.deque()
+        self._reload_batch = None
+
+        self._coalesce_timer = QTimer(self)
+        self._coalesce_timer.setSingleShot(True)
+        self._coalesce_timer.timeout.connect(self._prepare_incoming)
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._apply)
+
+    def submit(self, event_data):
+        for item in event_data:
+            repre_id = item.get("representation")
+            if repre_id and repre_id not in self._incoming:
+                self._incoming[repre_id] = item
+        # Events arriving while a batch is prepared join the next one
+        if self._preparing is None and not self._coalesce_timer.isActive():
+            self._coalesce_timer.start(self.coalesce_interval)
+
+    def close(self):
+        self._coalesce_timer.stop()
+        self._timer.stop()
+        if self._preparing is not None:
+            self._preparing.cancel()
+            self._preparing = None
+        self._incoming.clear()
+        self._ready.clear()
+        self._end_reload_batch()
+        self._executor.shutdown(wait=False)
+
+    def _prepare_incoming(self):
+        if not self._incoming or self._preparing is not None:
+            return
+        event_data = list(self._incoming.values())
+        self._incoming.clear()
+        self._preparing = self._executor.submit(
+            LoadContainerHandler.prepare_loads,
+            event_data,
+            get_current_project_name(),
+        )
+        if not self._timer.isActive():
+            self._timer.start(0)
+
+    def _apply(self):
+        deadline = time.monotonic() + self.time_slice
+        while time.monotonic() < deadline:
+            if not self._ready:
+                future = self._preparing
+                if future is None:
+                    self._timer.stop()
+                    self._end_reload_batch()
+                    return
+                if not future.done():
+                    # Show what was loaded so far while waiting
+                    self._end_reload_batch()
+                    self._timer.setInterval(self.poll_interval)
+                    return
+                self._preparing = None
+                try:
+                    self._ready.extend(future.result())
+                except Exception:
+                    logging.error(
+                        "Failed to prepare AYON representations",
+                        exc_info=True,
+                    )
+                # Prepare what arrived meanwhile while applying this batch
+                self._coalesce_timer.stop()
+                self._prepare_incoming()
+                continue
+
+            loader, context, options = self._ready.popleft()
+            if self._reload_batch is None:
+                self._reload_batch = contextlib.ExitStack()
+                self._reload_batch.enter_context(batched_reload())
+            try:
+                LoadContainerHandler.apply_load(loader, context, options)
+            except Exception:
+                logging.error(
+                    "Failed to load representation %s",
+                    context["representation"]["id"],
+                    exc_info=True,
+                )
+        # Out of time with work left, continue after pending UI events
+        self._timer.setInterval(0)
+
+    def _end_reload_batch(self):
+        if self._reload_batch is not None:
+            reload_batch = self._reload_batch
+            self._reload_batch = None
+            reload_batch.close()
+
+
+_load_queue = None
+
+
+def get_load_queue():
+    global _load_queue
+    if _load_queue is None:
+        app = QApplication.instance()
+        _load_queue = LoadQueue(parent=app)
+        app.aboutToQuit.connect(_load_queue.close)
+    return _load_queue
+
+
+_event_relay = None
+
+
+def start_event_relay():
+    """Start the local event relay of this RV process.
+
+    Runs next to RV's network listener, it is not started when the
+    network is off or the platform has no Unix domain sockets.
+    """
+    global _event_relay
+    if _event_relay is not None or sys.platform == "win32":
+        return
+    if rv.commands.remoteNetworkStatus() != rv.commands.NetworkStatusOn:
+        return
+
+    path = get_relay_socket_path(rv.commands.myNetworkPort())
+    relay = RVEventRelay(path, parent=QApplication.instance())
+    if relay.listen():
+        QApplication.instance().aboutToQuit.connect(relay.close)
+        _event_relay = relay
+
+
 def data_loader():
     incoming_data_file = os.environ.get("AYON_LOADER_REPRESENTATIONS", None)
     if incoming_data_file:
@@ -257,26 +586,90 @@ def data_loader():
         print("No data for auto-loader")
 
 
+def notify_launcher_ready():
+    """Tell the launcher waiting for this session it can connect now.
+
+    See `ayon_openrv.readiness`. Without the network listener running
+    the launcher keeps retrying the connection until it times out.
+    """
+    if rv.commands.remoteNetworkStatus() != rv.commands.NetworkStatusOn:
+        logging.warning("RV network is off, not notifying readiness")
+        return
+    notify_ready()
+
+
 def on_ayon_load_container(event):
-    handler = LoadContainerHandler(event)
-    handler.handle_event()
+    event_data = LoadContainerHandler(event).get_event_data()
+    if event_data:
+        get_load_queue().submit(event_data)
+
+
+def on_ayon_rpc(event):
+    """Dispatch a pipelined request and echo its id with the result.
+
+    See `RVConnector.submit_event`.
+    """
+    request_id, event_name, contents = decode_rpc_request(event.contents())
+    result = rv.commands.sendInternalEvent(event_name, contents, RPC_EVENT)
+    event.setReturnContent(encode_rpc_return(request_id, result or ""))
+
+
+def on_ayon_source_loaded(event):
+    event.reject()
+    get_container_index().invalidate(event.contents())
+
+
+def on_graph_state_change(event):
+    event.reject()
+    # Contents are the changed property, <node>.<component>.<name>
+    prop = event.contents()
+    invalidate_property_types(prop)
+    node, _, name = prop.partition(".")
+    if name.startswith(("ayon.", "openpype.")):
+        get_container_index().invalidate(node)
+
+
+def on_after_session_read(event):
+    event.reject()
+    invalidate_property_types()
+    get_container_index().invalidate()
+    # The read session may carry its own marker or legacy nodes
+    reset_session_schema_version()
+    migrate_legacy_properties(force=True)
+
+
+def on_after_clear_session(event):
+    event.reject()
+    invalidate_property_types()
+    get_container_index().invalidate()
+    reset_session_schema_version()
+
+
+def on_new_node(event):
+    event.reject()
+    # A deleted node recreated under its name must not keep its record
+    node = event.contents()
+    invalidate_property_types(node)
+    get_container_index().invalidate(node)
 
 
 def load_data(dataset=None):
     project_name = get_current_project_name()
-    available_loaders = discover_loader_plugins(project_name)
-    Loader = next(
-        loader
-        for loader in available_loaders
-        if loader.__name__ == "FramesLoader"
-    )
+    Loader = get_loader_registry(project_name).get_loader(FRAMES_LOADER)
+    if Loader is None:
+        print("No loader for auto-loader")
+        return
 
-    representations = get_representations(
-        project_name, representation_ids=dataset
+    representations = list(
+        get_representations(project_name, representation_ids=dataset)
     )
+    paths = resolve_representation_paths(project_name, representations)
 
     for representation in representations:
-        load_container(Loader, representation)
+        filepath = paths.get(representation["id"])
+        load_container(
+            Loader, representation, options=get_loader_options(filepath)
+        )
 
 
 # only add menu items if AYON_RV_NO_MENU is not set to 1
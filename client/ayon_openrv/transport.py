@@ -0,0 +1,161 @@
+"""Transports carrying RV's network protocol.
+
+RV itself only listens on TCP. For RV sessions on the same machine the
+`ayon_menus` package additionally runs a relay on a Unix domain socket
+which dispatches events straight to RV's event system. Local
+connections use it when available, it saves the TCP stack on every
+message and does not depend on the TCP port being free.
+"""
+
+from __future__ import annotations
+
+import abc
+import asyncio
+import getpass
+import os
+import socket
+import tempfile
+
+LOCAL_HOSTS = {"localhost", "127.0.0.1", "::1"}
+
+
+def get_relay_socket_path(port: int) -> str:
+    """Return path of the Unix domain socket relay of an RV session.
+
+    Args:
+        port: TCP port RV listens on.
+
+    Returns:
+        Path of the socket, unique per user and port.
+    """
+    try:
+        user = getpass.getuser()
+    except (KeyError, OSError):
+        user = str(os.getuid()) if hasattr(os, "getuid") else "user"
+    return os.path.join(
+        tempfile.gettempdir(), f"ayon-openrv-{user}-{port}.sock"
+    )
+
+
+def is_local_host(host: str) -> bool:
+    return host in LOCAL_HOSTS or host == socket.gethostname()
+
+
+class Transport(abc.ABC):
+    """Opens connections carrying RV's network protocol."""
+
+    name = ""
+
+    @abc.abstractmethod
+    def connect(self, timeout: float) -> socket.socket:
+        """Open a blocking connection.
+
+        Args:
+            timeout: Timeout of socket operations in seconds.
+
+        Returns:
+            Connected socket.
+
+        Raises:
+            OSError: If connecting failed.
+        """
+
+    @abc.abstractmethod
+    async def open_connection(
+        self,
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """Open an asyncio connection.
+
+        Raises:
+            OSError: If connecting failed.
+        """
+
+
+class TCPTransport(Transport):
+    """Connection to RV's own TCP listener.
+
+    Args:
+        host: Hostname RV runs on.
+        port: Port RV listens on.
+    """
+
+    name = "tcp"
+
+    def __init__(self, host: str, port: int) -> None:
+        self.host = host
+        self.port = port
+
+    def __repr__(self) -> str:
+        return f"TCPTransport({self.host!r}, {self.port})"
+
+    def connect(self, timeout: float) -> socket.socket:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        # Do not hold back the tail of a message until the previous one
+        # was acknowledged, e.g. the last chunk of a chunked event
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        try:
+            sock.connect((self.host, self.port))
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    async def open_connection(
+        self,
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        return await asyncio.open_connection(self.host, self.port)
+
+
+class UnixSocketTransport(Transport):
+    """Connection to the relay of `ayon_menus` on a Unix domain socket.
+
+    Args:
+        path: Path of the relay socket.
+    """
+
+    name = "unix"
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def __repr__(self) -> str:
+        return f"UnixSocketTransport({self.path!r})"
+
+    def connect(self, timeout: float) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(timeout)
+        try:
+            sock.connect(self.path)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    async def open_connection(
+        self,
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        return await asyncio.open_unix_connection(self.path)
+
+
+def get_transports(host: str, port: int) -> list[Transport]:
+    """Return transports to try in order of preference.
+
+    The Unix domain socket relay comes first for local hosts when its
+    socket exists, TCP is always the fallback.
+
+    Args:
+        host: Hostname RV runs on.
+        port: Port RV listens on.
+
+    Returns:
+        Transports to try in order.
+    """
+    transports: list[Transport] = []
+    if hasattr(socket, "AF_UNIX") and is_local_host(host):
+        path = get_relay_socket_path(port)
+        if os.path.exists(path):
+            transports.append(UnixSocketTransport(path))
+    transports.append(TCPTransport(host, port))
+    return transports
+
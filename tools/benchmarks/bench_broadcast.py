@@ -0,0 +1,99 @@
+"""Benchmark sending an event to several RV sessions.
+
+Starts stand-ins of several review-room RV sessions, each taking
+`--latency` seconds to handle an event, one of them optionally
+unreachable, and compares pushing the event to them one after another
+with `RVConnector` against `broadcast_event`. Run from the repository
+root within an AYON environment:
+
+    python tools/benchmarks/bench_broadcast.py --sessions 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import os
+import socket
+import sys
+from time import perf_counter
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(__file__), "..", "..", "client")
+)
+sys.path.insert(0, os.path.dirname(__file__))
+
+from ayon_openrv.broadcast import broadcast_event  # noqa: E402
+from ayon_openrv.networking import RVConnector  # noqa: E402
+from fake_rv_server import FakeRVServer  # noqa: E402
+
+# Avoid querying AYON server for the addon settings
+RVConnector._cached_settings = {
+    "network": {"conn_name": "benchmark", "conn_port": 0, "timeout": 1}
+}
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _sequential(endpoints, payload: str) -> list[bool]:
+    results = []
+    for host, port in endpoints:
+        try:
+            with RVConnector(host=host, port=port) as connector:
+                connector.send_event("benchmark", payload)
+                results.append(connector.is_connected)
+        except ConnectionError:
+            results.append(False)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--payload-size", type=int, default=64 * 1024)
+    parser.add_argument("--timeout", type=float, default=1.0)
+    parser.add_argument(
+        "--unreachable",
+        action="store_true",
+        help="Add an endpoint nothing listens on",
+    )
+    args = parser.parse_args()
+
+    payload = "x" * args.payload_size
+    with contextlib.ExitStack() as stack:
+        endpoints = [
+            stack.enter_context(FakeRVServer(latency=args.latency)).address
+            for _ in range(args.sessions)
+        ]
+        if args.unreachable:
+            endpoints.append(("127.0.0.1", _free_port()))
+
+        start = perf_counter()
+        ok = sum(_sequential(endpoints, payload))
+        elapsed = perf_counter() - start
+        print(
+            f"sequential {elapsed * 1000:9.1f}ms  "
+            f"{ok}/{len(endpoints)} sessions"
+        )
+
+        start = perf_counter()
+        results = broadcast_event(
+            endpoints, "benchmark", payload, timeout=args.timeout
+        )
+        elapsed = perf_counter() - start
+        ok = sum(result.ok for result in results)
+        slowest = max(result.elapsed for result in results)
+        print(
+            f"broadcast  {elapsed * 1000:9.1f}ms  "
+            f"{ok}/{len(endpoints)} sessions, "
+            f"slowest {slowest * 1000:.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
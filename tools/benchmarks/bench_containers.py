@@ -0,0 +1,158 @@
+"""Benchmark reading containers of an RV session.
+
+Fills the stand-in ``rv`` module with containers plus the other nodes of
+their source groups and compares the former per-key `parse_container`
+and `get_containers` with the single listing reader and the container
+index. Like RV sessions started with AYON menus, the session is migrated
+before the current readers are measured. Every ``rv.commands`` call
+takes `--call-cost` microseconds, standing in for the cost of calling
+into RV. Run from the repository root within an AYON environment:
+
+    python tools/benchmarks/bench_containers.py --containers 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from time import perf_counter
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(__file__), "..", "..", "client")
+)
+sys.path.insert(0, os.path.dirname(__file__))
+
+import fake_rv  # noqa: E402
+
+fake_rv.install()
+
+from ayon_openrv.api import pipeline  # noqa: E402
+
+# Nodes RV creates per source group besides the file source
+GROUP_NODES = ("_source", "_switch", "_colorPipeline", "_linearize")
+
+
+def legacy_parse_container(node):
+    """`parse_container` as it was before reading properties at once."""
+    required = ["id", "schema", "name",
+                "namespace", "loader", "representation",
+                "project_name"]
+
+    data = {}
+    for key in required:
+        prop = f"{node}.{pipeline.AYON_ATTR_PREFIX}{key}"
+        if not fake_rv.propertyExists(prop):
+            prop = f"{node}.openpype.{key}"
+            if not fake_rv.propertyExists(prop):
+                if key != "project_name":
+                    return
+                else:
+                    pipeline.imprint(
+                        node,
+                        {"project_name": "benchmark"},
+                        prefix=pipeline.AYON_ATTR_PREFIX,
+                    )
+
+        value = fake_rv.getStringProperty(prop)[0]
+        data[key] = value
+
+    data["objectName"] = str(node)
+    data["node"] = node
+    return data
+
+
+def legacy_get_container_nodes():
+    """`get_container_nodes` as it was before the container index."""
+    container_nodes = []
+    for node in fake_rv.nodes():
+        prop = f"{node}.{pipeline.AYON_ATTR_PREFIX}schema"
+        if fake_rv.propertyExists(prop):
+            container_nodes.append(node)
+        elif fake_rv.propertyExists(f"{node}.openpype.schema"):
+            container_nodes.append(node)
+    return container_nodes
+
+
+def legacy_get_containers():
+    for node in legacy_get_container_nodes():
+        legacy_parse_container(node)
+
+
+def populate(containers: int, legacy_ratio: float) -> list[str]:
+    fake_rv.reset()
+    pipeline.reset_session_schema_version()
+    pipeline.get_container_index().invalidate()
+    container_nodes = []
+    legacy = int(containers * legacy_ratio)
+    for index in range(containers):
+        group = f"sourceGroup{index:06d}"
+        for suffix in GROUP_NODES:
+            fake_rv.add_node(f"{group}{suffix}", {"media.name": group})
+        node = f"{group}_source"
+        prefix = "openpype." if index < legacy else pipeline.AYON_ATTR_PREFIX
+        properties = {
+            f"{prefix}{key}": f"{key}-{index}"
+            for key in pipeline.CONTAINER_KEYS
+        }
+        properties["media.name"] = group
+        fake_rv.add_node(node, properties)
+        container_nodes.append(node)
+    return container_nodes
+
+
+def measure(label: str, func, repeat: int) -> None:
+    fake_rv.calls.clear()
+    start = perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed = (perf_counter() - start) / repeat
+    calls = sum(fake_rv.calls.values()) / repeat
+    print(f"{label:32} {elapsed * 1000:9.3f}ms  {calls:9,.0f} rv calls")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--containers", type=int, default=1000)
+    parser.add_argument(
+        "--legacy-ratio",
+        type=float,
+        default=0.1,
+        help="Share of containers imprinted with the openpype prefix",
+    )
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument(
+        "--call-cost",
+        type=float,
+        default=5.0,
+        help="Microseconds each rv.commands call takes",
+    )
+    args = parser.parse_args()
+    fake_rv.call_cost = args.call_cost / 1e6
+
+    nodes = populate(args.containers, args.legacy_ratio)
+    measure(
+        "parse_container (per key)",
+        lambda: [legacy_parse_container(node) for node in nodes],
+        args.repeat,
+    )
+    measure("get_containers (per key)", legacy_get_containers, args.repeat)
+
+    measure("migrate_legacy_properties", pipeline.migrate_legacy_properties, 1)
+    measure(
+        "parse_container (one listing)",
+        lambda: [pipeline.parse_container(node) for node in nodes],
+        args.repeat,
+    )
+
+    index = pipeline.get_container_index()
+
+    def cold():
+        index.invalidate()
+        index.get_containers()
+
+    measure("get_containers (index, cold)", cold, args.repeat)
+    measure("get_containers (index, warm)", index.get_containers, args.repeat)
+
+if __name__ == "__main__":
+    main()
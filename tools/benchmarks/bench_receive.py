@@ -0,0 +1,100 @@
+"""Benchmark receiving RV frames with the legacy and buffered readers.
+
+Run from the repository root within an AYON environment:
+
+    python tools/benchmarks/bench_receive.py --messages 20000 --size 256
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import socket
+import sys
+from time import perf_counter
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(__file__), "..", "..", "client")
+)
+sys.path.insert(0, os.path.dirname(__file__))
+
+from ayon_openrv.protocol import FrameReader  # noqa: E402
+from fake_rv_server import FakeRVServer  # noqa: E402
+
+
+def legacy_receive(sock: socket.socket) -> tuple[str, str | None]:
+    """Byte-at-a-time reader `RVConnector` used before `FrameReader`."""
+    msg_type = ""
+    while True:
+        char = sock.recv(1).decode("utf-8")
+        if char == " ":
+            break
+        msg_type += char
+
+    length_str = ""
+    while True:
+        char = sock.recv(1).decode("utf-8")
+        if char == " ":
+            break
+        length_str += char
+
+    msg_data = None
+    msg_length = int(length_str)
+    if msg_length > 0:
+        data_bytes = b""
+        while len(data_bytes) < msg_length:
+            chunk = sock.recv(msg_length - len(data_bytes))
+            if not chunk:
+                break
+            data_bytes += chunk
+        msg_data = data_bytes.decode("utf-8")
+    return (msg_type, msg_data)
+
+
+def buffered_receive(reader: FrameReader, sock: socket.socket):
+    frame = reader.next_frame()
+    while frame is None:
+        if not reader.fill(sock):
+            raise ConnectionResetError("Stand-in server closed connection")
+        frame = reader.next_frame()
+    return frame
+
+
+def run(label: str, messages: int, size: int, buffered: bool) -> None:
+    with FakeRVServer(burst=(messages, size)) as server:
+        with socket.create_connection(server.address) as sock:
+            reader = FrameReader()
+            start = perf_counter()
+            for _ in range(messages):
+                if buffered:
+                    buffered_receive(reader, sock)
+                else:
+                    legacy_receive(sock)
+            elapsed = perf_counter() - start
+
+    total_bytes = messages * size
+    print(
+        f"{label:>9}: {messages / elapsed:12,.0f} msg/s "
+        f"{total_bytes / elapsed / 1e6:10,.1f} MB/s "
+        f"({elapsed:.3f}s)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument(
+        "--size", type=int, nargs="+", default=[16, 256, 4096, 1048576]
+    )
+    args = parser.parse_args()
+
+    for size in args.size:
+        # Large payloads make the legacy reader quadratic, keep it sane
+        messages = max(1, min(args.messages, 64 * 1024 * 1024 // size))
+        print(f"payload {size} bytes x {messages} messages")
+        run("legacy", messages, size, buffered=False)
+        run("buffered", messages, size, buffered=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Benchmark RETURNEVENT round trips of `RVConnector`.
+
+Compares the selector based wait with the former peek-and-sleep polling
+loop, both for RETURNEVENT round trips and for draining an idle
+connection with `_process_events`, and sequential calls with pipelined
+ones sent through `submit_events`. Run from the repository root within an AYON environment:
+
+    python tools/benchmarks/bench_round_trip.py --calls 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import socket
+import sys
+from time import perf_counter, sleep, time
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(__file__), "..", "..", "client")
+)
+sys.path.insert(0, os.path.dirname(__file__))
+
+from ayon_openrv.networking import RVConnector  # noqa: E402
+from fake_rv_server import FakeRVServer  # noqa: E402
+
+# Avoid querying AYON server for the addon settings
+RVConnector._cached_settings = {
+    "network": {"conn_name": "benchmark", "conn_port": 0, "timeout": 5}
+}
+
+
+class PollingRVConnector(RVConnector):
+    """`RVConnector` waiting for messages like it did before selectors."""
+
+    def _wait_for_message(self, timeout=0.1):
+        start = time()
+        while timeout is None or time() - start < timeout:
+            if not self.is_connected or self._sock is None:
+                return False
+            if self._reader.pending:
+                return True
+            try:
+                if self._sock.recv(1, socket.MSG_PEEK):
+                    return True
+            except socket.timeout:
+                pass
+            sleep(0.01)
+        return False
+
+
+def run(
+    label: str,
+    connector_cls: type[RVConnector],
+    calls: int,
+    latency: float,
+) -> None:
+    with FakeRVServer(latency=latency) as server:
+        host, port = server.address
+        with connector_cls(host=host, port=port) as connector:
+            for _ in range(calls):
+                connector.send_event("benchmark", "ping", shall_return=True)
+            histogram = connector.metrics.round_trip
+
+            start = perf_counter()
+            connector._process_events()
+            idle_drain = perf_counter() - start
+
+    print(
+        f"{label:>9}: "
+        f"p50 {histogram.percentile(50) * 1000:8.3f}ms "
+        f"p90 {histogram.percentile(90) * 1000:8.3f}ms "
+        f"p99 {histogram.percentile(99) * 1000:8.3f}ms "
+        f"mean {histogram.mean * 1000:8.3f}ms "
+        f"idle drain {idle_drain * 1000:8.1f}ms"
+    )
+
+
+def run_pipelined(calls: int, latency: float) -> None:
+    with FakeRVServer(latency=latency) as server:
+        host, port = server.address
+        with RVConnector(host=host, port=port) as connector:
+            start = perf_counter()
+            for _ in range(calls):
+                connector.send_event("benchmark", "ping", shall_return=True)
+            sequential = perf_counter() - start
+
+            start = perf_counter()
+            futures = connector.submit_events(
+                ("benchmark", "ping") for _ in range(calls)
+            )
+            connector.wait_for_events(futures)
+            pipelined = perf_counter() - start
+
+    print(
+        f"{calls} calls: sequential {sequential * 1000:8.1f}ms "
+        f"pipelined {pipelined * 1000:8.1f}ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.002,
+        help="Seconds the stand-in server takes to handle each event",
+    )
+    args = parser.parse_args()
+
+    run("polling", PollingRVConnector, args.calls, args.latency)
+    run("selector", RVConnector, args.calls, args.latency)
+    # Server latency is per event on its side, pipelining saves the wire
+    run_pipelined(args.calls, 0.0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""Benchmark suite of `RVConnector` against the stand-in RV server.
+
+Measures connect time, RETURNEVENT round trip percentiles, throughput of
+large payloads, single versus chunked ayon_load_container payloads and
+the cost of the connection retry/backoff path while RV is still starting
+up. Run from the repository root within an AYON
+environment:
+
+    python tools/benchmarks/bench_suite.py --json results.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import threading
+from time import perf_counter
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(__file__), "..", "..", "client")
+)
+sys.path.insert(0, os.path.dirname(__file__))
+
+from ayon_openrv.chunking import ChunkReassembler  # noqa: E402
+from ayon_openrv.metrics import LatencyHistogram  # noqa: E402
+from ayon_openrv.networking import RVConnector  # noqa: E402
+from fake_rv_server import FakeRVServer  # noqa: E402
+
+# Avoid querying AYON server for the addon settings
+RVConnector._cached_settings = {
+    "network": {"conn_name": "benchmark", "conn_port": 0, "timeout": 20}
+}
+
+
+def _format_histogram(histogram: LatencyHistogram) -> str:
+    return (
+        f"p50 {histogram.percentile(50) * 1000:8.3f}ms "
+        f"p90 {histogram.percentile(90) * 1000:8.3f}ms "
+        f"p99 {histogram.percentile(99) * 1000:8.3f}ms "
+        f"max {histogram.max * 1000:8.3f}ms"
+    )
+
+
+def bench_connect(iterations: int) -> dict:
+    """Time to connect and greet RV, without closing."""
+    connect = LatencyHistogram()
+    with FakeRVServer() as server:
+        host, port = server.address
+        for _ in range(iterations):
+            start = perf_counter()
+            connector = RVConnector(host=host, port=port)
+            connect.observe(perf_counter() - start)
+            connector.close()
+
+    print(f"connect         {_format_histogram(connect)}")
+    return {"connect": connect.to_dict()}
+
+
+def bench_round_trip(calls: int, latency: float) -> dict:
+    """RETURNEVENT round trip with small payloads."""
+    with FakeRVServer(latency=latency) as server:
+        host, port = server.address
+        with RVConnector(host=host, port=port) as connector:
+            for _ in range(calls):
+                connector.send_event("benchmark", "ping")
+            round_trip = connector.metrics.round_trip
+
+    print(f"round trip      {_format_histogram(round_trip)}")
+    return {"round_trip": round_trip.to_dict()}
+
+
+def bench_throughput(calls: int, size: int) -> dict:
+    """Large payloads echoed back by the server."""
+    payload = "x" * size
+    with FakeRVServer() as server:
+        host, port = server.address
+        with RVConnector(host=host, port=port) as connector:
+            start = perf_counter()
+            for _ in range(calls):
+                connector.send_event("benchmark", payload)
+            elapsed = perf_counter() - start
+
+    # Payload travels to the server and back
+    bytes_per_second = 2 * calls * size / elapsed
+    print(
+        f"throughput      {size} bytes x {calls}: "
+        f"{bytes_per_second / 1e6:10,.1f} MB/s "
+        f"{calls / elapsed:10,.1f} calls/s"
+    )
+    return {
+        "throughput": {
+            "size": size,
+            "calls": calls,
+            "elapsed": elapsed,
+            "bytes_per_second": bytes_per_second,
+        }
+    }
+
+
+def bench_chunked(count: int) -> dict:
+    """Time until RV received the first and all of `count` items."""
+    items = [
+        {"objectName": f"name{index}", "representation": f"{index:032x}"}
+        for index in range(count)
+    ]
+
+    results = {}
+    for mode in ("single", "chunked", "compressed"):
+        received = []
+        first = []
+        done = threading.Event()
+        reassembler = ChunkReassembler()
+
+        def on_single(event):
+            first.append(perf_counter())
+            received.extend(json.loads(event.contents()))
+            done.set()
+
+        def on_chunk(event):
+            chunk_items, finished = reassembler.feed(event.contents())
+            if not first:
+                first.append(perf_counter())
+            received.extend(chunk_items)
+            if finished:
+                done.set()
+
+        with FakeRVServer() as server:
+            server.bind("single", on_single)
+            server.bind("chunk", on_chunk)
+            host, port = server.address
+            with RVConnector(host=host, port=port) as connector:
+                start = perf_counter()
+                if mode == "single":
+                    connector.send_event(
+                        "single", json.dumps(items), shall_return=False
+                    )
+                else:
+                    connector.send_chunked_event(
+                        "chunk", items, compress=mode == "compressed"
+                    )
+                done.wait(30.0)
+                elapsed = perf_counter() - start
+
+        assert len(received) == count
+        first_items = first[0] - start
+        print(
+            f"{mode:15} {count} items: first after "
+            f"{first_items * 1000:8.2f}ms, all after {elapsed * 1000:8.2f}ms"
+        )
+        results[mode] = {"first_items": first_items, "elapsed": elapsed}
+    return {"chunked": results}
+
+
+def bench_retry(delays: list[float]) -> dict:
+    """Connect while RV starts listening only after a delay."""
+    results = []
+    for delay in delays:
+        server = FakeRVServer()
+        host, port = server.address
+        server.start(delay=delay)
+        try:
+            connector = RVConnector(host=host, port=port)
+            start = perf_counter()
+            connector.wait_for_connection(timeout=delay + 10.0)
+            # Constructor made the first attempt already
+            elapsed = perf_counter() - start
+            attempts = connector._attempts + 1
+            connector.close()
+        finally:
+            server.stop()
+
+        overhead = max(0.0, elapsed - delay)
+        print(
+            f"retry           ready after {delay:5.2f}s: connected in "
+            f"{elapsed:6.3f}s ({overhead * 1000:7.1f}ms late, "
+            f"{attempts} attempts)"
+        )
+        results.append({
+            "delay": delay,
+            "elapsed": elapsed,
+            "overhead": overhead,
+            "attempts": attempts,
+        })
+    return {"retry": results}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--connects", type=int, default=200)
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="Seconds the stand-in server takes to handle each event",
+    )
+    parser.add_argument("--payload-size", type=int, default=4 * 1024 * 1024)
+    parser.add_argument("--payload-calls", type=int, default=20)
+    parser.add_argument(
+        "--items",
+        type=int,
+        default=20000,
+        help="Representations sent in ayon_load_container payloads",
+    )
+    parser.add_argument(
+        "--retry-delays",
+        type=float,
+        nargs="*",
+        default=[0.05, 0.3, 1.0, 2.5],
+        help="Seconds until the stand-in server starts listening",
+    )
+    parser.add_argument("--json", help="Write results to this JSON file")
+    args = parser.parse_args()
+
+    results = {}
+    results.update(bench_connect(args.connects))
+    results.update(bench_round_trip(args.calls, args.latency))
+    results.update(bench_throughput(args.payload_calls, args.payload_size))
+    results.update(bench_chunked(args.items))
+    results.update(bench_retry(args.retry_delays))
+
+    if args.json:
+        with open(args.json, "w") as stream:
+            json.dump(results, stream, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark RV connections over TCP and the Unix domain socket relay.
+
+Starts a stand-in RV listening on TCP and a stand-in of the `ayon_menus`
+event relay on the relay socket of the same port, then compares connect
+time, RETURNEVENT round trips and large payload throughput of
+`RVConnector` with both transports. Run from the repository root within
+an AYON environment:
+
+    python tools/benchmarks/bench_transport.py --calls 2000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import socket
+import sys
+from time import perf_counter
+
+sys.path.insert(
+    0, os.path.join(os.path.dirname(__file__), "..", "..", "client")
+)
+sys.path.insert(0, os.path.dirname(__file__))
+
+from ayon_openrv.metrics import LatencyHistogram  # noqa: E402
+from ayon_openrv.networking import RVConnector  # noqa: E402
+from ayon_openrv.transport import (  # noqa: E402
+    TCPTransport,
+    get_relay_socket_path,
+)
+from fake_rv_server import FakeRVServer  # noqa: E402
+
+# Avoid querying AYON server for the addon settings
+RVConnector._cached_settings = {
+    "network": {"conn_name": "benchmark", "conn_port": 0, "timeout": 20}
+}
+
+
+def _run(port: int, transport, args) -> None:
+    connect = LatencyHistogram()
+    for _ in range(args.connects):
+        start = perf_counter()
+        connector = RVConnector(port=port, transport=transport)
+        connect.observe(perf_counter() - start)
+        connector.close()
+
+    payload = "x" * args.payload_size
+    with RVConnector(port=port, transport=transport) as connector:
+        name = connector.active_transport.name
+        for _ in range(args.calls):
+            connector.send_event("benchmark", "ping")
+        round_trip = connector.metrics.round_trip
+
+        start = perf_counter()
+        for _ in range(args.payload_calls):
+            connector.send_event("benchmark", payload)
+        elapsed = perf_counter() - start
+
+    throughput = 2 * args.payload_calls * args.payload_size / elapsed
+    print(
+        f"{name:5} connect mean {connect.mean * 1000:7.3f}ms  "
+        f"round trip p50 {round_trip.percentile(50) * 1000:7.3f}ms "
+        f"p99 {round_trip.percentile(99) * 1000:7.3f}ms "
+        f"mean {round_trip.mean * 1000:7.3f}ms  "
+        f"{throughput / 1e6:8,.1f} MB/s"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--connects", type=int, default=200)
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--payload-size", type=int, default=4 * 1024 * 1024)
+    parser.add_argument("--payload-calls", type=int, default=20)
+    args = parser.parse_args()
+
+    if not hasattr(socket, "AF_UNIX"):
+        print("Unix domain sockets are not available on this platform")
+        return
+
+    with FakeRVServer() as server:
+        port = server.address[1]
+        relay_path = get_relay_socket_path(port)
+        with FakeRVServer(unix_path=relay_path):
+            _run(port, TCPTransport("localhost", port), args)
+            # Picked automatically for local hosts
+            _run(port, None, args)
+
+
+if __name__ == "__main__":
+    main()
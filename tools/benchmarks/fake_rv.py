@@ -0,0 +1,160 @@
+"""Stand-in for RV's ``rv.commands`` node graph and property API.
+
+Keeps nodes and their properties in memory and implements the commands
+`ayon_openrv.api.pipeline` uses to imprint and read containers, so its
+readers can be benchmarked without RV. Every command call is counted in
+`calls` and takes `call_cost` seconds. `install` registers the stand-in
+as the ``rv`` module:
+
+```python
+import fake_rv
+
+fake_rv.install()
+from ayon_openrv.api import pipeline
+```
+"""
+
+from __future__ import annotations
+
+import collections
+import sys
+import types
+from time import perf_counter
+
+FloatType = 1
+IntType = 2
+HalfType = 5
+ByteType = 6
+StringType = 8
+
+# Property values by name, in order of creation like RV lists them
+_properties: dict[str, tuple[int, list]] = {}
+_nodes: dict[str, list[str]] = {}
+
+calls: collections.Counter[str] = collections.Counter()
+# Seconds every command call takes, imitating the call into RV
+call_cost = 0.0
+
+
+def _counted(func, name: str | None = None):
+    name = name or func.__name__
+
+    def wrapper(*args):
+        calls[name] += 1
+        if call_cost:
+            end = perf_counter() + call_cost
+            while perf_counter() < end:
+                pass
+        return func(*args)
+
+    wrapper.__name__ = name
+    return wrapper
+
+
+def reset() -> None:
+    """Remove all nodes and reset the call counts."""
+    _properties.clear()
+    _nodes.clear()
+    calls.clear()
+
+
+def add_node(node: str, properties: dict[str, str] | None = None) -> None:
+    """Add a node with string properties.
+
+    Args:
+        node: Name of the node.
+        properties: Values by property name without the node prefix,
+            e.g. ``{"media.name": "shot"}``.
+    """
+    _nodes[node] = []
+    for name, value in (properties or {}).items():
+        prop = f"{node}.{name}"
+        _properties[prop] = (StringType, [value])
+        _nodes[node].append(prop)
+
+
+@_counted
+def nodes() -> list[str]:
+    return list(_nodes)
+
+
+@_counted
+def nodeExists(node: str) -> bool:  # noqa: N802
+    return node in _nodes
+
+
+@_counted
+def deleteNode(node: str) -> None:  # noqa: N802
+    for prop in _nodes.pop(node, []):
+        _properties.pop(prop, None)
+
+
+@_counted
+def properties(node: str) -> list[str]:
+    return list(_nodes.get(node, []))
+
+
+@_counted
+def propertyExists(prop: str) -> bool:  # noqa: N802
+    return prop in _properties
+
+
+@_counted
+def deleteProperty(prop: str) -> None:  # noqa: N802
+    node = prop.split(".", 1)[0]
+    _properties.pop(prop, None)
+    if prop in _nodes.get(node, []):
+        _nodes[node].remove(prop)
+
+
+@_counted
+def propertyInfo(prop: str) -> dict:  # noqa: N802
+    return {"type": _properties[prop][0]}
+
+
+@_counted
+def newProperty(prop: str, type_: int, width: int) -> None:  # noqa: N802
+    node = prop.split(".", 1)[0]
+    _properties[prop] = (type_, [])
+    _nodes.setdefault(node, []).append(prop)
+
+
+def _setter(type_: int):
+    def set_property(prop: str, values: list, _allow_resize: bool) -> None:
+        if prop not in _properties:
+            raise RuntimeError(f"Property does not exist: {prop}")
+        _properties[prop] = (type_, list(values))
+
+    return set_property
+
+
+def _getter(type_: int):
+    def get_property(prop: str) -> list:
+        if prop not in _properties:
+            raise RuntimeError(f"Property does not exist: {prop}")
+        if _properties[prop][0] != type_:
+            raise RuntimeError(f"Property has another type: {prop}")
+        return list(_properties[prop][1])
+
+    return get_property
+
+
+setStringProperty = _counted(_setter(StringType), "setStringProperty")
+setIntProperty = _counted(_setter(IntType), "setIntProperty")
+setFloatProperty = _counted(_setter(FloatType), "setFloatProperty")
+
+getStringProperty = _counted(_getter(StringType), "getStringProperty")
+getIntProperty = _counted(_getter(IntType), "getIntProperty")
+getFloatProperty = _counted(_getter(FloatType), "getFloatProperty")
+getHalfProperty = _counted(_getter(HalfType), "getHalfProperty")
+getByteProperty = _counted(_getter(ByteType), "getByteProperty")
+
+
+def install() -> None:
+    """Register this module as ``rv.commands`` of an ``rv`` module."""
+    rv = sys.modules.get("rv")
+    if rv is None:
+        rv = types.ModuleType("rv")
+        sys.modules["rv"] = rv
+    rv.commands = sys.modules[__name__]
+    sys.modules["rv.commands"] = sys.modules[__name__]
@@ -0,0 +1,332 @@
+"""Local stand-in for RV's network interface.
+
+Speaks RV's ``TYPE LENGTH DATA`` protocol closely enough to exercise
+`ayon_openrv.networking.RVConnector` and RV-side event handlers such as
+`ayon_openrv.networking.LoadContainerHandler` without a running RV:
+
+- NEWGREETING is answered with the server's own greeting.
+- PINGPONGCONTROL turns periodic PINGs to the client on or off.
+- MESSAGE carries EVENT, RETURNEVENT and DISCONNECT. Events are dispatched
+  to handlers bound with `FakeRVServer.bind`, RETURNEVENTs are answered
+  with a RETURN holding the event's return content.
+- PING is answered with PONG.
+
+With `unix_path` the server listens on a Unix domain socket instead,
+like the event relay of `ayon_menus`.
+"""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import os
+import socket
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from ayon_openrv.protocol import (
+    RPC_EVENT,
+    FrameReader,
+    decode_rpc_request,
+    encode_frame,
+    encode_rpc_return,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class FakeEvent:
+    """Event passed to bound handlers, mimics RV's python event object."""
+
+    def __init__(self, name: str, contents: str, sender: str = "") -> None:
+        self._name = name
+        self._contents = contents
+        self._sender = sender
+        self._return_content = ""
+        self.rejected = False
+
+    def name(self) -> str:
+        return self._name
+
+    def contents(self) -> str:
+        return self._contents
+
+    def sender(self) -> str:
+        return self._sender
+
+    def returnContent(self) -> str:  # noqa: N802
+        return self._return_content
+
+    def setReturnContent(self, content: str) -> None:  # noqa: N802
+        self._return_content = content
+
+    def reject(self) -> None:
+        self.rejected = True
+
+
+class _ClientConnection:
+    """State of a single client connected to the server."""
+
+    def __init__(self, sock: socket.socket) -> None:
+        self.sock = sock
+        self.name = ""
+        self.pingpong = True
+        self._send_lock = threading.Lock()
+
+    def send(self, msg_type: str, data: str) -> None:
+        with self._send_lock:
+            self.sock.sendall(encode_frame(msg_type, data))
+
+
+class FakeRVServer:
+    """Threaded TCP server imitating RV's network listener.
+
+    Unbound RETURNEVENTs are answered by echoing their contents back, or
+    with `return_size` bytes of payload if set.
+
+    Args:
+        host: Interface to listen on.
+        port: Port to listen on, 0 picks a free one.
+        burst: Optional (count, size) of RETURN frames pushed to every
+            client right after it connects.
+        latency: Seconds spent "processing" each event before it is
+            answered, imitating RV's event handling.
+        return_size: Size of RETURN payloads of unbound RETURNEVENTs in
+            bytes, None echoes the event contents.
+        ping_interval: Seconds between PINGs sent to clients which did
+            not turn them off with PINGPONGCONTROL. None never pings.
+        name: Contact name sent in the server's greeting.
+        unix_path: Listen on a Unix domain socket at this path instead of
+            TCP `host` and `port`.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        burst: tuple[int, int] | None = None,
+        latency: float = 0.0,
+        return_size: int | None = None,
+        ping_interval: float | None = None,
+        name: str = "fake-rv",
+        unix_path: str | None = None,
+    ) -> None:
+        self.burst = burst
+        self.latency = latency
+        self.return_size = return_size
+        self.ping_interval = ping_interval
+        self.name = name
+
+        self.stats: collections.Counter[str] = collections.Counter()
+
+        self._handlers: dict[str, Callable[[FakeEvent], None]] = {
+            RPC_EVENT: self._on_rpc,
+        }
+        self._clients: list[_ClientConnection] = []
+        # Bind right away so the address is known before listening starts
+        self.unix_path = unix_path
+        if unix_path:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(unix_path)
+            self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._server.bind(unix_path)
+        else:
+            self._server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._server.setsockopt(
+                socket.SOL_SOCKET, socket.SO_REUSEADDR, 1
+            )
+            self._server.bind((host, port))
+        self._stopped = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """Host and port the server is listening on.
+
+        Not available with `unix_path`.
+        """
+        return self._server.getsockname()[:2]
+
+    def __enter__(self) -> FakeRVServer:
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def bind(self, event_name: str, handler: Callable[[FakeEvent], None]):
+        """Bind a handler to an event, like RV's `rv.commands.bind`.
+
+        Args:
+            event_name: Name of the event.
+            handler: Callable receiving a `FakeEvent`.
+        """
+        self._handlers[event_name] = handler
+
+    def start(self, delay: float = 0.0) -> None:
+        """Start accepting connections.
+
+        Args:
+            delay: Seconds to refuse connections first, imitating RV
+                which is still starting up.
+        """
+        if not delay:
+            self._server.listen()
+        thread = threading.Thread(
+            target=self._accept_loop, args=(delay,), daemon=True
+        )
+        thread.start()
+        self._threads.append(thread)
+
+    def stop(self) -> None:
+        self._stopped.set()
+        for client in list(self._clients):
+            try:
+                client.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+        try:
+            self._server.close()
+        except OSError:
+            pass
+        if self.unix_path:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self.unix_path)
+        for thread in self._threads:
+            thread.join(timeout=1.0)
+
+    def send_message(self, data: str) -> None:
+        """Send a MESSAGE to all connected clients."""
+        for client in list(self._clients):
+            try:
+                client.send("MESSAGE", data)
+            except OSError:
+                pass
+
+    def dispatch(self, event_name: str, contents: str, sender: str = ""):
+        """Dispatch an event to its bound handler.
+
+        Args:
+            event_name: Name of the event.
+            contents: Contents of the event.
+            sender: Name of the sender.
+
+        Returns:
+            The return content set by the handler.
+        """
+        self.stats[f"event:{event_name}"] += 1
+        handler = self._handlers.get(event_name)
+        if handler is None:
+            if self.return_size is not None:
+                return "x" * self.return_size
+            return contents
+
+        event = FakeEvent(event_name, contents, sender)
+        handler(event)
+        return event.returnContent()
+
+    def _on_rpc(self, event: FakeEvent) -> None:
+        request_id, event_name, contents = decode_rpc_request(
+            event.contents()
+        )
+        result = self.dispatch(event_name, contents, RPC_EVENT)
+        event.setReturnContent(encode_rpc_return(request_id, result))
+
+    def _accept_loop(self, delay: float) -> None:
+        if delay:
+            if self._stopped.wait(delay):
+                return
+            try:
+                self._server.listen()
+            except OSError:
+                return
+
+        while not self._stopped.is_set():
+            try:
+                sock, _ = self._server.accept()
+            except OSError:
+                return
+            self.stats["connections"] += 1
+            thread = threading.Thread(
+                target=self._serve, args=(sock,), daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def _serve(self, sock: socket.socket) -> None:
+        reader = FrameReader()
+        if not self.unix_path:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        client = _ClientConnection(sock)
+        self._clients.append(client)
+        if self.ping_interval:
+            threading.Thread(
+                target=self._ping_loop, args=(client,), daemon=True
+            ).start()
+
+        with sock:
+            try:
+                if self.burst:
+                    count, size = self.burst
+                    frame = encode_frame("RETURN", "x" * size)
+                    sock.sendall(frame * count)
+
+                while not self._stopped.is_set():
+                    if not reader.fill(sock):
+                        break
+                    frame = reader.next_frame()
+                    while frame is not None:
+                        if not self._handle_frame(client, *frame):
+                            return
+                        frame = reader.next_frame()
+            except (OSError, ValueError):
+                pass
+            finally:
+                self._clients.remove(client)
+
+    def _ping_loop(self, client: _ClientConnection) -> None:
+        while not self._stopped.wait(self.ping_interval):
+            if client not in self._clients:
+                return
+            if not client.pingpong:
+                continue
+            try:
+                client.send("PING", "p")
+            except OSError:
+                return
+
+    def _handle_frame(
+        self, client: _ClientConnection, msg_type: str, data: str
+    ) -> bool:
+        """React on a frame sent by the client.
+
+        Returns:
+            False if the connection should be closed.
+        """
+        self.stats[f"frame:{msg_type}"] += 1
+        if msg_type == "NEWGREETING":
+            client.name = data.split(" ", 1)[0]
+            client.send("NEWGREETING", f"{self.name} rv")
+
+        elif msg_type == "PINGPONGCONTROL":
+            client.pingpong = data != "0"
+
+        elif msg_type == "PING":
+            client.send("PONG", "p")
+
+        elif msg_type == "MESSAGE":
+            if data == "DISCONNECT":
+                return False
+
+            kind, _, rest = data.partition(" ")
+            if kind in {"EVENT", "RETURNEVENT"}:
+                # <kind> <event name> <target> <contents>
+                event_name, _, contents = rest.split(" ", 2)
+                if self.latency:
+                    time.sleep(self.latency)
+                result = self.dispatch(event_name, contents, client.name)
+                if kind == "RETURNEVENT":
+                    client.send("RETURN", result)
+        return True